@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Build the local fast-path intent model from logged Gemini intents.
+
+IntentAnalyzer appends every LLM-classified utterance to
+logs/intents/intent_log.jsonl; this script turns that log into the token
+model FastIntentClassifier loads from data/intent_model.json.
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Ensure src is importable when running from repo root
+THIS_FILE = Path(__file__).resolve()
+REPO_ROOT = THIS_FILE.parents[1]
+if str(REPO_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+from leadership_button.fast_intent import DEFAULT_MODEL_PATH, build_intent_model
+
+
+def _read_records(paths):
+    for path in paths:
+        with Path(path).open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the fast-path intent model from logged intents."
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        nargs="+",
+        default=[str(REPO_ROOT / "logs" / "intents" / "intent_log.jsonl")],
+        help="Intent log JSONL file(s) (default: logs/intents/intent_log.jsonl)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=DEFAULT_MODEL_PATH,
+        help="Model output path (default: data/intent_model.json)",
+    )
+    args = parser.parse_args()
+
+    model = build_intent_model(_read_records(args.input))
+    if not model["documents"]:
+        print("No usable intent records found")
+        return 1
+
+    out = Path(args.output)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(model, ensure_ascii=False), encoding="utf-8")
+    counts = ", ".join(
+        f"{req}={len(params['log_probs'])} tokens"
+        for req, params in model["requests"].items()
+    )
+    print(f"Wrote {out} from {model['documents']} intents ({counts})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
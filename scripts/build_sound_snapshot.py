@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compile the sound library CSV into its binary snapshot.
+
+SoundSuggester and the SSML audio src index load the snapshot instead of
+parsing soundlibrary.csv. They recompile a stale snapshot on first use, but
+running this after regenerating the CSV (or before deploying to the Pi)
+keeps that work off the device's startup path.
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+# Ensure src is importable when running from repo root
+THIS_FILE = Path(__file__).resolve()
+REPO_ROOT = THIS_FILE.parents[1]
+if str(REPO_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+from leadership_button.sound_index import DEFAULT_CSV_PATH
+from leadership_button.sound_library import (
+    SoundLibrary,
+    compile_snapshot,
+    default_snapshot_path,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile soundlibrary.csv into a memory-mappable snapshot."
+    )
+    parser.add_argument(
+        "csv_path",
+        nargs="?",
+        default=DEFAULT_CSV_PATH,
+        help=f"Sound library CSV (default: {DEFAULT_CSV_PATH})",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Snapshot path (default: next to the CSV with a .snapshot suffix)",
+    )
+    args = parser.parse_args()
+
+    if not Path(args.csv_path).is_file():
+        print(f"CSV not found: {args.csv_path}", file=sys.stderr)
+        return 1
+
+    output = Path(args.output or default_snapshot_path(args.csv_path))
+    library = compile_snapshot(args.csv_path, str(output))
+
+    start = time.perf_counter()
+    reloaded = SoundLibrary.open(output)
+    reloaded.rows()
+    load_ms = (time.perf_counter() - start) * 1000.0
+
+    print(
+        f"✅ Compiled {len(library)} rows ({output.stat().st_size / 1e6:.1f} MB) "
+        f"into {output}; reload + rows in {load_ms:.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
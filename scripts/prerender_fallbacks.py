@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pre-render every fallback response into the on-disk audio bank.
+
+APIManager renders missing entries in the background at startup; run this
+as a build step (e.g. before deploying to the Pi) so error responses play
+instantly and offline from the very first button press.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Ensure src is importable when running from repo root
+THIS_FILE = Path(__file__).resolve()
+REPO_ROOT = THIS_FILE.parents[1]
+if str(REPO_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+from leadership_button.api_client import APIManager, APIConfig
+from leadership_button.fallback_audio import FallbackAudioBank, voice_signature
+from leadership_button.prompts_config import PromptsConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-render fallback responses with the configured TTS voice."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Bank directory (default: performance.fallback_audio_dir or data/fallback_audio)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render entries even if the bank already has them",
+    )
+    args = parser.parse_args()
+
+    cfg = APIConfig()
+    cfg.performance["prerender_fallbacks"] = False
+    mgr = APIManager(cfg)
+    if not mgr.tts_client:
+        print("TTS client unavailable; check Google Cloud credentials", file=sys.stderr)
+        return 1
+
+    sample_rate = cfg.audio_settings["output_sample_rate"]
+    bank = FallbackAudioBank(
+        synthesize=mgr.text_to_speech,
+        responses=PromptsConfig.FALLBACK_RESPONSES,
+        signature=voice_signature(cfg.get_tts_config(), sample_rate),
+        sample_rate=sample_rate,
+        channels=cfg.audio_settings["channels"],
+        bank_dir=args.output or cfg.performance.get("fallback_audio_dir"),
+    )
+    if not args.force:
+        bank.load()
+    rendered = bank.render_missing()
+    missing = bank.missing()
+
+    print(f"✅ Rendered {rendered} fallback responses into {bank.bank_dir}")
+    if missing:
+        print(f"❌ Failed to render: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
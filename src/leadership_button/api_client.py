@@ -9,14 +9,16 @@ import json
 import logging
 import os
 import time
-import signal
+import threading
 from contextlib import contextmanager
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Iterator
 from enum import Enum
 from pathlib import Path
 import re
 import html
-import xml.etree.ElementTree as ET
+
+from .deadline import Deadline, DeadlineExceeded, run_with_deadline
+from .metrics import metrics
 
 # Google Cloud dependencies
 try:
@@ -61,6 +63,11 @@ class APIState(Enum):
     OFFLINE = "offline"
 
 
+def _rpc_timeout(timeout: Optional[float]) -> dict:
+    """GAPIC call kwargs for an optional per-request timeout."""
+    return {"timeout": timeout} if timeout is not None else {}
+
+
 class APIConfig:
     """Configuration class for Google Cloud API settings"""
 
@@ -266,7 +273,7 @@ class Voice:
 class SpeechClient:
     """Google Cloud Speech-to-Text API client"""
 
-    def __init__(self, config: APIConfig):
+    def __init__(self, config: APIConfig, channel_manager: Optional[Any] = None):
         self.config = config
         self.client = None
         self.state = APIState.INITIALIZING
@@ -277,15 +284,26 @@ class SpeechClient:
             return
 
         try:
-            self.client = speech.SpeechClient()
+            if channel_manager is not None:
+                self.client = channel_manager.create_client(
+                    "speech", speech.SpeechClient
+                )
+            else:
+                self.client = speech.SpeechClient()
             self.state = APIState.READY
             logging.info("Speech-to-Text client initialized successfully")
         except Exception as e:
             logging.error(f"Failed to initialize Speech-to-Text client: {e}")
             self.state = APIState.ERROR
 
-    def transcribe_audio(self, audio_data) -> Optional[TranscriptionResult]:
-        """Convert audio data to text"""
+    @metrics.timed("stt")
+    def transcribe_audio(
+        self, audio_data, timeout: Optional[float] = None
+    ) -> Optional[TranscriptionResult]:
+        """Convert audio data to text
+
+        timeout bounds the recognize RPC (seconds); None keeps the API default.
+        """
         if self.state not in [APIState.READY, APIState.AI_ONLY]:
             logging.error(f"Cannot transcribe audio in state: {self.state}")
             return None
@@ -312,24 +330,19 @@ class SpeechClient:
             # Prepare audio for API
             audio = self._prepare_audio_for_api(audio_data)
 
-            # Configure recognition
+            # Configure recognition (matching a compressed upload, if any)
             speech_config = self.config.get_speech_config()
-            config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=speech_config["sample_rate_hertz"],
-                language_code=speech_config["language_code"],
-                model=speech_config["model"],
-                enable_automatic_punctuation=speech_config[
-                    "enable_automatic_punctuation"
-                ],
-                max_alternatives=speech_config["max_alternatives"],
+            config = self._build_recognition_config(
+                speech_config, encoded=self._encoded_audio(audio_data)
             )
 
             logging.info(f"Speech config: {speech_config}")
 
             # Perform recognition
             logging.info("Calling Google Cloud Speech API...")
-            response = self.client.recognize(config=config, audio=audio)
+            response = self.client.recognize(
+                config=config, audio=audio, **_rpc_timeout(timeout)
+            )
 
             logging.info(
                 f"API response received: {len(response.results) if response.results else 0} results"
@@ -387,14 +400,79 @@ class SpeechClient:
         finally:
             self.state = APIState.READY
 
+    def _build_recognition_config(self, speech_config: dict, encoded=None):
+        """Build the RecognitionConfig shared by batch and streaming recognition
+
+        encoded (an EncodedAudio) selects its encoding and sample rate;
+        otherwise the audio is LINEAR16 at the configured rate.
+        """
+        if encoded is not None:
+            encoding = speech.RecognitionConfig.AudioEncoding[encoded.encoding]
+            sample_rate = encoded.sample_rate
+        else:
+            encoding = speech.RecognitionConfig.AudioEncoding.LINEAR16
+            sample_rate = speech_config["sample_rate_hertz"]
+        return speech.RecognitionConfig(
+            encoding=encoding,
+            sample_rate_hertz=sample_rate,
+            language_code=speech_config["language_code"],
+            model=speech_config["model"],
+            enable_automatic_punctuation=speech_config["enable_automatic_punctuation"],
+            max_alternatives=speech_config["max_alternatives"],
+        )
+
+    def start_streaming(self):
+        """Open a streaming recognition session fed chunk-by-chunk while recording.
+
+        Returns a GoogleStreamingRecognizer, or None if the client is unavailable.
+        """
+        if self.state not in [APIState.READY, APIState.AI_ONLY] or not self.client:
+            logging.warning(
+                f"Cannot start streaming recognition in state: {self.state}"
+            )
+            return None
+
+        from .speech_stream import GoogleStreamingRecognizer
+
+        speech_config = self.config.get_speech_config()
+        try:
+            recognizer = GoogleStreamingRecognizer(
+                self.client,
+                self._build_recognition_config(speech_config),
+                language_code=speech_config["language_code"],
+                timeout=self.config.timeout_seconds,
+                finish_timeout=speech_config.get("streaming_finish_timeout", 3.0),
+            )
+        except Exception as e:
+            logging.error(f"Failed to start streaming recognition: {e}")
+            return None
+        logging.info("🎙️ Streaming recognition session started")
+        return recognizer
+
+    @staticmethod
+    def _encoded_audio(audio_data):
+        """The EncodedAudio to upload for audio_data, or None for LINEAR16"""
+        from .audio_encoder import EncodedAudio
+
+        if isinstance(audio_data, EncodedAudio):
+            return audio_data
+        encoded = getattr(audio_data, "encoded", None)
+        return encoded if isinstance(encoded, EncodedAudio) else None
+
     def _prepare_audio_for_api(self, audio_data) -> speech.RecognitionAudio:
         """Prepare audio data for Google Cloud Speech API"""
         try:
+            encoded = self._encoded_audio(audio_data)
             # Convert AudioData to bytes if needed
-            if hasattr(audio_data, "data"):
+            if encoded is not None:
+                audio_bytes = encoded.content
+            elif hasattr(audio_data, "data"):
                 audio_bytes = audio_data.data
             else:
                 audio_bytes = audio_data
+            # Recordings arrive as memoryviews; protobuf wants bytes
+            if not isinstance(audio_bytes, bytes):
+                audio_bytes = bytes(audio_bytes)
 
             return speech.RecognitionAudio(content=audio_bytes)
         except Exception as e:
@@ -429,10 +507,13 @@ class SpeechClient:
 class TTSClient:
     """Google Cloud Text-to-Speech API client"""
 
-    def __init__(self, config: APIConfig):
+    def __init__(self, config: APIConfig, channel_manager: Optional[Any] = None):
         self.config = config
         self.client = None
         self.state = APIState.INITIALIZING
+        self._inflight = 0
+        self._inflight_lock = threading.Lock()
+        self.cache = self._create_cache()
 
         if not GOOGLE_CLOUD_AVAILABLE:
             logging.error("Google Cloud TTS library not available")
@@ -440,35 +521,123 @@ class TTSClient:
             return
 
         try:
-            self.client = texttospeech.TextToSpeechClient()
+            if channel_manager is not None:
+                self.client = channel_manager.create_client(
+                    "tts", texttospeech.TextToSpeechClient
+                )
+            else:
+                self.client = texttospeech.TextToSpeechClient()
             self.state = APIState.READY
             logging.info("Text-to-Speech client initialized successfully")
         except Exception as e:
             logging.error(f"Failed to initialize Text-to-Speech client: {e}")
             self.state = APIState.ERROR
 
+    def _begin_request(self) -> bool:
+        """Mark a synthesis request as in flight; False if the client is unusable.
+
+        Concurrent requests are allowed (the segment pipeline synthesizes several
+        sentences at once), so PROCESSING_TTS is accepted as well as READY.
+        """
+        with self._inflight_lock:
+            if self.state not in (APIState.READY, APIState.PROCESSING_TTS):
+                return False
+            self._inflight += 1
+            self.state = APIState.PROCESSING_TTS
+            return True
+
+    def _end_request(self) -> None:
+        """Release an in-flight request; return to READY when none remain."""
+        with self._inflight_lock:
+            self._inflight = max(0, self._inflight - 1)
+            self.state = APIState.PROCESSING_TTS if self._inflight else APIState.READY
+
+    def _create_cache(self):
+        """Build the on-disk TTS cache when performance.cache_tts_responses is set."""
+        performance = self.config.performance
+        if not performance.get("cache_tts_responses", False):
+            return None
+        try:
+            from .tts_cache import TTSCache
+
+            return TTSCache(
+                cache_dir=performance.get("tts_cache_dir"),
+                max_memory_bytes=int(
+                    performance.get("tts_cache_memory_mb", 16) * 1024 * 1024
+                ),
+                max_disk_bytes=int(
+                    performance.get("tts_cache_disk_mb", 256) * 1024 * 1024
+                ),
+            )
+        except Exception as e:
+            logging.warning(f"TTS cache disabled: {e}")
+            return None
+
+    def _default_voice_config(self) -> VoiceConfig:
+        tts_config = self.config.get_tts_config()
+        voice_config = VoiceConfig(
+            name=tts_config["voice_name"],
+            language_code=tts_config["language_code"],
+        )
+        voice_config.speaking_rate = tts_config["speaking_rate"]
+        voice_config.pitch = tts_config["pitch"]
+        voice_config.volume_gain_db = tts_config["volume_gain_db"]
+        return voice_config
+
+    def _cache_key(
+        self, kind: str, content: str, voice_config: VoiceConfig
+    ) -> Optional[str]:
+        if self.cache is None:
+            return None
+        from .tts_cache import make_cache_key
+
+        return make_cache_key(
+            kind,
+            content,
+            voice_config.name,
+            voice_config.language_code,
+            voice_config.speaking_rate,
+            voice_config.pitch,
+            voice_config.volume_gain_db,
+            self.config.audio_settings["output_sample_rate"],
+        )
+
+    def _cached_audio(self, cache_key: Optional[str]) -> Optional[Any]:
+        """Return cached AudioData for cache_key without touching the network."""
+        if cache_key is None:
+            return None
+        payload = self.cache.get(cache_key)
+        if payload is None:
+            return None
+        logging.info(f"🗃️ TTS cache hit ({cache_key[:12]}, {len(payload)} bytes)")
+        return self._convert_api_audio_to_audiodata(payload)
+
+    def _store_cached_audio(self, cache_key: Optional[str], payload: bytes) -> None:
+        if cache_key is not None and isinstance(payload, (bytes, bytearray)):
+            self.cache.put(cache_key, payload)
+
+    @metrics.timed("tts")
     def synthesize_text(
-        self, text: str, voice_config: Optional[VoiceConfig] = None
+        self,
+        text: str,
+        voice_config: Optional[VoiceConfig] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Any]:
         """Convert plain text to audio (non-SSML)."""
-        if self.state != APIState.READY:
+        # Use default voice config if not provided
+        if voice_config is None:
+            voice_config = self._default_voice_config()
+
+        cache_key = self._cache_key("text", text, voice_config)
+        cached = self._cached_audio(cache_key)
+        if cached is not None:
+            return cached
+
+        if not self._begin_request():
             logging.error(f"Cannot synthesize text in state: {self.state}")
             return None
 
         try:
-            self.state = APIState.PROCESSING_TTS
-
-            # Use default voice config if not provided
-            if voice_config is None:
-                tts_config = self.config.get_tts_config()
-                voice_config = VoiceConfig(
-                    name=tts_config["voice_name"],
-                    language_code=tts_config["language_code"],
-                )
-                voice_config.speaking_rate = tts_config["speaking_rate"]
-                voice_config.pitch = tts_config["pitch"]
-                voice_config.volume_gain_db = tts_config["volume_gain_db"]
-
             # Prepare synthesis request (plain text)
             synthesis_input = texttospeech.SynthesisInput(text=text)
 
@@ -595,12 +764,16 @@ class TTSClient:
 
             # Perform synthesis
             response = self.client.synthesize_speech(
-                input=synthesis_input, voice=voice, audio_config=audio_config
+                input=synthesis_input,
+                voice=voice,
+                audio_config=audio_config,
+                **_rpc_timeout(timeout),
             )
             print("After response ---------------------------------")
 
             # Convert to AudioData
             audio_data = self._convert_api_audio_to_audiodata(response.audio_content)
+            self._store_cached_audio(cache_key, response.audio_content)
 
             # Persist generated audio for later review
             try:
@@ -631,43 +804,46 @@ class TTSClient:
             self._handle_api_error(e)
             return None
         finally:
-            self.state = APIState.READY
+            self._end_request()
 
+    @metrics.timed("tts")
     def synthesize_ssml(
-        self, ssml: str, voice_config: Optional[VoiceConfig] = None
+        self,
+        ssml: str,
+        voice_config: Optional[VoiceConfig] = None,
+        timeout: Optional[float] = None,
+        validated: bool = False,
     ) -> Optional[Any]:
         """Convert SSML to audio.
 
-        Expects a valid SSML document enclosed in <speak>...</speak>.
+        Expects a valid SSML document enclosed in <speak>...</speak>. Pass
+        validated=True when the document already went through SSMLEngine
+        (as APIManager.text_to_speech_ssml does) to skip the validation walk.
         """
-        if self.state != APIState.READY:
+        # Use default voice config if not provided
+        if voice_config is None:
+            voice_config = self._default_voice_config()
+
+        cache_key = self._cache_key("ssml", ssml, voice_config)
+        cached = self._cached_audio(cache_key)
+        if cached is not None:
+            return cached
+
+        if not self._begin_request():
             logging.error(f"Cannot synthesize SSML in state: {self.state}")
             return None
 
         try:
-            self.state = APIState.PROCESSING_TTS
+            # Validate SSML (well-formed, <speak> root), dropping <s> tags
+            # first to avoid malformed sentence nesting
+            if not validated:
+                from .ssml_engine import SSMLEngine
 
-            # Use default voice config if not provided
-            if voice_config is None:
-                tts_config = self.config.get_tts_config()
-                voice_config = VoiceConfig(
-                    name=tts_config["voice_name"],
-                    language_code=tts_config["language_code"],
-                )
-                voice_config.speaking_rate = tts_config["speaking_rate"]
-                voice_config.pitch = tts_config["pitch"]
-                voice_config.volume_gain_db = tts_config["volume_gain_db"]
-
-            # Validate SSML (parse and require <speak> root)
-            try:
-                # Strip <s> tags prior to XML validation to avoid malformed sentence nesting
-                ssml = re.sub(r"</?s\\b[^>]*>", "", ssml)
-                root = ET.fromstring(ssml)
-                if root.tag.lower() != "speak":
-                    raise ValueError("SSML must have <speak> as the root element")
-            except Exception as exc:
-                logging.error("Invalid SSML provided: %s", exc)
-                raise
+                result = SSMLEngine(["strip_sentences"]).transform(ssml)
+                if not result.valid:
+                    logging.error("Invalid SSML provided: %s", result.errors)
+                    result.raise_for_errors()
+                ssml = result.ssml
 
             # Prepare synthesis request (SSML)
 
@@ -744,9 +920,13 @@ class TTSClient:
             # Debug SSML already printed above; avoid duplicate noisy logs
 
             response = self.client.synthesize_speech(
-                input=synthesis_input, voice=voice, audio_config=audio_config
+                input=synthesis_input,
+                voice=voice,
+                audio_config=audio_config,
+                **_rpc_timeout(timeout),
             )
             audio_data = self._convert_api_audio_to_audiodata(response.audio_content)
+            self._store_cached_audio(cache_key, response.audio_content)
 
             # Persist generated SSML audio for later review
             try:
@@ -774,7 +954,7 @@ class TTSClient:
             self._handle_api_error(e)
             return None
         finally:
-            self.state = APIState.READY
+            self._end_request()
 
     def _convert_api_audio_to_audiodata(self, api_response: bytes):
         """Convert API audio response to AudioData object"""
@@ -841,6 +1021,13 @@ class AIProvider:
         """Process text and return AI response"""
         raise NotImplementedError("AIProvider must be implemented by subclass")
 
+    def stream_text(self, text: str, context: dict) -> Iterator[str]:
+        """Yield the AI response in chunks as it is generated.
+
+        Providers without native streaming yield the full response once.
+        """
+        yield self.process_text(text, context)
+
     def get_provider_name(self) -> str:
         """Get provider name"""
         return "base_provider"
@@ -853,6 +1040,10 @@ class AIProvider:
         """Configure provider settings"""
         pass
 
+    def cleanup(self) -> None:
+        """Release provider resources (threads, connections)"""
+        pass
+
 
 class APIManager:
     """Manages API connections and conversation flow"""
@@ -863,6 +1054,10 @@ class APIManager:
         self.tts_client: Optional[TTSClient] = None
         self.ai_provider: Optional[Any] = None
         self.state = APIState.INITIALIZING
+        self._tts_pipeline = None
+        self._streaming_recognizer_factory = None
+        self.fallback_bank = None
+        self.channel_manager = None
 
         # Initialize centralized audio configuration with API config data
         from .audio_handler import audio_config_manager
@@ -872,6 +1067,7 @@ class APIManager:
 
         # Initialize API clients in background
         self._initialize_background()
+        self._start_fallback_bank()
 
     def _initialize_background(self) -> None:
         """Initialize Speech and TTS clients with non-blocking timeouts"""
@@ -887,24 +1083,41 @@ class APIManager:
             logging.info("API Manager initialized in AI-only mode")
             return
 
+        # Speech and TTS share persistent, keepalive-enabled gRPC channels
+        if self.config.performance.get("persistent_channels", False):
+            from .channel_manager import ChannelManager
+
+            self.channel_manager = ChannelManager.from_config(self.config.performance)
+
         # Try to initialize Speech client with timeout
         try:
-            with self._timeout(5, "Speech-to-Text client initialization"):
-                self.speech_client = SpeechClient(self.config)
-                speech_available = self.speech_client.state == APIState.READY
+            self.speech_client = run_with_deadline(
+                SpeechClient,
+                Deadline(5, "Speech-to-Text client initialization"),
+                self.config,
+                channel_manager=self.channel_manager,
+            )
+            speech_available = self.speech_client.state == APIState.READY
         except (TimeoutError, Exception) as e:
             logging.warning(f"Speech client initialization failed/timed out: {e}")
             self.speech_client = None
 
         # Try to initialize TTS client with timeout
         try:
-            with self._timeout(5, "Text-to-Speech client initialization"):
-                self.tts_client = TTSClient(self.config)
-                tts_available = self.tts_client.state == APIState.READY
+            self.tts_client = run_with_deadline(
+                TTSClient,
+                Deadline(5, "Text-to-Speech client initialization"),
+                self.config,
+                channel_manager=self.channel_manager,
+            )
+            tts_available = self.tts_client.state == APIState.READY
         except (TimeoutError, Exception) as e:
             logging.warning(f"TTS client initialization failed/timed out: {e}")
             self.tts_client = None
 
+        if self.channel_manager is not None:
+            self.channel_manager.start_keepalive()
+
         # Determine final state based on what's available
         if speech_available and tts_available:
             self.state = APIState.READY
@@ -925,39 +1138,97 @@ class APIManager:
                 "API Manager initialized in AI-only mode (Speech/TTS unavailable)"
             )
 
-    @contextmanager
-    def _timeout(self, seconds: int, operation_name: str):
-        """Context manager for timeout operations"""
+    def _start_fallback_bank(self) -> None:
+        """Load pre-rendered fallback audio and render any missing entries."""
+        if not self.config.performance.get("prerender_fallbacks", False):
+            return
+        try:
+            from .fallback_audio import FallbackAudioBank, voice_signature
+            from .prompts_config import PromptsConfig
 
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"{operation_name} timed out after {seconds} seconds")
+            sample_rate = self.config.audio_settings["output_sample_rate"]
+            self.fallback_bank = FallbackAudioBank(
+                synthesize=self.text_to_speech,
+                responses=PromptsConfig.FALLBACK_RESPONSES,
+                signature=voice_signature(self.config.get_tts_config(), sample_rate),
+                sample_rate=sample_rate,
+                channels=self.config.audio_settings["channels"],
+                bank_dir=self.config.performance.get("fallback_audio_dir"),
+            )
+            # Without a TTS client the bank still serves what is on disk
+            self.fallback_bank.start(render=self.tts_client is not None)
+        except Exception as e:
+            logging.warning(f"Fallback audio bank unavailable: {e}")
+            self.fallback_bank = None
 
-        # Set up the timeout
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(seconds)
+    def prewarm_connections(self) -> None:
+        """Start reconnecting Speech/TTS channels ahead of the next request."""
+        if self.channel_manager is not None:
+            self.channel_manager.prewarm()
+
+    def get_fallback_audio(self, response_type: str) -> Optional[Any]:
+        """Return audio for a fallback response, pre-rendered when possible.
+
+        Falls back to live synthesis only if the bank has no entry yet.
+        """
+        if self.fallback_bank is not None:
+            audio = self.fallback_bank.get(response_type)
+            if audio is not None:
+                logging.info(f"🛟 Using pre-rendered fallback audio: {response_type}")
+                return audio
+
+        from .prompts_config import PromptsConfig
 
         try:
-            yield
-        finally:
-            # Clean up
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
+            return self.text_to_speech(
+                PromptsConfig.get_fallback_response(response_type)
+            )
+        except Exception as e:
+            logging.error(f"Live fallback synthesis failed ({response_type}): {e}")
+            return None
+
+    @contextmanager
+    def _timeout(self, seconds: float, operation_name: str):
+        """Context manager for timeout operations
+
+        Thread-safe and sub-second: yields a Deadline the block can check or
+        pass on, and raises DeadlineExceeded (a TimeoutError) if the block
+        overruns. The block itself is not interrupted; use run_with_deadline
+        for calls that must be abandoned.
+        """
+        deadline = Deadline(seconds, operation_name)
+        yield deadline
+        deadline.check()
+
+    def _turn_deadline(self) -> Deadline:
+        """Deadline for one conversation turn using performance.stage_budgets."""
+        return Deadline.for_turn(self.config.performance.get("stage_budgets"))
 
     def initialize(self) -> bool:
         """Initialize the API manager"""
         return self.state == APIState.READY
 
-    def speech_to_text(self, audio_data) -> Optional[str]:
+    def speech_to_text(
+        self, audio_data, deadline: Optional[Deadline] = None
+    ) -> Optional[str]:
         """Convert audio to text"""
         if not self.speech_client:
             error_msg = "❌ Speech-to-Text service unavailable: Missing Google Cloud credentials\nPlease set up GOOGLE_APPLICATION_CREDENTIALS environment variable\nSee: https://cloud.google.com/docs/authentication/external/set-up-adc"
             logging.error("Speech client not initialized")
             raise RuntimeError(error_msg)
 
-        result = self.speech_client.transcribe_audio(audio_data)
+        if deadline is None:
+            result = self.speech_client.transcribe_audio(audio_data)
+        else:
+            deadline.check("Speech-to-Text")
+            result = self.speech_client.transcribe_audio(
+                audio_data, timeout=deadline.timeout()
+            )
         return result.text if result else None
 
-    def text_to_speech(self, text: str) -> Optional[Any]:
+    def text_to_speech(
+        self, text: str, deadline: Optional[Deadline] = None
+    ) -> Optional[Any]:
         """Convert text (plain) to audio."""
         if not self.tts_client:
             error_msg = "❌ Text-to-Speech service unavailable: Missing Google Cloud credentials\nPlease set up GOOGLE_APPLICATION_CREDENTIALS environment variable\nSee: https://cloud.google.com/docs/authentication/external/set-up-adc"
@@ -973,39 +1244,29 @@ class APIManager:
                 f"🧹 TTS TEXT SANITIZED: '{text[:50]}...' → '{sanitized_text[:50]}...'"
             )
 
-        return self.tts_client.synthesize_text(sanitized_text)
+        if deadline is None:
+            return self.tts_client.synthesize_text(sanitized_text)
+        deadline.check("Text-to-Speech")
+        return self.tts_client.synthesize_text(
+            sanitized_text, timeout=deadline.timeout()
+        )
 
-    def text_to_speech_ssml(self, ssml: str) -> Optional[Any]:
+    def text_to_speech_ssml(
+        self, ssml: str, deadline: Optional[Deadline] = None
+    ) -> Optional[Any]:
         """Convert SSML to audio, with minimal validation/sanitization."""
         if not self.tts_client:
             error_msg = "❌ Text-to-Speech service unavailable: Missing Google Cloud credentials\nPlease set up GOOGLE_APPLICATION_CREDENTIALS environment variable\nSee: https://cloud.google.com/docs/authentication/external/set-up-adc"
             logging.error("TTS client not initialized")
             raise RuntimeError(error_msg)
 
-        # Light cleanup of SSML whitespace
-        cleaned = re.sub(r"\s+", " ", ssml).strip()
-
-        # Normalize <audio> tags that contain inner text
-        cleaned = self._normalize_audio_tag_inner_text(cleaned)
-
-        # Normalize/resolve audio src values (also strips leading '@' and trims)
-        try:
-            cleaned = self._rewrite_ssml_audio_srcs(cleaned)
-        except Exception:
-            pass
-
-        # Whitelist enforcement removed per user request
-
-        # Music clip auto-enforcement removed per user request
-
-        # Cap overly long breaks to 2s to reduce total output length
-        cleaned = self._cap_long_breaks(cleaned, max_seconds=2.0)
-
-        # Normalize/remove <s> sentence tags which frequently cause malformed SSML from LLMs
-        try:
-            cleaned = re.sub(r"</?s\\b[^>]*>", "", cleaned)
-        except Exception:
-            pass
+        # One pass: collapse whitespace, move text out of <audio>, resolve
+        # audio srcs, cap long breaks, drop <s> tags, and validate
+        with metrics.span("ssml_rewrite"):
+            result = self._get_ssml_engine().transform(ssml)
+        cleaned = result.ssml
+        if not result.valid:
+            logging.warning("SSML failed validation: %s", "; ".join(result.errors))
 
         # Log the exact SSML that will be sent to Google TTS — immediately before the API call
         try:
@@ -1022,183 +1283,57 @@ class APIManager:
             pass
 
         # Final call with cleaned SSML
-        return self.tts_client.synthesize_ssml(cleaned)
+        if deadline is None:
+            return self.tts_client.synthesize_ssml(cleaned, validated=result.valid)
+        deadline.check("Text-to-Speech")
+        return self.tts_client.synthesize_ssml(
+            cleaned, timeout=deadline.timeout(), validated=result.valid
+        )
+
+    def _get_ssml_engine(self):
+        """Lazily build the SSML rewrite chain used before every TTS call."""
+        if getattr(self, "_ssml_engine", None) is None:
+            from .ssml_engine import SSMLEngine
+
+            self._ssml_engine = SSMLEngine(
+                [
+                    "collapse_whitespace",
+                    "audio_inner_text",
+                    ("audio_src", {"resolve": self._resolve_sound_src}),
+                    ("cap_breaks", {"max_seconds": 2.0}),
+                    "strip_sentences",
+                ]
+            )
+        return self._ssml_engine
 
     def _rewrite_ssml_audio_srcs(self, ssml: str) -> str:
         """Replace <audio src="..."/> tokens with Google Cloud Storage URLs.
 
-        - Accepts tokens like `feeling_paper`, `feeling_paper.ogg`, or human titles
-        - Matches against the sound library CSV by filename stem, kit_title, or tags
-        - Uses CSV `google_cloud_url` if present, otherwise derives from `source_directory`
-        - Logs each mapping with original token and resolved URL
+        text_to_speech_ssml already does this as part of its single SSML
+        pass; this runs only the src rule for callers that need it alone.
         """
-        import csv as _csv
-        from pathlib import Path as _P
-
-        def _norm(s: str) -> str:
-            s = (s or "").strip().lower()
-            s = re.sub(r"\.[a-z0-9]+$", "", s)  # drop extension
-            s = s.replace("-", "_").replace(" ", "_")
-            s = re.sub(r"[^a-z0-9_]+", "_", s)
-            s = re.sub(r"_+", "_", s).strip("_")
-            return s
-
-        # Build index once per APIManager instance
-        if not hasattr(self, "_sound_url_index"):
-            csv_path = _P("helpers/soundscripts/data/soundlibrary.csv")
-            index: dict[str, dict] = {}
-            if csv_path.exists():
-                try:
-                    with csv_path.open("r", encoding="utf-8") as f:
-                        r = _csv.DictReader(f)
-                        for row in r:
-                            filename = (row.get("filename") or "").strip()
-                            gcs = (row.get("google_cloud_url") or "").strip()
-                            src_dir = (
-                                (row.get("source_directory") or "").strip().lower()
-                            )
-                            # Derive from file_path if no URL provided, following cw{ext}/{rel_path_after_public_sounds}
-                            if not gcs and filename:
-                                from urllib.parse import quote
-
-                                file_path = (row.get("file_path") or "").strip()
-                                rel_path = ""
-                                if file_path:
-                                    # Normalize separators
-                                    p = file_path.replace("\\", "/")
-                                    anchor = "/public/sounds/"
-                                    idx = p.lower().find(anchor)
-                                    if idx != -1:
-                                        rel_path = p[idx + len(anchor) :]
-                                if not rel_path:
-                                    # Fallback to filename only
-                                    rel_path = filename
-                                safe_rel = quote(rel_path, safe="/")
-                                gcs = f"https://storage.googleapis.com/cwsounds/{safe_rel}"
-                            keys: set[str] = set()
-                            if filename:
-                                keys.add(_norm(filename))
-                            title = (row.get("kit_title") or "").strip()
-                            if title:
-                                keys.add(_norm(title))
-                            tags = (row.get("kit_tags") or "").strip()
-                            if tags:
-                                for t in tags.split(","):
-                                    t = t.strip()
-                                    if t:
-                                        keys.add(_norm(t))
-                            for k in keys:
-                                if k and k not in index:
-                                    index[k] = {
-                                        "url": gcs,
-                                        "filename": filename,
-                                        "source_directory": src_dir,
-                                    }
-                    logging.info("📚 Built sound URL index with %d keys", len(index))
-                except Exception as exc:
-                    logging.warning("Failed to read sound library CSV: %s", exc)
-                    index = {}
-            else:
-                logging.warning("Sound library CSV not found at %s", csv_path)
-                index = {}
-            self._sound_url_index = index
-
-        # Regex supports src in single or double quotes, and self-close or paired closing
-        audio_pat = re.compile(
-            r"<\s*audio[^>]*?src=(?:\"([^\"]+)\"|'([^']+)')[^>]*?(/?>|></\s*audio\s*>)",
-            re.IGNORECASE,
-        )
-
-        def _resolve(token: str) -> tuple[Optional[str], Optional[str]]:
-            # Normalize token: trim whitespace and remove any leading '@'
-            tok = token.strip()
-            if tok.startswith("@"):
-                tok = tok.lstrip("@").strip()
-            if tok.startswith("http://") or tok.startswith("https://"):
-                return tok, "url"
-            key = _norm(tok)
-            # exact key
-            if key in self._sound_url_index:
-                return self._sound_url_index[key]["url"], key
-            # if token has extension, try stem
-            stem = _norm(re.sub(r"\.[a-z0-9]+$", "", tok))
-            if stem in self._sound_url_index:
-                return self._sound_url_index[stem]["url"], stem
-            # partial contains
-            for k, meta in self._sound_url_index.items():
-                if key and (key in k or k in key or stem in k or k in stem):
-                    return meta["url"], k
-            # Fallback: attempt to derive from filename directly against CSV rows
-            try:
-                import csv as _csv
-                from urllib.parse import quote as _quote
-
-                csv_path = _P("helpers/soundscripts/data/soundlibrary.csv")
-                if csv_path.exists():
-                    with csv_path.open("r", encoding="utf-8") as _f:
-                        r = _csv.DictReader(_f)
-                        tok_lower = tok.lower()
-                        for row in r:
-                            fn = (row.get("filename") or "").lower()
-                            if fn and (fn == tok_lower or stem in _norm(fn)):
-                                fp = (row.get("file_path", "") or "").replace("\\", "/")
-                                anchor = "/public/sounds/"
-                                rel = row.get("filename", "")
-                                i = fp.lower().find(anchor)
-                                if i != -1:
-                                    rel = fp[i + len(anchor) :]
-                                return (
-                                    f"https://storage.googleapis.com/cwsounds/{_quote(rel, safe='/')}",
-                                    fn,
-                                )
-            except Exception:
-                pass
-            return None, None
-
-        def _repl(m: re.Match) -> str:
-            whole = m.group(0)
-            src = m.group(1) or m.group(2) or ""
-            resolved, matched_key = _resolve(src)
-            if resolved:
-                logging.info(
-                    "🔗 <audio> src mapped: token='%s' key='%s' -> '%s'",
-                    src,
-                    matched_key,
-                    resolved,
-                )
-                return whole.replace(src, resolved)
-            logging.warning("⚠️ No mapping found for <audio> src token '%s'", src)
-            return whole
+        from .ssml_engine import SSMLEngine
 
-        # Log all tokens discovered
-        for m in audio_pat.finditer(ssml):
-            raw_src = m.group(1) or m.group(2)
-            logging.info("👂 Found <audio> tag src='%s'", raw_src)
+        engine = SSMLEngine([("audio_src", {"resolve": self._resolve_sound_src})])
+        return engine.transform(ssml).ssml
 
-        return audio_pat.sub(_repl, ssml)
+    def _resolve_sound_src(self, token: str) -> tuple[Optional[str], Optional[str]]:
+        """Resolve an <audio> src token to (url, matched_key).
 
-    def _normalize_audio_tag_inner_text(self, ssml: str) -> str:
-        """Move any inner text out of <audio>...</audio> so TTS won't treat it as audio content.
-
-        Example: <audio src="...">Some text</audio> -> <audio src="..."></audio> Some text
+        - Accepts tokens like `feeling_paper`, `feeling_paper.ogg`, or human titles
+        - Matches against the sound library by filename stem, kit_title, or tags
+          through the shared SoundURLIndex (no disk I/O per lookup)
+        - Passes http(s) URLs through unchanged
         """
-        # Capture audio tags with inner text (non-tag text)
-        patt = re.compile(
-            r"(<\s*audio\b[^>]*>)([^<][\s\S]*?)(</\s*audio\s*>)", re.IGNORECASE
-        )
+        from .sound_index import get_sound_url_index
 
-        def _repl(m: re.Match) -> str:
-            open_tag, inner, close_tag = (
-                m.group(1),
-                (m.group(2) or "").strip(),
-                m.group(3),
-            )
-            if inner:
-                logging.info("✂️ Moved inner text out of <audio>: '%s'", inner[:120])
-                return f"{open_tag}{close_tag} {inner}"
-            return m.group(0)
-
-        return patt.sub(_repl, ssml)
+        # Normalize token: trim whitespace and remove any leading '@'
+        tok = token.strip()
+        if tok.startswith("@"):
+            tok = tok.lstrip("@").strip()
+        if tok.startswith("http://") or tok.startswith("https://"):
+            return tok, "url"
+        return get_sound_url_index().resolve(tok)
 
     def _strip_unsupported_ssml_for_google(self, ssml: str) -> str:
         """Remove/replace SSML tags not supported by Google TTS.
@@ -1229,30 +1364,15 @@ class APIManager:
                 logging.info("   - audio src removed: %s", src)
         return out
 
-    def _load_kid_audio_whitelist(self) -> set:
-        from pathlib import Path as _P
-        import csv as _csv
+    def _load_kid_audio_whitelist(self) -> frozenset:
+        """Top-100 relpaths, shared with the provider's curated suggestions."""
+        from .curated_audio import curated_audio
 
-        top = _P("tmp/top100_kid_story_audio.csv")
-        wl: set = set()
-        if top.exists():
-            try:
-                with top.open("r", encoding="utf-8") as f:
-                    r = _csv.DictReader(f)
-                    for row in r:
-                        rel = (row.get("relpath") or "").strip()
-                        if rel:
-                            wl.add(rel)
-            except Exception as exc:
-                logging.warning("Failed loading whitelist: %s", exc)
-        return wl
+        return curated_audio.get().whitelist
 
     def _enforce_audio_whitelist(self, ssml: str) -> str:
         """Remove <audio> tags whose relpath is not in the top-100 whitelist."""
-        wl = getattr(self, "_kid_audio_wl", None)
-        if wl is None:
-            wl = self._load_kid_audio_whitelist()
-            self._kid_audio_wl = wl
+        wl = self._load_kid_audio_whitelist()
         if not wl:
             return ssml
         pat = re.compile(
@@ -1320,25 +1440,6 @@ class APIManager:
         out = pat.sub(_repl, ssml)
         return out
 
-    def _cap_long_breaks(self, ssml: str, max_seconds: float = 2.0) -> str:
-        pat = re.compile(
-            r"<\s*break\s+time=\"([0-9]+\.?[0-9]*)(ms|s)\"\s*/>", re.IGNORECASE
-        )
-
-        def _repl(m: re.Match) -> str:
-            val, unit = m.groups()
-            try:
-                num = float(val)
-            except Exception:
-                return m.group(0)
-            seconds = num / 1000.0 if unit.lower() == "ms" else num
-            if seconds <= max_seconds:
-                return m.group(0)
-            # cap
-            return f'<break time="{max_seconds}s"/>'
-
-        return pat.sub(_repl, ssml)
-
     @staticmethod
     def _clean_llm_response_to_ssml_or_text(raw: str) -> tuple[str, bool]:
         """Extract a valid SSML document from LLM text if present; otherwise return plain text.
@@ -1348,59 +1449,52 @@ class APIManager:
         - Normalizes smart quotes and illegal XML chars
         - Replaces unsupported <audio .../> tags with <break/>
         - Fixes a common typo like </"prosody>
+
+        The rules live in ssml_stream so the streaming assembler applies the
+        same guarantees to partial responses.
+        """
+        from .ssml_stream import clean_llm_response
+
+        return clean_llm_response(raw)
+
+    def set_streaming_recognizer_factory(self, factory) -> None:
+        """Override how streaming STT sessions are created (e.g. a local stub)"""
+        self._streaming_recognizer_factory = factory
+
+    def start_speech_stream(self):
+        """Start a streaming STT session for a recording that is about to begin.
+
+        Returns a StreamingRecognizer, or None when streaming recognition is
+        disabled or unavailable (callers then use the batch speech_to_text path).
+        """
+        if self._streaming_recognizer_factory is not None:
+            return self._streaming_recognizer_factory()
+        if not self.config.get_speech_config().get("streaming", False):
+            return None
+        if not self.speech_client:
+            return None
+        return self.speech_client.start_streaming()
+
+    def process_conversation_turn(
+        self,
+        audio_data,
+        transcript: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Any]:
+        """Process a complete conversation turn: audio -> text -> AI -> audio
+
+        If a transcript is supplied (from a streaming STT session), the
+        speech-to-text step is skipped. Every stage runs under a child of
+        deadline (a fresh turn deadline from performance.stage_budgets when
+        omitted); a stage that overruns its budget is cut off and the turn
+        falls back instead of stalling.
         """
-        if not raw:
-            return "", False
-
-        text = raw.strip()
-        # Remove code fences like ```xml ... ``` or ```
-        text = re.sub(r"```[a-zA-Z]*\n?", "", text)
-        text = text.replace("```", "").strip()
-
-        # Normalize smart quotes/dashes
-        trans = {
-            ord("“"): '"',
-            ord("”"): '"',
-            ord("‘"): "'",
-            ord("’"): "'",
-            ord("—"): "-",
-            ord("–"): "-",
-        }
-        text = text.translate(trans)
-
-        # Fix obvious closing tag typo
-        text = text.replace('</"prosody>', "</prosody>")
-
-        # Extract <speak> ... </speak>
-        lower = text.lower()
-        start = lower.find("<speak")
-        end = lower.rfind("</speak>")
-        if start != -1 and end != -1:
-            # Move end to include closing tag
-            end += len("</speak>")
-            ssml = text[start:end]
-            # Remove zero-width and control chars that break XML
-            ssml = re.sub(r"[\u200B\uFEFF\x00-\x08\x0B\x0C\x0E-\x1F]", "", ssml)
-            # Escape stray ampersands not part of entities
-            ssml = re.sub(r"&(?!amp;|lt;|gt;|quot;|apos;)", "&amp;", ssml)
-            return ssml.strip(), True
-
-        # No SSML found; return cleaned plain text
-        plain = re.sub(r"\s+", " ", text).strip()
-        return plain, False
-
-    def process_conversation_turn(self, audio_data) -> Optional[Any]:
-        """Process a complete conversation turn: audio -> text -> AI -> audio"""
         if not self.ai_provider:
             logging.error("AI provider not set")
             print("\n❌ AI PROVIDER NOT SET")
 
             # Create fallback response with user's requested message
-            from .prompts_config import PromptsConfig
-
-            fallback_audio = self.text_to_speech(
-                PromptsConfig.get_fallback_response("api_unavailable")
-            )
+            fallback_audio = self.get_fallback_audio("api_unavailable")
             if fallback_audio:
                 logging.info("✅ Created fallback response audio (AI provider not set)")
                 print("✅ Created fallback response audio (AI provider not set)")
@@ -1414,25 +1508,53 @@ class APIManager:
                 )
                 return None
 
+        if deadline is None:
+            deadline = self._turn_deadline()
+
         logging.info("🔄 STARTING CONVERSATION PIPELINE")
         logging.info("=" * 60)
 
         # Step 1: Speech to text
         logging.info("STEP 1: 🎤 Speech-to-Text")
-        text = self.speech_to_text(audio_data)
+        if transcript:
+            logging.info(f"🎤 Using streaming transcript: '{transcript}'")
+            text = transcript
+        else:
+            try:
+                text = self.speech_to_text(audio_data, deadline=deadline.stage("stt"))
+            except DeadlineExceeded as e:
+                logging.error(f"❌ PIPELINE FAILED: {e}")
+                return self.get_fallback_audio("empty_input")
         if not text:
             logging.error("❌ PIPELINE FAILED: Failed to transcribe audio")
             return None
 
         # Step 2: AI processing
         logging.info("STEP 2: 🤖 AI Processing")
+        # Streaming mode: speak sentences while the model is still generating
+        if self._streaming_generation_enabled():
+            streamed = self._generate_streaming(text, deadline)
+            if streamed is not None:
+                logging.info("✅ CONVERSATION PIPELINE STREAMING")
+                logging.info("=" * 60)
+                return streamed
+            logging.warning(
+                "Streaming generation produced no speech; retrying blocking"
+            )
+
         logging.info(f"🎯 STARTING PROMPT-BASED AI PROCESSING")
         logging.info(f"🔤 USER INPUT TO AI: '{text}'")
         logging.info(f"📏 INPUT LENGTH: {len(text)} characters")
         sanitized_text = None  # Initialize for scope
         try:
             # This will trigger comprehensive prompt logging in GeminiFlashProvider
-            response_text = self.ai_provider.process_text(text, {})
+            # Providers read the deadline from the context (intent + llm stages)
+            response_text = run_with_deadline(
+                self.ai_provider.process_text,
+                deadline.stage("ai", deadline.remaining()),
+                text,
+                {"deadline": deadline},
+            )
             logging.info("🤖 AI RESPONSE RECEIVED:")
             logging.info(f"📝 AI RESPONSE TEXT: '{response_text}'")
             logging.info(f"📏 RESPONSE LENGTH: {len(response_text)} characters")
@@ -1497,11 +1619,7 @@ class APIManager:
             print(f"\n❌ AI PROCESSING FAILED: {e}")
 
             # Create fallback response with user's requested message
-            from .prompts_config import PromptsConfig
-
-            fallback_audio = self.text_to_speech(
-                PromptsConfig.get_fallback_response("api_unavailable")
-            )
+            fallback_audio = self.get_fallback_audio("api_unavailable")
             if fallback_audio:
                 logging.info("✅ Created fallback response audio")
                 print("✅ Created fallback response audio")
@@ -1523,22 +1641,32 @@ class APIManager:
             sanitized_text = PromptsConfig.get_fallback_response("empty_response")
 
         logging.info(f"🗣️  CONVERTING TO SPEECH: '{sanitized_text[:50]}...'")
+        # Pipelined mode: synthesize sentence segments concurrently and stream them
+        if self._streaming_tts_enabled():
+            streamed = self._synthesize_streaming(sanitized_text, deadline)
+            if streamed is not None:
+                logging.info("✅ CONVERSATION PIPELINE STREAMING")
+                logging.info("=" * 60)
+                return streamed
+
         # Route to SSML or plain text API appropriately
         if sanitized_text.strip().lower().startswith(
             "<speak"
         ) and sanitized_text.strip().lower().endswith("</speak>"):
-            # Before sending, rewrite any <audio src="token"/> references to GCS URLs
-            try:
-                ssml_with_urls = self._rewrite_ssml_audio_srcs(sanitized_text)
-            except Exception as _exc:
-                logging.warning("SSML audio URL rewrite failed: %s", _exc)
-                ssml_with_urls = sanitized_text
             # Send SSML with <audio> tags directly; Google TTS supports SSML <audio>
-            response_audio = self.text_to_speech_ssml(ssml_with_urls)
+            # (text_to_speech_ssml resolves src tokens to GCS URLs)
+            synthesize = self.text_to_speech_ssml
+            tts_input = sanitized_text
         else:
             logging.info("🔀 TTS MODE: PLAINTEXT")
             print("🔀 TTS MODE: PLAINTEXT")
-            response_audio = self.text_to_speech(sanitized_text)
+            synthesize = self.text_to_speech
+            tts_input = sanitized_text
+        try:
+            response_audio = synthesize(tts_input, deadline=deadline.stage("tts"))
+        except DeadlineExceeded as e:
+            logging.error(f"❌ PIPELINE FAILED: {e}")
+            return self.get_fallback_audio("connection_error")
 
         if not response_audio:
             logging.error("❌ PIPELINE FAILED: Failed to synthesize response audio")
@@ -1548,6 +1676,158 @@ class APIManager:
         logging.info("=" * 60)
         return response_audio
 
+    def _streaming_tts_enabled(self) -> bool:
+        """Whether responses should be synthesized as a pipelined segment stream."""
+        return bool(self.config.performance.get("streaming_tts", False)) and bool(
+            self.tts_client
+        )
+
+    def _streaming_generation_enabled(self) -> bool:
+        """Whether AI output should be streamed straight into the TTS pipeline."""
+        return (
+            bool(self.config.performance.get("streaming_generation", False))
+            and isinstance(self.ai_provider, AIProvider)
+            and self._streaming_tts_enabled()
+        )
+
+    def _get_tts_pipeline(self):
+        """Lazily create the shared segment synthesis pipeline."""
+        if self._tts_pipeline is None:
+            from .tts_pipeline import TTSPipeline
+
+            self._tts_pipeline = TTSPipeline(
+                self._synthesize_segment,
+                max_workers=self.config.performance.get("tts_max_workers", 3),
+            )
+        return self._tts_pipeline
+
+    def _synthesize_segment(
+        self, segment: str, deadline: Optional[Deadline] = None
+    ) -> Optional[Any]:
+        """Synthesize one pipeline segment via the SSML or plain text path."""
+        from .tts_pipeline import is_ssml_document
+
+        if is_ssml_document(segment):
+            return self.text_to_speech_ssml(segment, deadline=deadline)
+        return self.text_to_speech(segment, deadline=deadline)
+
+    def _segment_synthesizer(self, deadline: Optional[Deadline]):
+        """Per-stream synthesize function giving each segment the tts budget.
+
+        Later segments are synthesized while earlier ones play, so each gets
+        its own budget rather than sharing the turn's remaining time; a
+        cancelled turn still stops them.
+        """
+        if deadline is None:
+            return self._synthesize_segment
+        budget = deadline.budgets.get("tts")
+
+        def _synthesize(segment: str) -> Optional[Any]:
+            if deadline.cancelled:
+                return None
+            segment_deadline = Deadline(budget, "tts", budgets=deadline.budgets)
+            return self._synthesize_segment(segment, deadline=segment_deadline)
+
+        return _synthesize
+
+    def _synthesize_streaming(
+        self, text: str, deadline: Optional[Deadline] = None
+    ) -> Optional[Any]:
+        """Split a response into segments and start synthesizing them concurrently.
+
+        Returns a StreamingAudioResponse, or None when the response is too short
+        to benefit (a single segment) so the caller uses the one-shot path.
+        """
+        from .tts_pipeline import (
+            is_ssml_document,
+            split_ssml_segments,
+            split_text_segments,
+        )
+
+        min_chars = self.config.performance.get("tts_segment_min_chars", 60)
+        if is_ssml_document(text):
+            # Audio srcs are resolved per segment by text_to_speech_ssml
+            segments = split_ssml_segments(text, min_chars=min_chars)
+        else:
+            segments = split_text_segments(text, min_chars=min_chars)
+
+        if len(segments) <= 1:
+            return None
+
+        logging.info("🔀 TTS MODE: STREAMING (%d segments)", len(segments))
+        for i, seg in enumerate(segments):
+            logging.info("   segment %d: %s", i, seg[:120])
+        return self._get_tts_pipeline().stream(
+            segments, synthesize=self._segment_synthesizer(deadline)
+        )
+
+    def _generate_streaming(
+        self, text: str, deadline: Optional[Deadline] = None
+    ) -> Optional[Any]:
+        """Stream the AI response through the SSML assembler into TTS.
+
+        A background thread feeds model chunks to an SSMLStreamAssembler and
+        submits each completed segment for synthesis. Returns the
+        StreamingAudioResponse once the first segment is queued, or None if the
+        model produced nothing speakable within the llm stage budget.
+        """
+        from .ssml_stream import SSMLStreamAssembler
+
+        min_chars = self.config.performance.get("tts_segment_min_chars", 60)
+        if deadline is not None:
+            first_segment_timeout = deadline.stage("llm").timeout()
+        else:
+            first_segment_timeout = self.config.performance.get(
+                "processing_timeout", 30
+            )
+        assembler = SSMLStreamAssembler(min_chars=min_chars)
+        stream = self._get_tts_pipeline().stream(
+            synthesize=self._segment_synthesizer(deadline)
+        )
+        started = threading.Event()
+
+        def _submit(segments: List[str]) -> None:
+            for segment in segments:
+                logging.info(
+                    "🧩 Streamed segment %d: %s", stream.segment_count, segment[:120]
+                )
+                stream.submit(segment)
+                started.set()
+
+        def _produce() -> None:
+            t0 = time.monotonic()
+            try:
+                context = {"deadline": deadline} if deadline is not None else {}
+                for chunk in self.ai_provider.stream_text(text, context):
+                    if stream.cancelled:
+                        logging.info("⏹️ Streaming generation cancelled")
+                        return
+                    _submit(assembler.feed(chunk))
+                _submit(assembler.finish())
+            except Exception as e:
+                logging.error(f"❌ Streaming generation failed: {e}")
+            finally:
+                stream.close()
+                started.set()
+                logging.info(
+                    "🤖 Streaming generation finished in %.2fs (%s mode, %d segments)",
+                    time.monotonic() - t0,
+                    assembler.mode or "unknown",
+                    stream.segment_count,
+                )
+                logging.info("📩 AI RAW RESPONSE — BEGIN")
+                for i, line in enumerate(assembler.raw_text.split("\n"), 1):
+                    logging.info("%3d: %s", i, line)
+                logging.info("📩 AI RAW RESPONSE — END")
+
+        logging.info("🔀 AI MODE: STREAMING")
+        threading.Thread(target=_produce, name="lb-llm-stream", daemon=True).start()
+
+        if not started.wait(first_segment_timeout) or stream.segment_count == 0:
+            stream.cancel()
+            return None
+        return stream
+
     def get_api_status(self) -> dict:
         """Get status of all API components"""
         return {
@@ -1565,6 +1845,17 @@ class APIManager:
             ),
             "project_id": self.config.project_id,
             "environment": self.config.secrets["environment"],
+            "channels": (
+                self.channel_manager.get_status() if self.channel_manager else None
+            ),
+            "fallback_audio": (
+                self.fallback_bank.get_stats() if self.fallback_bank else None
+            ),
+            "tts_cache": (
+                self.tts_client.cache.get_stats()
+                if self.tts_client and getattr(self.tts_client, "cache", None)
+                else None
+            ),
         }
 
     def set_ai_provider(self, provider: AIProvider) -> None:
@@ -1576,6 +1867,14 @@ class APIManager:
         """Clean up API resources"""
         logging.info("Cleaning up API Manager...")
 
+        if self._tts_pipeline is not None:
+            self._tts_pipeline.shutdown()
+            self._tts_pipeline = None
+        if self.channel_manager is not None:
+            self.channel_manager.close()
+        if self.ai_provider is not None and hasattr(self.ai_provider, "cleanup"):
+            self.ai_provider.cleanup()
+
         # Clean up clients
         if self.speech_client:
             self.speech_client.state = APIState.OFFLINE
@@ -0,0 +1,179 @@
+"""
+Process-wide PyAudio context and device registry.
+
+Every AudioHandler used to create its own pyaudio.PyAudio(), and each one
+re-enumerates the ALSA devices (slow on the Pi, and MainLoop plus
+AudioPlaybackManager made two). AudioDeviceManager owns the single
+PortAudio context, reference-counted so it is terminated only after the
+last handler releases it, caches device enumeration, and opens streams.
+
+With keep_open=True an output stream is kept across playbacks and reused
+for the next one with the same format, so a turn does not pay for
+audio.open(). Streams driven by a callback are never reused, since the
+callback is fixed when the stream is opened.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import pyaudio
+
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+
+OutputKey = Tuple[int, int, int, int]
+
+
+def _default_factory() -> Any:
+    return pyaudio.PyAudio()
+
+
+class AudioDeviceManager:
+    """Owns one PyAudio context and hands out input/output streams."""
+
+    def __init__(self, factory: Optional[Callable[[], Any]] = None):
+        self._factory = factory or (_default_factory if PYAUDIO_AVAILABLE else None)
+        self._lock = threading.RLock()
+        self._context: Any = None
+        self._users = 0
+        self._devices: Optional[List[Dict[str, Any]]] = None
+        self._outputs: Dict[OutputKey, Any] = {}
+
+    # ---------- Context ----------
+    def acquire(self) -> Any:
+        """Shared PyAudio context (created on first use), or None."""
+        with self._lock:
+            if self._context is None and self._factory is not None:
+                try:
+                    self._context = self._factory()
+                    logging.info("🎛️ PyAudio context initialized")
+                except Exception as e:
+                    logging.error(f"Failed to initialize PyAudio: {e}")
+                    return None
+            if self._context is not None:
+                self._users += 1
+            return self._context
+
+    def release(self) -> None:
+        """Drop one user; the last one closes kept streams and terminates."""
+        with self._lock:
+            if self._users == 0:
+                return
+            self._users -= 1
+            if self._users:
+                return
+            for stream in self._outputs.values():
+                self._close(stream)
+            self._outputs.clear()
+            try:
+                self._context.terminate()
+            except Exception as e:
+                logging.error(f"Error terminating PyAudio: {e}")
+            self._context = None
+            self._devices = None
+
+    # ---------- Devices ----------
+    def devices(self) -> List[Dict[str, Any]]:
+        """Device info dicts, enumerated once per context."""
+        with self._lock:
+            if self._devices is None:
+                devices = []
+                context = self._context
+                if context is not None:
+                    try:
+                        for i in range(context.get_device_count()):
+                            devices.append(context.get_device_info_by_index(i))
+                    except Exception as e:
+                        logging.warning(f"Audio device enumeration failed: {e}")
+                self._devices = devices
+            return self._devices
+
+    def resolve_input(self, device: Union[int, str, None]) -> Optional[int]:
+        """Input device index for an index or a (partial) device name."""
+        if device is None or isinstance(device, int):
+            return device
+        name = str(device).lower()
+        for info in self.devices():
+            if (
+                info.get("maxInputChannels", 0) > 0
+                and name in str(info.get("name", "")).lower()
+            ):
+                return int(info["index"])
+        logging.warning(f"Input device '{device}' not found; using the default")
+        return None
+
+    # ---------- Streams ----------
+    def open_input(self, **kwargs: Any) -> Any:
+        return self._context.open(input=True, **kwargs)
+
+    def open_output(
+        self,
+        format: int,
+        channels: int,
+        rate: int,
+        frames_per_buffer: int,
+        stream_callback: Optional[Callable] = None,
+        keep_open: bool = False,
+    ) -> Any:
+        """Output stream; with keep_open, reuse the kept one for this format."""
+        if stream_callback is not None or not keep_open:
+            return self._context.open(
+                format=format,
+                channels=channels,
+                rate=rate,
+                output=True,
+                frames_per_buffer=frames_per_buffer,
+                stream_callback=stream_callback,
+            )
+        key = (format, channels, rate, frames_per_buffer)
+        with self._lock:
+            stream = self._outputs.get(key)
+            if stream is not None:
+                try:
+                    if stream.is_stopped():
+                        stream.start_stream()
+                    return stream
+                except Exception:
+                    self._outputs.pop(key, None)
+                    self._close(stream)
+            stream = self._context.open(
+                format=format,
+                channels=channels,
+                rate=rate,
+                output=True,
+                frames_per_buffer=frames_per_buffer,
+            )
+            self._outputs[key] = stream
+            return stream
+
+    def close_output(self, stream: Any) -> None:
+        """Close a stream from open_output unless it is kept open."""
+        with self._lock:
+            if any(kept is stream for kept in self._outputs.values()):
+                return
+        self._close(stream)
+
+    def _close(self, stream: Any) -> None:
+        try:
+            stream.stop_stream()
+            stream.close()
+        except Exception as e:
+            logging.error(f"Error closing audio stream: {e}")
+
+
+_manager: Optional[AudioDeviceManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_audio_device_manager() -> AudioDeviceManager:
+    """Process-wide AudioDeviceManager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = AudioDeviceManager()
+        return _manager
@@ -0,0 +1,139 @@
+"""
+Compressed encodings for Speech-to-Text uploads.
+
+Recordings were always uploaded as raw LINEAR16: about 32 KB per second at
+16 kHz, so a 20 second question is ~640 KB on the device's uplink.
+StreamingEncoder compresses 16-bit PCM chunk by chunk with libsndfile (via
+the optional soundfile package) into FLAC (lossless, ~2x smaller) or
+OGG_OPUS (~10x smaller), so AudioHandler can encode while the user is still
+talking and only the last chunk is left to encode on release.
+
+EncodedAudio carries the compressed bytes with the encoding and sample rate
+the RecognitionConfig needs. Without soundfile, or for sample rates Opus
+does not support, uploads stay LINEAR16.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+from typing import Any, Optional, Union
+
+import numpy as np
+
+try:
+    import soundfile as sf  # type: ignore
+
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError: soundfile installed but libsndfile missing
+    SOUNDFILE_AVAILABLE = False
+
+UPLOAD_ENCODINGS = ("LINEAR16", "FLAC", "OGG_OPUS")
+OPUS_RATES = (8000, 12000, 16000, 24000, 48000)
+# RecognitionConfig encoding -> (libsndfile container, subtype)
+_SOUNDFILE_FORMATS = {"FLAC": ("FLAC", "PCM_16"), "OGG_OPUS": ("OGG", "OPUS")}
+
+PCM = Union[bytes, bytearray, memoryview]
+
+
+class EncodedAudio:
+    """A compressed recording and how Speech-to-Text should decode it."""
+
+    def __init__(
+        self,
+        content: bytes,
+        encoding: str,
+        sample_rate: int,
+        channels: int,
+        pcm_bytes: int,
+    ):
+        self.content = content
+        self.encoding = encoding
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.pcm_bytes = pcm_bytes
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    @property
+    def ratio(self) -> float:
+        """LINEAR16 size over encoded size."""
+        return self.pcm_bytes / len(self.content) if self.content else 0.0
+
+
+def resolve_encoding(encoding: str, sample_rate: int) -> str:
+    """encoding if it can be produced here, otherwise LINEAR16."""
+    if encoding == "LINEAR16":
+        return encoding
+    if not SOUNDFILE_AVAILABLE:
+        logging.warning(f"soundfile not installed - uploading LINEAR16, not {encoding}")
+        return "LINEAR16"
+    if encoding == "OGG_OPUS" and sample_rate not in OPUS_RATES:
+        logging.warning(f"Opus does not support {sample_rate} Hz - uploading LINEAR16")
+        return "LINEAR16"
+    return encoding
+
+
+def upload_payload(audio_data: Any) -> Any:
+    """What to send to Speech-to-Text for an AudioData: encoded or raw PCM."""
+    encoded = getattr(audio_data, "encoded", None)
+    if isinstance(encoded, EncodedAudio):
+        return encoded
+    return audio_data.data
+
+
+class StreamingEncoder:
+    """Encodes 16-bit PCM into FLAC or OGG_OPUS as chunks are captured."""
+
+    def __init__(self, encoding: str, sample_rate: int, channels: int):
+        container, subtype = _SOUNDFILE_FORMATS[encoding]
+        self.encoding = encoding
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.pcm_bytes = 0
+        self._out = io.BytesIO()
+        self._file = sf.SoundFile(
+            self._out,
+            mode="w",
+            samplerate=sample_rate,
+            channels=channels,
+            format=container,
+            subtype=subtype,
+        )
+
+    def write(self, pcm: PCM) -> None:
+        if not len(pcm):
+            return
+        samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, self.channels)
+        self._file.write(samples)
+        self.pcm_bytes += len(pcm)
+
+    def finish(self) -> EncodedAudio:
+        """Flush the encoder and return the complete file."""
+        self._file.close()
+        return EncodedAudio(
+            self._out.getvalue(),
+            self.encoding,
+            self.sample_rate,
+            self.channels,
+            self.pcm_bytes,
+        )
+
+    def abort(self) -> None:
+        try:
+            self._file.close()
+        except Exception:
+            pass
+
+
+def encode_pcm(
+    pcm: PCM, encoding: str, sample_rate: int, channels: int
+) -> Optional[EncodedAudio]:
+    """Encode a whole recording in one go; None for LINEAR16."""
+    if encoding == "LINEAR16":
+        return None
+    encoder = StreamingEncoder(encoding, sample_rate, channels)
+    encoder.write(pcm)
+    return encoder.finish()
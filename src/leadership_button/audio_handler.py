@@ -7,14 +7,26 @@ laptop development and Raspberry Pi production environments.
 
 import logging
 import os
+import queue
 import threading
 import time
 import wave
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Union
 from enum import Enum
 from pathlib import Path
 from datetime import datetime
 
+from .audio_devices import get_audio_device_manager
+from .audio_encoder import (
+    UPLOAD_ENCODINGS,
+    EncodedAudio,
+    StreamingEncoder,
+    encode_pcm,
+    resolve_encoding,
+)
+from .capture_buffer import CaptureBuffer, capture_capacity
+from .vad import DEFAULT_VAD_SETTINGS, VAD_ENGINES, VoiceActivityDetector
+
 # Core audio dependencies
 try:
     import pyaudio
@@ -33,6 +45,10 @@ except ImportError:
     GPIO_AVAILABLE = False
     logging.info("RPi.GPIO not available - running in laptop mode")
 
+# "blocking": read/write loops on Python threads; "callback": PortAudio
+# drives PyAudio stream callbacks that fill/drain buffers directly
+STREAM_MODES = ("blocking", "callback")
+
 
 class DeviceState(Enum):
     """Device state enumeration"""
@@ -62,14 +78,22 @@ class AudioConfig:
         self.channels: int = recording_config["channels"]
         self.chunk_size: int = recording_config["chunk_size"]
         self.format: str = recording_config["format"]
-        self.device_index: Optional[int] = recording_config["device_index"]
+        # An index, or a (partial) device name resolved by AudioDeviceManager
+        self.device_index: Union[int, str, None] = recording_config["device_index"]
         self.max_recording_duration: int = recording_config["max_recording_duration"]
+        self.stream_mode: str = recording_config["stream_mode"]
+        # Silence trimming / end-of-utterance settings (see vad.py)
+        self.vad: Dict[str, Any] = recording_config["vad"]
+        # Speech-to-Text upload encoding: LINEAR16, FLAC or OGG_OPUS
+        self.upload_encoding: str = recording_config["upload_encoding"]
 
         # Playback parameters (to speakers) - CRITICAL: must match TTS output
         self.playback_sample_rate: int = playback_config["sample_rate"]
         self.playback_channels: int = playback_config["channels"]
         self.playback_chunk_size: int = playback_config["chunk_size"]
         self.playback_format: str = playback_config["format"]
+        # Reuse one output stream across playbacks (blocking mode only)
+        self.keep_output_open: bool = playback_config["keep_output_open"]
 
         # Hardware parameters (Raspberry Pi)
         self.button_pin: Optional[int] = hardware_config["button_pin"]
@@ -94,17 +118,36 @@ class AudioConfig:
             raise ValueError("Max recording duration must be positive")
         if self.playback_sample_rate <= 0:
             raise ValueError("Playback sample rate must be positive")
+        if self.stream_mode not in STREAM_MODES:
+            raise ValueError(f"Stream mode must be one of {STREAM_MODES}")
+        if self.vad.get("engine") not in VAD_ENGINES:
+            raise ValueError(f"VAD engine must be one of {VAD_ENGINES}")
+        if self.upload_encoding not in UPLOAD_ENCODINGS:
+            raise ValueError(f"Upload encoding must be one of {UPLOAD_ENCODINGS}")
         return True
 
 
 class AudioData:
-    """Container for audio data with metadata"""
-
-    def __init__(self, data: bytes, format: str, sample_rate: int, channels: int):
-        self.data: bytes = data
+    """Container for audio data with metadata
+
+    data may be a zero-copy memoryview of the capture buffer; call bytes()
+    on it where an API needs a bytes object. encoded is the same audio
+    compressed for upload, when an upload encoding is configured.
+    """
+
+    def __init__(
+        self,
+        data: Union[bytes, memoryview],
+        format: str,
+        sample_rate: int,
+        channels: int,
+        encoded: Optional[EncodedAudio] = None,
+    ):
+        self.data: Union[bytes, memoryview] = data
         self.format: str = format
         self.sample_rate: int = sample_rate
         self.channels: int = channels
+        self.encoded: Optional[EncodedAudio] = encoded
         self.duration: float = self._calculate_duration()
 
     def _calculate_duration(self) -> float:
@@ -163,9 +206,13 @@ class AudioConfigManager:
             "playback_channels": 1,
             "playback_chunk_size": 1024,
             "playback_format": "int16",
+            "keep_output_open": False,
             # Hardware settings
             "device_index": None,
             "max_recording_duration": 30,
+            "stream_mode": "blocking",
+            "vad": dict(DEFAULT_VAD_SETTINGS),
+            "upload_encoding": "LINEAR16",
             "button_pin": None,
             "led_pin": None,
         }
@@ -194,6 +241,21 @@ class AudioConfigManager:
             if "format" in audio_settings:
                 self._config_data["recording_format"] = audio_settings["format"]
                 self._config_data["playback_format"] = audio_settings["format"]
+            if "stream_mode" in audio_settings:
+                self._config_data["stream_mode"] = audio_settings["stream_mode"]
+            if "keep_output_open" in audio_settings:
+                self._config_data["keep_output_open"] = bool(
+                    audio_settings["keep_output_open"]
+                )
+            if "device_index" in audio_settings:
+                self._config_data["device_index"] = audio_settings["device_index"]
+            if "upload_encoding" in audio_settings:
+                self._config_data["upload_encoding"] = audio_settings["upload_encoding"]
+            if "vad" in audio_settings:
+                self._config_data["vad"] = {
+                    **self._config_data["vad"],
+                    **audio_settings["vad"],
+                }
 
             logging.info("🔧 AudioConfigManager: Updated from API config")
             logging.info(
@@ -212,6 +274,9 @@ class AudioConfigManager:
             "format": self._config_data["recording_format"],
             "device_index": self._config_data["device_index"],
             "max_recording_duration": self._config_data["max_recording_duration"],
+            "stream_mode": self._config_data["stream_mode"],
+            "vad": dict(self._config_data["vad"]),
+            "upload_encoding": self._config_data["upload_encoding"],
         }
 
     def get_playback_config(self) -> Dict[str, Any]:
@@ -221,6 +286,8 @@ class AudioConfigManager:
             "channels": self._config_data["playback_channels"],
             "chunk_size": self._config_data["playback_chunk_size"],
             "format": self._config_data["playback_format"],
+            "stream_mode": self._config_data["stream_mode"],
+            "keep_output_open": self._config_data["keep_output_open"],
         }
 
     def get_hardware_config(self) -> Dict[str, Any]:
@@ -242,14 +309,9 @@ class AudioHandler:
         self.config = config
         self.config.validate()
 
-        # Initialize PyAudio
-        self.audio = None
-        if PYAUDIO_AVAILABLE:
-            try:
-                self.audio = pyaudio.PyAudio()
-            except Exception as e:
-                logging.error(f"Failed to initialize PyAudio: {e}")
-                self.audio = None
+        # Shared PyAudio context (one per process, see audio_devices)
+        self.devices = get_audio_device_manager()
+        self.audio = self.devices.acquire() if PYAUDIO_AVAILABLE else None
 
         # State management
         self.state = DeviceState.IDLE
@@ -257,14 +319,39 @@ class AudioHandler:
 
         # Recording state
         self.recording_stream = None
-        self.recording_data = []
+        self.capture_buffer: Optional[CaptureBuffer] = None
         self.recording_thread = None
         self.stop_recording_event = threading.Event()
+        # Optional consumer of each captured chunk (e.g. streaming STT)
+        self.chunk_callback: Optional[Callable[[bytes], None]] = None
+        # Frames the capture callback may still accept (callback mode)
+        self._capture_frames_left = 0
+        # Callback mode: chunks the callback captured, handed to a worker
+        # thread for the chunk callback, VAD and encoder (None = stop)
+        self._capture_queue: Optional[queue.SimpleQueue] = None
+        self._capture_worker: Optional[threading.Thread] = None
+        # Bytes of the capture buffer the per-chunk work has seen
+        self._processed_bytes = 0
+        # Per-recording voice activity detector (None when VAD is disabled)
+        self.vad: Optional[VoiceActivityDetector] = None
+        self._utterance_ended = False
+        # Called from the capture thread when the VAD ends the utterance
+        self.utterance_end_callback: Optional[Callable[[], None]] = None
+        # Upload encoder fed while recording; _encoded_from/_encoded_to are
+        # the capture offsets it has consumed (None until it starts)
+        self.upload_encoding = resolve_encoding(
+            self.config.upload_encoding, self.config.sample_rate
+        )
+        self.encoder: Optional[StreamingEncoder] = None
+        self._encoded_from: Optional[int] = None
+        self._encoded_to = 0
 
         # Playback state
         self.playback_stream = None
         self.playback_thread = None
         self.stop_playback_event = threading.Event()
+        # True while playback_stream is driven by a PyAudio callback
+        self._callback_playback = False
 
         # Hardware state (Raspberry Pi)
         self.button_thread = None
@@ -299,31 +386,54 @@ class AudioHandler:
             self.state = DeviceState.RECORDING
 
         try:
-            # Reset recording data
-            self.recording_data = []
+            # Fresh preallocated buffer: the previous AudioData may still
+            # reference the last one
+            self.capture_buffer = CaptureBuffer(
+                capture_capacity(
+                    self.config.sample_rate,
+                    self.config.channels,
+                    self.config.max_recording_duration,
+                    self.config.chunk_size,
+                )
+            )
+            self.vad = VoiceActivityDetector.from_settings(
+                self.config.sample_rate, self.config.channels, self.config.vad
+            )
+            self._start_encoder()
+            self._processed_bytes = 0
+            self._utterance_ended = False
             self.stop_recording_event.clear()
+            callback_mode = self.config.stream_mode == "callback"
+            self._capture_frames_left = int(
+                self.config.sample_rate * self.config.max_recording_duration
+            )
+            if callback_mode:
+                self._start_capture_worker()
 
             # Open recording stream
-            self.recording_stream = self.audio.open(
+            self.recording_stream = self.devices.open_input(
                 format=self.config.pyaudio_format,
                 channels=self.config.channels,
                 rate=self.config.sample_rate,
-                input=True,
-                input_device_index=self.config.device_index,
+                input_device_index=self.devices.resolve_input(self.config.device_index),
                 frames_per_buffer=self.config.chunk_size,
+                stream_callback=self._capture_callback if callback_mode else None,
             )
 
-            # Start recording thread
-            self.recording_thread = threading.Thread(
-                target=self._record_audio_stream, daemon=True
-            )
-            self.recording_thread.start()
+            # Blocking mode reads on a dedicated thread
+            self.recording_thread = None
+            if not callback_mode:
+                self.recording_thread = threading.Thread(
+                    target=self._record_audio_stream, daemon=True
+                )
+                self.recording_thread.start()
 
             logging.info("Audio recording started")
             return True
 
         except Exception as e:
             logging.error(f"Failed to start recording: {e}")
+            self._stop_capture_worker()
             with self.state_lock:
                 self.state = DeviceState.ERROR
             return False
@@ -351,14 +461,29 @@ class AudioHandler:
             finally:
                 self.recording_stream = None
 
-        # Process recorded data
-        if self.recording_data:
-            audio_bytes = b"".join(self.recording_data)
+        # No more callbacks; let the worker finish the chunks already queued
+        self._stop_capture_worker()
+
+        # Process recorded data (a view of the capture buffer, no join/copy)
+        capture = self.capture_buffer
+        if capture is not None and len(capture):
+            if capture.overflowed:
+                logging.warning("Capture buffer overflowed; kept the latest audio")
+            audio_bytes = capture.view()
+            if self.vad is not None:
+                trimmed = self.vad.trim(audio_bytes)
+                if len(trimmed) < len(audio_bytes):
+                    logging.info(
+                        f"✂️ VAD trimmed {len(audio_bytes) - len(trimmed)} bytes "
+                        "of leading/trailing silence"
+                    )
+                audio_bytes = trimmed
             audio_data = AudioData(
                 data=audio_bytes,
                 format=self.config.format,
                 sample_rate=self.config.sample_rate,
                 channels=self.config.channels,
+                encoded=self._finish_encoding(audio_bytes),
             )
 
             # Persist a copy of the raw recording for later review
@@ -382,6 +507,7 @@ class AudioHandler:
         else:
             with self.state_lock:
                 self.state = DeviceState.IDLE
+            self._abort_encoder()
             logging.warning("No audio data captured")
             return None
 
@@ -402,16 +528,200 @@ class AudioHandler:
                     data = self.recording_stream.read(
                         self.config.chunk_size, exception_on_overflow=False
                     )
-                    self.recording_data.append(data)
+                    self.capture_buffer.write(data)
                 except Exception as e:
                     logging.error(f"Error reading audio data: {e}")
                     break
 
+                if self._process_chunk(data):
+                    break
+
         except Exception as e:
             logging.error(f"Error in recording thread: {e}")
 
         logging.debug("Recording thread finished")
 
+    def _capture_callback(self, in_data, frame_count, time_info, status):
+        """PyAudio input callback (callback mode), run on PortAudio's thread.
+
+        Only copies each buffer into the capture buffer and queues it for the
+        capture worker, so encoding or a slow consumer cannot cause overruns;
+        returning paComplete ends the stream within one buffer of a stop
+        request or of the VAD ending the utterance.
+        """
+        capture = self.capture_buffer
+        if (
+            self.stop_recording_event.is_set()
+            or self._utterance_ended
+            or capture is None
+        ):
+            return (None, pyaudio.paComplete)
+        capture.write(in_data)
+        chunks = self._capture_queue
+        if chunks is not None:
+            chunks.put(in_data)
+
+        self._capture_frames_left -= frame_count
+        if self._capture_frames_left <= 0:
+            logging.warning(
+                f"Recording timeout after {self.config.max_recording_duration} seconds"
+            )
+            return (None, pyaudio.paComplete)
+        return (None, pyaudio.paContinue)
+
+    def _start_capture_worker(self) -> None:
+        chunks: queue.SimpleQueue = queue.SimpleQueue()
+        self._capture_queue = chunks
+        self._capture_worker = threading.Thread(
+            target=self._run_capture_worker,
+            args=(chunks,),
+            name="lb-capture-worker",
+            daemon=True,
+        )
+        self._capture_worker.start()
+
+    def _run_capture_worker(self, chunks: queue.SimpleQueue) -> None:
+        """Per-chunk work for callback mode, off PortAudio's thread."""
+        while True:
+            data = chunks.get()
+            if data is None:
+                break
+            try:
+                self._process_chunk(data)
+            except Exception as e:
+                logging.error(f"Error processing captured audio: {e}")
+        logging.debug("Capture worker finished")
+
+    def _stop_capture_worker(self) -> None:
+        """Drain and stop the capture worker (after the stream has stopped)."""
+        chunks, self._capture_queue = self._capture_queue, None
+        worker, self._capture_worker = self._capture_worker, None
+        if chunks is None:
+            return
+        chunks.put(None)
+        if worker is not None and worker.is_alive():
+            worker.join(timeout=2.0)
+            if worker.is_alive():
+                logging.warning("Capture worker still busy after stop")
+
+    def _process_chunk(self, data: bytes) -> bool:
+        """Work for one captured chunk: chunk callback, VAD, upload encoder.
+
+        Runs on the blocking read thread or the capture worker, never on
+        PortAudio's thread. Returns True once the VAD ended the utterance.
+        """
+        self._processed_bytes += len(data)
+        callback = self.chunk_callback
+        if callback:
+            try:
+                callback(data)
+            except Exception as e:
+                logging.warning(f"Chunk callback failed: {e}")
+        ended = self._detect_utterance_end(data)
+        self._encode_captured()
+        return ended
+
+    def _detect_utterance_end(self, data: bytes) -> bool:
+        """Feed the VAD; True once the speaker went quiet (notifies only once)."""
+        vad = self.vad
+        if vad is None or not vad.feed(data):
+            return False
+        if self._utterance_ended:
+            return True
+        self._utterance_ended = True
+        logging.info(
+            f"🤫 End of utterance after {vad.trailing_silence_ms:.0f}ms of silence"
+        )
+        callback = self.utterance_end_callback
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                logging.warning(f"Utterance end callback failed: {e}")
+        return True
+
+    def _start_encoder(self) -> None:
+        """Fresh upload encoder for a new recording (none for LINEAR16)."""
+        self._abort_encoder()
+        self._encoded_from = None
+        self._encoded_to = 0
+        if self.upload_encoding == "LINEAR16":
+            return
+        try:
+            self.encoder = StreamingEncoder(
+                self.upload_encoding, self.config.sample_rate, self.config.channels
+            )
+        except Exception as e:
+            logging.warning(f"Failed to start {self.upload_encoding} encoder: {e}")
+
+    def _encode_captured(self) -> None:
+        """Encode newly captured audio, up to where the VAD would trim it.
+
+        With a VAD, encoding starts at the padded speech start and never
+        runs past the padded speech end, so the encoded audio is exactly
+        the trimmed upload.
+        """
+        encoder = self.encoder
+        capture = self.capture_buffer
+        if encoder is None or capture is None:
+            return
+        if capture.overflowed:
+            # Offsets no longer map onto the ring; encode at stop instead
+            self._abort_encoder()
+            return
+        # Only what the VAD has seen; the capture worker may lag the buffer
+        start, end = 0, self._processed_bytes
+        if self.vad is not None:
+            bounds = self.vad.speech_bounds(end)
+            if bounds is None:
+                return
+            start, end = bounds
+        if self._encoded_from is None:
+            self._encoded_from = self._encoded_to = start
+        if end <= self._encoded_to:
+            return
+        try:
+            encoder.write(capture.view()[self._encoded_to : end])
+            self._encoded_to = end
+        except Exception as e:
+            logging.warning(f"{self.upload_encoding} encoding failed: {e}")
+            self._abort_encoder()
+
+    def _finish_encoding(
+        self, audio: Union[bytes, memoryview]
+    ) -> Optional[EncodedAudio]:
+        """Compressed upload for audio (the trimmed capture), if configured."""
+        if self.upload_encoding == "LINEAR16":
+            return None
+        self._encode_captured()
+        encoder, self.encoder = self.encoder, None
+        try:
+            streamed = self._encoded_to - (self._encoded_from or 0)
+            if encoder is not None and streamed == len(audio):
+                encoded = encoder.finish()
+            else:
+                if encoder is not None:
+                    encoder.abort()
+                encoded = encode_pcm(
+                    audio,
+                    self.upload_encoding,
+                    self.config.sample_rate,
+                    self.config.channels,
+                )
+        except Exception as e:
+            logging.warning(f"{self.upload_encoding} encoding failed: {e}")
+            return None
+        logging.info(
+            f"🗜️ Upload audio: {encoded.pcm_bytes} bytes PCM -> {len(encoded)} "
+            f"bytes {encoded.encoding} ({encoded.ratio:.1f}x)"
+        )
+        return encoded
+
+    def _abort_encoder(self) -> None:
+        encoder, self.encoder = self.encoder, None
+        if encoder is not None:
+            encoder.abort()
+
     def play_audio(self, audio_data) -> bool:
         """Play audio data through speakers
 
@@ -452,9 +762,14 @@ class AudioHandler:
             self.stop_playback_event.set()
             if self.playback_thread and self.playback_thread.is_alive():
                 self.playback_thread.join(timeout=1.0)
+            self._close_callback_playback()
 
             # Start new playback
             self.stop_playback_event.clear()
+            if self.config.stream_mode == "callback":
+                self._start_callback_playback(raw_bytes, playback_sample_rate, channels)
+                return True
+
             self.playback_thread = threading.Thread(
                 target=self._play_audio_stream,
                 args=(raw_bytes, playback_sample_rate, channels),
@@ -477,12 +792,12 @@ class AudioHandler:
 
         try:
             # Open playback stream
-            playback_stream = self.audio.open(
+            playback_stream = self.devices.open_output(
                 format=self.config.pyaudio_format,
                 channels=channels,
                 rate=sample_rate,
-                output=True,
                 frames_per_buffer=self.config.chunk_size,
+                keep_open=self.config.keep_output_open,
             )
             # Expose the active stream for external stop
             self.playback_stream = playback_stream
@@ -503,13 +818,9 @@ class AudioHandler:
             logging.error(f"Error during audio playback: {e}")
 
         finally:
-            # Clean up playback stream
+            # Clean up playback stream (a kept stream stays open)
             if playback_stream:
-                try:
-                    playback_stream.stop_stream()
-                    playback_stream.close()
-                except Exception as e:
-                    logging.error(f"Error closing playback stream: {e}")
+                self.devices.close_output(playback_stream)
             # Clear the reference so is_playing reflects accurate state
             self.playback_stream = None
 
@@ -518,6 +829,48 @@ class AudioHandler:
                 if self.state == DeviceState.PLAYING:
                     self.state = DeviceState.IDLE
 
+    def _start_callback_playback(
+        self, audio_data: bytes, sample_rate: int, channels: int
+    ) -> None:
+        """Open an output stream whose callback drains audio_data (no thread)."""
+        data = memoryview(audio_data).cast("B")
+        frame_bytes = channels * 2  # 16-bit samples
+        pos = 0
+
+        def _feed(in_data, frame_count, time_info, status):
+            nonlocal pos
+            if self.stop_playback_event.is_set():
+                return (b"", pyaudio.paAbort)
+            n = frame_count * frame_bytes
+            chunk = bytes(data[pos : pos + n])
+            pos += n
+            if len(chunk) < n:
+                # Pad the last buffer with silence; PortAudio drains, then stops
+                return (chunk + b"\x00" * (n - len(chunk)), pyaudio.paComplete)
+            return (chunk, pyaudio.paContinue)
+
+        self.playback_stream = self.devices.open_output(
+            format=self.config.pyaudio_format,
+            channels=channels,
+            rate=sample_rate,
+            frames_per_buffer=self.config.chunk_size,
+            stream_callback=_feed,
+        )
+        self._callback_playback = True
+
+    def _close_callback_playback(self) -> None:
+        """Close a callback-driven playback stream and return to IDLE."""
+        if not self._callback_playback:
+            return
+        self._callback_playback = False
+        stream, self.playback_stream = self.playback_stream, None
+        if stream is not None:
+            self.devices.close_output(stream)
+        with self.state_lock:
+            if self.state == DeviceState.PLAYING:
+                self.state = DeviceState.IDLE
+        logging.info("Audio playback completed")
+
     def stop_playback(self) -> None:
         """Public method to stop any ongoing playback immediately."""
         try:
@@ -531,6 +884,7 @@ class AudioHandler:
             # Wait briefly for playback thread to exit
             if self.playback_thread and self.playback_thread.is_alive():
                 self.playback_thread.join(timeout=2.0)
+            self._close_callback_playback()
         finally:
             with self.state_lock:
                 if self.state == DeviceState.PLAYING:
@@ -542,6 +896,14 @@ class AudioHandler:
 
     def is_playing(self) -> bool:
         """Check if currently playing audio"""
+        if self._callback_playback and self.state == DeviceState.PLAYING:
+            # No playback thread in callback mode: notice a drained stream here
+            try:
+                active = self.playback_stream.is_active()
+            except Exception:
+                active = False
+            if not active:
+                self._close_callback_playback()
         return self.state == DeviceState.PLAYING
 
     def setup_hardware(self) -> bool:
@@ -627,6 +989,16 @@ class AudioHandler:
         except Exception as e:
             logging.error(f"Failed to set LED state: {e}")
 
+    def set_chunk_callback(self, callback: Optional[Callable[[bytes], None]]) -> None:
+        """Set (or clear) a callback invoked with each recorded chunk"""
+        self.chunk_callback = callback
+
+    def set_utterance_end_callback(
+        self, callback: Optional[Callable[[], None]]
+    ) -> None:
+        """Set (or clear) a callback invoked when the VAD ends an utterance"""
+        self.utterance_end_callback = callback
+
     def set_button_callback(self, callback: Callable[[str], None]) -> None:
         """Set callback function for button events"""
         self.button_callback = callback
@@ -647,13 +1019,12 @@ class AudioHandler:
         self.stop_playback_event.set()
         if self.playback_thread and self.playback_thread.is_alive():
             self.playback_thread.join(timeout=2.0)
+        self._close_callback_playback()
 
-        # Clean up PyAudio
+        # Release the shared PyAudio context (terminated by its last user)
         if self.audio:
-            try:
-                self.audio.terminate()
-            except Exception as e:
-                logging.error(f"Error terminating PyAudio: {e}")
+            self.devices.release()
+            self.audio = None
 
         # Clean up GPIO
         if GPIO_AVAILABLE:
@@ -17,6 +17,7 @@ import threading
 from pathlib import Path
 
 from .audio_handler import AudioHandler, AudioConfig, AudioData, audio_config_manager
+from .tts_pipeline import StreamingAudioResponse
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,8 @@ class AudioPlaybackManager:
         self.audio_config = audio_config or AudioConfig()
         self.audio_handler = AudioHandler(self.audio_config)
         self.logger = logging.getLogger(__name__)
+        # time.monotonic() when the latest play_audio_and_wait started sound
+        self.first_audio_at: Optional[float] = None
 
         playback_config = audio_config_manager.get_playback_config()
         self.logger.info(
@@ -118,10 +121,15 @@ class AudioPlaybackManager:
         Returns:
             True if playback completed successfully, False otherwise
         """
+        self.first_audio_at = None
+        if isinstance(audio_response, StreamingAudioResponse):
+            return self._play_stream_and_wait(audio_response, description, stop_event)
+
         try:
             # Start playback
             if not self.play_audio_response(audio_response, description):
                 return False
+            self.first_audio_at = time.monotonic()
 
             # Wait for completion with no forced timeout; rely on stop_event or natural completion
             self.logger.info(f"⏱️  Waiting for {description} playback to complete...")
@@ -146,6 +154,57 @@ class AudioPlaybackManager:
             )
             return False
 
+    def _play_stream_and_wait(
+        self,
+        stream: StreamingAudioResponse,
+        description: str,
+        stop_event: Optional[threading.Event] = None,
+    ) -> bool:
+        """
+        Play a segmented TTS stream in order, starting as soon as the first
+        segment is synthesized.
+
+        Args:
+            stream: Ordered stream of synthesized segments
+            description: Description of the audio for logging
+            stop_event: Optional event that interrupts playback when set
+
+        Returns:
+            True if at least one segment was played, False otherwise
+        """
+        played = 0
+        try:
+            for index, segment in enumerate(stream):
+                if stop_event is not None and stop_event.is_set():
+                    stream.cancel()
+                    break
+                if not self.play_audio_response(
+                    segment, f"{description} [segment {index}]"
+                ):
+                    continue
+                if not played:
+                    self.first_audio_at = time.monotonic()
+                played += 1
+                while self.audio_handler.is_playing():
+                    if stop_event is not None and stop_event.is_set():
+                        try:
+                            self.audio_handler.stop_playback()
+                        except Exception:
+                            pass
+                        stream.cancel()
+                        break
+                    time.sleep(0.02)
+
+            self.logger.info(
+                f"✅ {description} stream playback completed ({played} segments)"
+            )
+            return played > 0
+
+        except Exception as e:
+            stream.cancel()
+            self.logger.error(f"❌ Stream playback failed for {description}: {e}")
+            return False
+
     def _extract_audio_data(self, audio_response: Any) -> Optional[bytes]:
         """
         Extract raw audio bytes from any response type.
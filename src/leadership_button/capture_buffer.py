@@ -0,0 +1,113 @@
+"""
+Preallocated capture buffer for microphone recording.
+
+AudioHandler used to append every PyAudio chunk to a list and join the list
+when the button was released, copying the whole utterance at the moment
+latency matters most. CaptureBuffer is one bytearray sized up front from
+max_recording_duration: chunks are written in place (or read straight into
+it via writable()/commit() when the source supports readinto), and view()
+hands out a zero-copy memoryview of the captured audio.
+
+The buffer is a ring: if more audio arrives than it can hold, the oldest
+bytes are overwritten and view() returns the most recent capacity bytes
+(the only case that copies). A new buffer is used per recording because
+the returned view keeps referencing the bytearray.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Union
+
+BYTES_PER_SAMPLE = 2  # LINEAR16
+
+
+def capture_capacity(
+    sample_rate: int, channels: int, max_seconds: float, chunk_frames: int = 0
+) -> int:
+    """Bytes needed for max_seconds of 16-bit audio plus one spare chunk."""
+    frame_bytes = channels * BYTES_PER_SAMPLE
+    frames = int(math.ceil(sample_rate * max_seconds)) + max(chunk_frames, 0)
+    return frames * frame_bytes
+
+
+class CaptureBuffer:
+    """Fixed-size byte ring written in place by the recording thread."""
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capture buffer capacity must be positive")
+        self._buf = bytearray(capacity)
+        self._mv = memoryview(self._buf)
+        self._pos = 0
+        self._wrapped = False
+        # End of valid data once wrapped (< capacity after a writable() wrap)
+        self._limit = capacity
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    def __len__(self) -> int:
+        return self._limit if self._wrapped else self._pos
+
+    @property
+    def overflowed(self) -> bool:
+        """True once older audio has been overwritten."""
+        return self._wrapped
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """Copy data into the ring at the write position."""
+        src = memoryview(data).cast("B")
+        n = len(src)
+        if n >= self.capacity:
+            # Only the newest capacity bytes can be kept
+            self._mv[:] = src[n - self.capacity :]
+            self._pos = 0
+            self._wrapped = True
+            self._limit = self.capacity
+            return n
+        end = self._pos + n
+        if end <= self.capacity:
+            self._mv[self._pos : end] = src
+        else:
+            first = self.capacity - self._pos
+            self._mv[self._pos :] = src[:first]
+            self._mv[: n - first] = src[first:]
+            self._limit = self.capacity
+        self.commit(n)
+        return n
+
+    def writable(self, n: int) -> memoryview:
+        """Contiguous slice to fill in place (readinto); follow with commit().
+
+        Wraps to the start when fewer than n bytes remain before the end.
+        """
+        if n > self.capacity:
+            raise ValueError("Requested slice is larger than the buffer")
+        if self._pos + n > self.capacity:
+            self._limit = self._pos
+            self._wrapped = True
+            self._pos = 0
+        return self._mv[self._pos : self._pos + n]
+
+    def commit(self, n: int) -> None:
+        """Advance the write position past n bytes written via writable()."""
+        self._pos += n
+        if self._pos >= self.capacity:
+            self._pos -= self.capacity
+            self._wrapped = True
+            self._limit = self.capacity
+        elif self._wrapped and self._pos > self._limit:
+            self._limit = self._pos
+
+    def view(self) -> Union[memoryview, bytes]:
+        """Captured audio, oldest first; zero-copy unless the ring wrapped."""
+        if not self._wrapped:
+            return self._mv[: self._pos]
+        return bytes(self._mv[self._pos : self._limit]) + bytes(self._mv[: self._pos])
+
+    def clear(self) -> None:
+        self._pos = 0
+        self._wrapped = False
+        self._limit = self.capacity
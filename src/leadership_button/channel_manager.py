@@ -0,0 +1,221 @@
+"""
+Persistent gRPC channels for the Google Cloud Speech and TTS clients.
+
+Both clients used to build their own default channel, which the server (or a
+home router) drops after a few idle minutes, so the first request after a
+pause paid for a fresh TLS + HTTP/2 handshake. ChannelManager creates every
+channel with one shared set of keepalive options, watches connectivity, pokes
+idle or failed channels back to READY between button presses, and pre-warms
+them when recording starts so the handshake overlaps with the user speaking.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import grpc
+
+    GRPC_AVAILABLE = True
+except ImportError:
+    GRPC_AVAILABLE = False
+    logging.warning("grpcio not available - persistent channels disabled")
+
+DEFAULT_KEEPALIVE_SECONDS = 60
+DEFAULT_KEEPALIVE_TIMEOUT_SECONDS = 20
+DEFAULT_IDLE_CHECK_SECONDS = 30
+MAX_MESSAGE_BYTES = 32 * 1024 * 1024
+# gRPC's connectivity poll re-checks every 0.2s; give it a couple of ticks
+POLL_DRAIN_SECONDS = 0.5
+
+
+def channel_options(
+    keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+    keepalive_timeout_seconds: float = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS,
+) -> List[Tuple[str, Any]]:
+    """gRPC channel arguments shared by every Google Cloud client."""
+    return [
+        ("grpc.keepalive_time_ms", int(keepalive_seconds * 1000)),
+        ("grpc.keepalive_timeout_ms", int(keepalive_timeout_seconds * 1000)),
+        # Ping even when no RPC is active so the connection survives IDLE
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.max_send_message_length", MAX_MESSAGE_BYTES),
+        ("grpc.max_receive_message_length", MAX_MESSAGE_BYTES),
+    ]
+
+
+class ChannelManager:
+    """Owns long-lived gRPC channels and keeps them connected."""
+
+    def __init__(
+        self,
+        keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+        keepalive_timeout_seconds: float = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS,
+        idle_check_seconds: float = DEFAULT_IDLE_CHECK_SECONDS,
+    ):
+        self.options = channel_options(keepalive_seconds, keepalive_timeout_seconds)
+        self.idle_check_seconds = idle_check_seconds
+        self._lock = threading.Lock()
+        self._channels: Dict[str, Any] = {}
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._connecting: Dict[str, Any] = {}
+        self._callbacks: Dict[str, Any] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, performance: Dict[str, Any]) -> "ChannelManager":
+        return cls(
+            keepalive_seconds=performance.get(
+                "grpc_keepalive_seconds", DEFAULT_KEEPALIVE_SECONDS
+            ),
+            keepalive_timeout_seconds=performance.get(
+                "grpc_keepalive_timeout_seconds", DEFAULT_KEEPALIVE_TIMEOUT_SECONDS
+            ),
+            idle_check_seconds=performance.get(
+                "grpc_idle_check_seconds", DEFAULT_IDLE_CHECK_SECONDS
+            ),
+        )
+
+    def create_client(self, name: str, client_cls: Any) -> Any:
+        """Build a Google Cloud client on a managed channel.
+
+        client_cls is a generated GAPIC client (speech.SpeechClient,
+        texttospeech.TextToSpeechClient); credentials come from ADC as usual.
+        """
+        transport_cls = client_cls.get_transport_class("grpc")
+        channel = transport_cls.create_channel(
+            f"{client_cls.DEFAULT_ENDPOINT}:443", options=self.options
+        )
+        self.register(name, channel)
+        return client_cls(transport=transport_cls(channel=channel))
+
+    def register(self, name: str, channel: Any) -> None:
+        """Track an existing channel's connectivity under name."""
+        callback = lambda state: self._on_state(name, state)  # noqa: E731
+        with self._lock:
+            old = self._channels.pop(name, None)
+            old_callback = self._callbacks.pop(name, None)
+            self._channels[name] = channel
+            self._callbacks[name] = callback
+            self._status[name] = {
+                "state": "idle",
+                "ready_at": None,
+                "reconnects": 0,
+            }
+        if old is not None:
+            self._close_channel(old, old_callback)
+        channel.subscribe(callback, try_to_connect=False)
+
+    def _on_state(self, name: str, state: Any) -> None:
+        label = getattr(state, "value", (None, str(state)))[1]
+        with self._lock:
+            status = self._status.get(name)
+            if status is None:
+                return
+            previous = status["state"]
+            status["state"] = label
+            if label == "ready" and previous != "ready":
+                if status["ready_at"] is not None:
+                    status["reconnects"] += 1
+                status["ready_at"] = time.time()
+        logging.debug("🔌 gRPC channel %s: %s -> %s", name, previous, label)
+
+    def prewarm(self) -> None:
+        """Start connecting every channel that is not already READY.
+
+        Non-blocking: the handshake proceeds in gRPC's own threads.
+        """
+        with self._lock:
+            for name, channel in self._channels.items():
+                pending = self._connecting.get(name)
+                if self._status[name]["state"] == "ready":
+                    continue
+                if pending is not None and not pending.done():
+                    continue
+                try:
+                    self._connecting[name] = grpc.channel_ready_future(channel)
+                except Exception as exc:
+                    logging.debug("Channel pre-warm failed for %s: %s", name, exc)
+
+    def start_keepalive(self) -> None:
+        """Reconnect idle or failed channels in the background while idle."""
+        if self._thread is not None or not self._channels:
+            return
+        self._stop.clear()
+
+        def _run():
+            while not self._stop.wait(self.idle_check_seconds):
+                self.prewarm()
+
+        self._thread = threading.Thread(
+            target=_run, name="lb-grpc-keepalive", daemon=True
+        )
+        self._thread.start()
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: dict(status) for name, status in self._status.items()}
+
+    def close(self) -> None:
+        """Stop the keepalive thread and close every channel.
+
+        A pre-warm still connecting keeps gRPC's connectivity polling thread
+        alive, and closing the channel under it raises "Channel closed!" in
+        that thread. Cancel and unsubscribe first, give the poll up to
+        POLL_DRAIN_SECONDS to notice, and leave any channel still being
+        polled to the garbage collector instead of closing it.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        with self._lock:
+            channels = [
+                (channel, self._callbacks.get(name))
+                for name, channel in self._channels.items()
+            ]
+            pending = list(self._connecting.values())
+            self._channels.clear()
+            self._callbacks.clear()
+            self._status.clear()
+            self._connecting.clear()
+        for future in pending:
+            future.cancel()
+        for channel, callback in channels:
+            self._unsubscribe(channel, callback)
+        deadline = time.monotonic() + POLL_DRAIN_SECONDS
+        for channel, _ in channels:
+            while self._poll_in_flight(channel) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            if self._poll_in_flight(channel):
+                logging.debug("gRPC channel still polling; not closing it")
+                continue
+            self._close_channel(channel)
+
+    @staticmethod
+    def _unsubscribe(channel: Any, callback: Any) -> None:
+        try:
+            if callback is not None:
+                channel.unsubscribe(callback)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _poll_in_flight(channel: Any) -> bool:
+        """Whether gRPC's connectivity polling thread still runs on channel."""
+        state = getattr(channel, "_connectivity_state", None)
+        return getattr(state, "polling", False) is True
+
+    @classmethod
+    def _close_channel(cls, channel: Any, callback: Any = None) -> None:
+        # Unsubscribe first so gRPC's polling thread stops before the close
+        cls._unsubscribe(channel, callback)
+        try:
+            channel.close()
+        except Exception:
+            pass
@@ -0,0 +1,59 @@
+"""
+Curated top-100 kid story audio list.
+
+tmp/top100_kid_story_audio.csv feeds two consumers: GeminiFlashProvider
+injects it as the prompt's sound suggestions, and APIManager can use its
+relpaths as an <audio> whitelist. Both are parsed from one read of the file
+and shared through a FileBackedCache, so turns reuse the same immutable
+objects until the file changes on disk.
+"""
+
+from __future__ import annotations
+
+import csv
+from typing import Any, Dict, FrozenSet, NamedTuple, Tuple
+
+from .file_cache import FileBackedCache
+
+TOP100_PATH = "tmp/top100_kid_story_audio.csv"
+
+
+class CuratedAudio(NamedTuple):
+    suggestions: Tuple[Dict[str, Any], ...]
+    whitelist: FrozenSet[str]
+
+
+EMPTY = CuratedAudio((), frozenset())
+
+
+def parse_top100(path: str) -> CuratedAudio:
+    """Build suggestion dicts and the relpath whitelist from the CSV."""
+    suggestions = []
+    whitelist = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            title = row.get("title", "")
+            typ = (row.get("type", "") or "").lower()
+            try:
+                dur = float(row.get("duration_seconds", 0) or 0)
+            except Exception:
+                dur = 0.0
+            rel = row.get("relpath", "") or ""
+            suggestions.append(
+                {
+                    "display_title": title,
+                    "type": typ if typ in ("music", "sfx") else "sfx",
+                    "duration": dur,
+                    "category": row.get("category", "") or "",
+                    "tags": row.get("tags", "") or "",
+                    "filename": rel.split("/")[-1] if rel else title,
+                    "url": row.get("url", "") or "",
+                }
+            )
+            if rel.strip():
+                whitelist.add(rel.strip())
+    return CuratedAudio(tuple(suggestions), frozenset(whitelist))
+
+
+# Shared process-wide; reloads only when the CSV's mtime/size change
+curated_audio = FileBackedCache(TOP100_PATH, parse_top100, default=EMPTY)
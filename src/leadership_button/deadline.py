@@ -0,0 +1,166 @@
+"""
+Deadlines and cooperative cancellation for a conversation turn.
+
+A Deadline is created when a turn starts and handed down through every
+stage. Each stage takes a child deadline with its own budget (capped by the
+parent), converts it into RPC timeouts, and checks it between steps, so one
+slow stage cannot push the whole turn past its latency SLO. Unlike the old
+SIGALRM timer this works on any thread and with sub-second precision.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+# Seconds; overridden by performance.stage_budgets
+DEFAULT_STAGE_BUDGETS: Dict[str, float] = {
+    "turn": 30.0,
+    "stt": 8.0,
+    "intent": 3.0,
+    "llm": 15.0,
+    "tts": 10.0,
+}
+
+# Never hand an RPC a timeout shorter than this; it would fail before it starts
+MIN_RPC_TIMEOUT = 0.05
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an operation runs past its deadline or is cancelled."""
+
+    def __init__(self, operation: str, budget: Optional[float] = None):
+        self.operation = operation
+        self.budget = budget
+        if budget is None:
+            message = f"{operation} cancelled"
+        else:
+            message = f"{operation} timed out after {budget:g} seconds"
+        super().__init__(message)
+
+
+class Deadline:
+    """A point in time by which work must finish, with optional parent.
+
+    A child expires no later than its parent and is cancelled with it.
+    """
+
+    def __init__(
+        self,
+        seconds: Optional[float] = None,
+        name: str = "deadline",
+        parent: Optional["Deadline"] = None,
+        budgets: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.budget = seconds
+        self.parent = parent
+        self.clock = clock
+        self.budgets = dict(
+            budgets if budgets is not None else (parent.budgets if parent else {})
+        )
+        self.started_at = clock()
+        self._expires_at = math.inf if seconds is None else self.started_at + seconds
+        if parent is not None:
+            self._expires_at = min(self._expires_at, parent.expires_at)
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def for_turn(cls, budgets: Optional[Dict[str, float]] = None) -> "Deadline":
+        """Top-level deadline for one conversation turn."""
+        merged = dict(DEFAULT_STAGE_BUDGETS)
+        merged.update(budgets or {})
+        return cls(merged.get("turn"), name="turn", budgets=merged)
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    def stage(self, name: str, seconds: Optional[float] = None) -> "Deadline":
+        """Child deadline for a pipeline stage, budgeted from self.budgets."""
+        if seconds is None:
+            seconds = self.budgets.get(name)
+        return Deadline(seconds, name=name, parent=self, clock=self.clock)
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started_at
+
+    def remaining(self) -> float:
+        """Seconds left (0.0 once expired or cancelled, inf if unbounded)."""
+        if self.cancelled:
+            return 0.0
+        return max(0.0, self._expires_at - self.clock())
+
+    def timeout(self, default: Optional[float] = None) -> Optional[float]:
+        """Remaining time as an RPC/wait timeout; default if unbounded."""
+        remaining = self.remaining()
+        if math.isinf(remaining):
+            return default
+        if default is not None:
+            remaining = min(remaining, default)
+        return max(MIN_RPC_TIMEOUT, remaining)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or (
+            self.parent is not None and self.parent.cancelled
+        )
+
+    def cancel(self) -> None:
+        """Ask cooperating work bound to this deadline (and children) to stop."""
+        self._cancelled.set()
+
+    def expired(self) -> bool:
+        return self.cancelled or self.clock() >= self._expires_at
+
+    def check(self, operation: Optional[str] = None) -> None:
+        """Raise DeadlineExceeded if the deadline passed or was cancelled."""
+        if self.expired():
+            raise DeadlineExceeded(
+                operation or self.name, None if self.cancelled else self.budget
+            )
+
+    def __repr__(self) -> str:
+        remaining = self.remaining()
+        left = "unbounded" if math.isinf(remaining) else f"{remaining:.2f}s left"
+        return f"Deadline({self.name}, {left})"
+
+
+def run_with_deadline(
+    fn: Callable[..., Any],
+    deadline: Union[Deadline, float, None],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Run fn on a worker thread and wait at most until the deadline.
+
+    On expiry the deadline is cancelled (so fn can stop cooperatively if it
+    checks it) and DeadlineExceeded is raised; the worker is abandoned as a
+    daemon thread. Exceptions raised by fn propagate unchanged.
+    """
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline, name=getattr(fn, "__name__", "call"))
+
+    outcome: Dict[str, Any] = {}
+    done = threading.Event()
+
+    def _run() -> None:
+        try:
+            outcome["value"] = fn(*args, **kwargs)
+        except BaseException as exc:  # re-raised on the caller's thread
+            outcome["error"] = exc
+        finally:
+            done.set()
+
+    threading.Thread(
+        target=_run, name=f"lb-deadline-{deadline.name}", daemon=True
+    ).start()
+    if not done.wait(deadline.timeout()):
+        deadline.cancel()
+        raise DeadlineExceeded(deadline.name, deadline.budget)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("value")
@@ -0,0 +1,185 @@
+"""
+Pre-rendered audio for fallback and error responses.
+
+Error paths run exactly when the network is least likely to cooperate, so
+FallbackAudioBank renders every PromptsConfig.FALLBACK_RESPONSES entry ahead of
+time and keeps the LINEAR16 payloads in memory and on disk. Each file is
+tagged with a fingerprint of its text and the voice settings, so edited
+phrases or a new voice are re-rendered while everything else loads instantly
+(and offline) on the next start.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_BANK_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "data",
+    "fallback_audio",
+)
+MANIFEST_NAME = "manifest.json"
+DEFAULT_RESPONSE_TYPE = "general_help"
+
+
+def voice_signature(tts_config: Dict[str, Any], sample_rate: int) -> str:
+    """Serialize the voice settings that change how a phrase sounds."""
+    keys = ("voice_name", "language_code", "speaking_rate", "pitch", "volume_gain_db")
+    values = {k: tts_config.get(k) for k in keys}
+    values["sample_rate"] = int(sample_rate)
+    return json.dumps(values, sort_keys=True)
+
+
+class FallbackAudioBank:
+    """In-memory + on-disk bank of synthesized fallback responses."""
+
+    def __init__(
+        self,
+        synthesize: Callable[[str], Optional[Any]],
+        responses: Dict[str, str],
+        signature: str,
+        sample_rate: int,
+        channels: int = 1,
+        bank_dir: Optional[str] = None,
+    ):
+        self.synthesize = synthesize
+        self.responses = dict(responses)
+        self.signature = signature
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bank_dir = Path(
+            bank_dir or os.getenv("LB_FALLBACK_AUDIO_DIR", DEFAULT_BANK_DIR)
+        )
+        self._lock = threading.Lock()
+        self._audio: Dict[str, Any] = {}
+        self._manifest: Dict[str, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self.ready = threading.Event()
+
+    def fingerprint(self, response_type: str) -> str:
+        text = self.responses[response_type]
+        digest = hashlib.sha256(f"{self.signature}\n{text}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, response_type: str) -> Path:
+        return self.bank_dir / f"{response_type}.wav"
+
+    def _to_audio(self, payload: bytes) -> Any:
+        from .audio_handler import AudioData
+
+        return AudioData(
+            data=payload,
+            format="wav",
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+        )
+
+    def load(self) -> int:
+        """Load every on-disk entry whose fingerprint is still current."""
+        try:
+            with open(self.bank_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+
+        loaded = 0
+        for response_type in self.responses:
+            if manifest.get(response_type) != self.fingerprint(response_type):
+                continue
+            try:
+                payload = self._path(response_type).read_bytes()
+            except OSError:
+                continue
+            with self._lock:
+                self._audio[response_type] = self._to_audio(payload)
+                self._manifest[response_type] = manifest[response_type]
+            loaded += 1
+        if loaded:
+            logging.info(
+                "🛟 Loaded %d/%d fallback responses from %s",
+                loaded,
+                len(self.responses),
+                self.bank_dir,
+            )
+        return loaded
+
+    def missing(self) -> List[str]:
+        with self._lock:
+            return [t for t in self.responses if t not in self._audio]
+
+    def render_missing(self) -> int:
+        """Synthesize and persist every entry not already in the bank."""
+        rendered = 0
+        for response_type in self.missing():
+            try:
+                audio = self.synthesize(self.responses[response_type])
+            except Exception as exc:
+                logging.warning(
+                    "Fallback pre-render failed for %s: %s", response_type, exc
+                )
+                continue
+            payload = getattr(audio, "data", None)
+            if not isinstance(payload, (bytes, bytearray)) or not payload:
+                continue
+            with self._lock:
+                self._audio[response_type] = audio
+                self._manifest[response_type] = self.fingerprint(response_type)
+            self._persist(response_type, bytes(payload))
+            rendered += 1
+        if rendered:
+            logging.info("🛟 Pre-rendered %d fallback responses", rendered)
+        return rendered
+
+    def _persist(self, response_type: str, payload: bytes) -> None:
+        try:
+            self.bank_dir.mkdir(parents=True, exist_ok=True)
+            self._path(response_type).write_bytes(payload)
+            with self._lock:
+                manifest = dict(self._manifest)
+            tmp = self.bank_dir / f"{MANIFEST_NAME}.tmp"
+            tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+            os.replace(tmp, self.bank_dir / MANIFEST_NAME)
+        except OSError as exc:
+            logging.warning(
+                "Failed to persist fallback audio %s: %s", response_type, exc
+            )
+
+    def start(self, render: bool = True) -> None:
+        """Load from disk now and render whatever is missing in the background."""
+        self.load()
+        if not render or not self.missing():
+            self.ready.set()
+            return
+
+        def _run():
+            try:
+                self.render_missing()
+            finally:
+                self.ready.set()
+
+        self._thread = threading.Thread(
+            target=_run, name="lb-fallback-audio", daemon=True
+        )
+        self._thread.start()
+
+    def get(self, response_type: str) -> Optional[Any]:
+        """Return pre-rendered audio for response_type (or the default), if any."""
+        with self._lock:
+            audio = self._audio.get(response_type)
+            if audio is None and response_type not in self.responses:
+                audio = self._audio.get(DEFAULT_RESPONSE_TYPE)
+            return audio
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ready": len(self._audio),
+                "total": len(self.responses),
+                "bank_dir": str(self.bank_dir),
+            }
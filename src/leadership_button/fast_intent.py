@@ -0,0 +1,251 @@
+"""
+Local fast-path intent classification.
+
+FastIntentClassifier returns the same normalized dict as
+IntentAnalyzer._normalize (request, tone, context, pieces) for common
+utterances without a Gemini round trip. Keyword/regex rules handle the
+obvious cases; an optional on-disk model (token weights per request, built
+from logged LLM intents with build_intent_model) covers the rest. Each result
+carries a confidence so IntentAnalyzer can fall back to the LLM when unsure.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+REQUESTS = ("story", "advice", "specific_story")
+
+DEFAULT_MODEL_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "data",
+    "intent_model.json",
+)
+
+TOKEN_RE = re.compile(r"[a-z']+")
+
+# Models trained on fewer logged intents than this are ignored
+MIN_MODEL_DOCUMENTS = 20
+
+# (pattern, request, confidence) — first match wins
+REQUEST_RULES: List[Tuple[re.Pattern, str, float]] = [
+    (
+        re.compile(
+            r"\bstory\s+(?:about|with|where|of|starring)\b"
+            r"|\bstory\b.*\b(?:named|called)\b",
+            re.I,
+        ),
+        "specific_story",
+        0.9,
+    ),
+    (
+        re.compile(
+            r"\b(?:tell|read|make up|give|do|want|hear)\b.*\bstor(?:y|ies)\b"
+            r"|\bbedtime stor(?:y|ies)\b|\bonce upon a time\b",
+            re.I,
+        ),
+        "story",
+        0.9,
+    ),
+    (
+        re.compile(
+            r"\b(?:how (?:do|can|should|could) i|what (?:do|should|can) i"
+            r"|should i|help me|i need help|what if)\b",
+            re.I,
+        ),
+        "advice",
+        0.9,
+    ),
+    (
+        re.compile(
+            r"\b(?:i feel|i'm feeling|i am feeling"
+            r"|i'm (?:sad|scared|worried|nervous|mad)"
+            r"|my (?:friend|friends|sister|brother|team|teacher|class)"
+            r"|why do|is it ok)\b",
+            re.I,
+        ),
+        "advice",
+        0.8,
+    ),
+    (re.compile(r"\bstor(?:y|ies)\b", re.I), "story", 0.7),
+]
+
+TONE_RULES: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"\bdad(?:dy)?\s*(?:mode|joke|jokes)\b", re.I), "dad_mode"),
+    (
+        re.compile(
+            r"\b(?:sad|scared|afraid|upset|worried|nervous|cry|crying|lonely|hurt)\b",
+            re.I,
+        ),
+        "gentle",
+    ),
+    (
+        re.compile(
+            r"\b(?:fun|funny|silly|excited|party|yay|awesome|happy|dance)\b", re.I
+        ),
+        "upbeat",
+    ),
+    (re.compile(r"\b(?:serious|important|really need)\b", re.I), "serious"),
+]
+
+# "story about a brave dragon and a tiny mouse" -> pieces
+ABOUT_RE = re.compile(
+    r"\b(?:about|with|starring|named|called)\s+(.+?)(?:[.!?,]|\bwho\b|\bthat\b|$)",
+    re.I,
+)
+PIECE_SPLIT_RE = re.compile(r"\s*(?:,|\band\b|&)\s*", re.I)
+ARTICLE_RE = re.compile(r"^(?:a|an|the|my|our|some)\s+", re.I)
+NON_NAMES = {"I", "I'm", "I've", "I'll", "Lyra", "Can", "Could", "Please", "Tell"}
+
+
+def _tokens(text: str) -> List[str]:
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def _extract_pieces(utterance: str) -> List[Dict[str, str]]:
+    pieces: List[Dict[str, str]] = []
+    seen = set()
+
+    def _add(name: str) -> None:
+        name = ARTICLE_RE.sub("", name.strip()).strip(" '\"")
+        if name and name.lower() not in seen and len(name) <= 40:
+            seen.add(name.lower())
+            pieces.append({"name": name, "description": ""})
+
+    m = ABOUT_RE.search(utterance)
+    if m:
+        for part in PIECE_SPLIT_RE.split(m.group(1)):
+            _add(part)
+    # Capitalized words after the first one are usually names
+    for i, word in enumerate(utterance.split()):
+        word = word.strip(".,!?\"'")
+        if i and word[:1].isupper() and word not in NON_NAMES:
+            _add(word)
+    return pieces[:8]
+
+
+def _context_sentence(utterance: str) -> str:
+    text = re.sub(r"\s+", " ", utterance or "").strip()
+    first = re.split(r"(?<=[.!?])\s", text, maxsplit=1)[0]
+    return first[:160]
+
+
+class FastIntentClassifier:
+    """Rule- and model-based intent classifier that runs locally."""
+
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path or os.getenv("LB_INTENT_MODEL", DEFAULT_MODEL_PATH)
+        self.model = load_intent_model(self.model_path)
+
+    def classify(self, utterance: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Return (normalized intent dict, confidence); (None, 0.0) if unknown."""
+        text = (utterance or "").strip()
+        if not text:
+            return None, 0.0
+
+        request, confidence = self._rule_request(text)
+        if self.model.get("documents", 0) >= MIN_MODEL_DOCUMENTS:
+            m_request, m_confidence = self._model_request(text)
+            if m_request and m_confidence > confidence:
+                request, confidence = m_request, m_confidence
+        if not request:
+            return None, 0.0
+
+        return (
+            {
+                "request": request,
+                "tone": self._tone(text),
+                "context": _context_sentence(text),
+                "pieces": _extract_pieces(text) if "story" in request else [],
+            },
+            confidence,
+        )
+
+    def _rule_request(self, text: str) -> Tuple[Optional[str], float]:
+        for pattern, request, confidence in REQUEST_RULES:
+            if pattern.search(text):
+                return request, confidence
+        return None, 0.0
+
+    def _tone(self, text: str) -> str:
+        for pattern, tone in TONE_RULES:
+            if pattern.search(text):
+                return tone
+        return "regular"
+
+    def _model_request(self, text: str) -> Tuple[Optional[str], float]:
+        """Multinomial naive Bayes over the model's token log-probabilities."""
+        tokens = _tokens(text)
+        if not tokens:
+            return None, 0.0
+        scores: Dict[str, float] = {}
+        for request, params in self.model.get("requests", {}).items():
+            weights = params.get("log_probs", {})
+            unseen = params.get("unseen_log_prob", -20.0)
+            score = params.get("log_prior", 0.0)
+            for tok in tokens:
+                score += weights.get(tok, unseen)
+            scores[request] = score
+        if len(scores) < 2:
+            return None, 0.0
+        best = max(scores, key=scores.get)
+        top = scores[best]
+        total = sum(math.exp(s - top) for s in scores.values())
+        return best, 1.0 / total
+
+
+def build_intent_model(
+    records: Iterable[Dict[str, Any]], alpha: float = 1.0
+) -> Dict[str, Any]:
+    """Build a naive Bayes token model from {"utterance", "intent"} records."""
+    counts: Dict[str, Counter] = defaultdict(Counter)
+    docs: Counter = Counter()
+    vocab = set()
+    for rec in records:
+        request = str((rec.get("intent") or {}).get("request", "")).lower()
+        if request not in REQUESTS:
+            continue
+        tokens = _tokens(rec.get("utterance", ""))
+        if not tokens:
+            continue
+        docs[request] += 1
+        counts[request].update(tokens)
+        vocab.update(tokens)
+
+    total_docs = sum(docs.values())
+    model: Dict[str, Any] = {"version": 1, "documents": total_docs, "requests": {}}
+    for request, n_docs in docs.items():
+        total = sum(counts[request].values()) + alpha * len(vocab)
+        model["requests"][request] = {
+            "log_prior": math.log(n_docs / total_docs),
+            "unseen_log_prob": math.log(alpha / total),
+            "log_probs": {
+                tok: round(math.log((c + alpha) / total), 4)
+                for tok, c in counts[request].items()
+            },
+        }
+    return model
+
+
+def load_intent_model(path: Optional[str]) -> Dict[str, Any]:
+    """Load a model written by build_intent_model; {} if missing or invalid."""
+    if not path or not Path(path).exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            model = json.load(f)
+        logging.info(
+            "🧠 Loaded intent model from %s (%s documents)",
+            path,
+            model.get("documents", "?"),
+        )
+        return model
+    except Exception as exc:
+        logging.warning("Failed to load intent model %s: %s", path, exc)
+        return {}
@@ -0,0 +1,69 @@
+"""
+Parse-once caches for small files that are read on hot paths.
+
+FileBackedCache wraps a loader function: the first get() parses the file,
+later calls only stat() it and reuse the parsed value until the file's
+mtime or size changes. Loaders should return immutable values (tuples,
+frozensets) since every caller shares the same object.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+# Default that makes get() raise FileNotFoundError for a missing file
+MISSING = object()
+
+
+class FileBackedCache:
+    """A value parsed from a file, reloaded only when the file changes."""
+
+    def __init__(
+        self,
+        path: str,
+        loader: Callable[[str], Any],
+        default: Any = MISSING,
+    ):
+        self.path = str(path)
+        self.loader = loader
+        self.default = default
+        self.loads = 0
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[int, int]] = None
+        self._value: Any = None
+
+    def _stat_key(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def get(self) -> Any:
+        """Current parsed value; the default if the file is missing or broken."""
+        key = self._stat_key()
+        if key is None:
+            if self.default is MISSING:
+                raise FileNotFoundError(f"File not found: {self.path}")
+            return self.default
+        with self._lock:
+            if key != self._key:
+                try:
+                    self._value = self.loader(self.path)
+                except Exception as exc:
+                    # Keep the key so a broken file is not re-parsed every call
+                    logging.warning("Failed to load %s: %s", self.path, exc)
+                    if self.default is MISSING:
+                        raise
+                    self._value = self.default
+                self._key = key
+                self.loads += 1
+            return self._value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._key = None
+            self._value = None
@@ -9,16 +9,22 @@ architecture by requiring API keys to be stored in .env files.
 import logging
 import json
 import os
-from typing import Dict, Optional, Any
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Iterator, Optional, Any, Tuple
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
     retry_if_exception_type,
+    retry_if_not_exception_type,
 )
 
 # Import the AIProvider interface from api_client
 from .api_client import AIProvider
+from .deadline import Deadline, DeadlineExceeded
+from .metrics import metrics
 from .prompts_config import PromptsConfig
 from .intent_analyzer import IntentAnalyzer
 from .sound_suggester import SoundSuggester
@@ -35,6 +41,14 @@ except ImportError:
         "Google Generative AI library not available - Gemini functionality will be limited"
     )
 
+# Intent assumed by speculative generation (matches IntentAnalyzer's failure default)
+DEFAULT_INTENT = {"request": "advice", "tone": "regular", "context": "", "pieces": []}
+
+# Retry transient failures, but never once the turn's deadline has passed
+RETRYABLE = retry_if_exception_type(
+    (ConnectionError, TimeoutError)
+) & retry_if_not_exception_type(DeadlineExceeded)
+
 
 class GeminiFlashProvider(AIProvider):
     """
@@ -79,6 +93,14 @@ class GeminiFlashProvider(AIProvider):
         # No explicit token limit; allow model defaults
         self.max_tokens = None
         self.timeout = self.config.get("timeout", 30)
+        # Start generation with DEFAULT_INTENT while intent analysis runs
+        self.speculative_generation = bool(
+            self.config.get("speculative_generation", False)
+        )
+        # Overlaps intent analysis, sound list and prompt file loading
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="lb-gemini"
+        )
 
         # Initialize the model
         try:
@@ -123,7 +145,8 @@ class GeminiFlashProvider(AIProvider):
 
         Args:
             text: User input text to process
-            context: Additional context for the conversation
+            context: Additional context for the conversation; an optional
+                "deadline" (Deadline) bounds the intent and llm stages
 
         Returns:
             AI-generated leadership coaching response
@@ -137,6 +160,131 @@ class GeminiFlashProvider(AIProvider):
         if not text or not text.strip():
             return PromptsConfig.get_fallback_response("empty_input")
 
+        context = dict(context or {})
+        deadline = context.pop("deadline", None)
+        prompt, speculative = self._build_prompt(
+            text,
+            context,
+            self._make_api_request if self.speculative_generation else None,
+            deadline,
+        )
+
+        try:
+            # Make the API request with retry logic
+            llm = deadline.stage("llm") if deadline is not None else None
+            if speculative is not None:
+                response = speculative.result(timeout=llm.timeout() if llm else None)
+            else:
+                response = self._make_api_request(prompt, llm)
+
+            # Validate and clean the response
+            raw_text = response
+            # Print and log raw AI response text
+            logging.info("📩 AI RAW RESPONSE — BEGIN")
+            for i, line in enumerate((raw_text or "").split("\n"), 1):
+                logging.info("%3d: %s", i, line)
+            logging.info("📩 AI RAW RESPONSE — END")
+            print("\n📩 AI RAW RESPONSE — BEGIN")
+            for i, line in enumerate((raw_text or "").split("\n"), 1):
+                print(f"{i:3d}: {line}")
+            print("📩 AI RAW RESPONSE — END")
+
+            cleaned_response = self._clean_response(raw_text)
+
+            logging.info(
+                "Successfully processed text with Gemini Flash: %s chars -> %s chars",
+                len(text),
+                len(cleaned_response),
+            )
+            return cleaned_response
+
+        except Exception as e:
+            logging.error(f"Failed to process text with Gemini Flash: {e}")
+            # Use centralized fallback response
+            return PromptsConfig.get_fallback_response("connection_error")
+
+    def stream_text(self, text: str, context: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream a leadership coaching response from Gemini Flash chunk by chunk.
+
+        Chunks are yielded as soon as the model produces them so callers can
+        start downstream work (SSML assembly, TTS) before generation finishes.
+        Markdown emphasis is stripped per chunk, matching _clean_response.
+
+        Args:
+            text: User input text to process
+            context: Additional context for the conversation; an optional
+                "deadline" (Deadline) bounds intent analysis, and cancelling
+                it stops the stream
+
+        Yields:
+            Response text chunks; a fallback response if the request fails
+            before any text arrives
+
+        Raises:
+            RuntimeError: If the provider is not available
+        """
+        if not self._is_available:
+            raise RuntimeError("Gemini Flash provider is not available")
+
+        if not text or not text.strip():
+            yield PromptsConfig.get_fallback_response("empty_input")
+            return
+
+        context = dict(context or {})
+        deadline = context.pop("deadline", None)
+        prompt, speculative = self._build_prompt(
+            text,
+            context,
+            self._open_stream if self.speculative_generation else None,
+            deadline,
+        )
+
+        produced = False
+        try:
+            for chunk in self._make_streaming_api_request(
+                prompt, speculative, deadline
+            ):
+                cleaned = chunk.replace("*", "")
+                if cleaned:
+                    produced = True
+                    yield cleaned
+        except Exception as e:
+            logging.error(f"Failed to stream text from Gemini Flash: {e}")
+            if not produced:
+                yield PromptsConfig.get_fallback_response("connection_error")
+            return
+
+        if not produced:
+            logging.warning("Empty streamed response from Gemini Flash")
+            yield PromptsConfig.get_fallback_response("empty_response")
+
+    def _build_prompt(
+        self,
+        text: str,
+        context: Dict[str, Any],
+        speculative_request: Optional[Callable[[str], Any]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[str, Optional[Future]]:
+        """
+        Build the leadership coaching prompt for the given input.
+
+        Intent analysis, the curated sound list and prompt file parsing run
+        concurrently; only the dynamic sound suggestions wait for the intent.
+        If speculative_request is given, it is started with DEFAULT_INTENT
+        before the intent is known and kept only if the real intent renders
+        exactly the same prompt. If the intent is not ready within the deadline's
+        intent budget, DEFAULT_INTENT is used instead.
+
+        Args:
+            text: User input text
+            context: Additional context for the conversation
+            speculative_request: Request function to run speculatively
+            deadline: Turn deadline supplying the intent stage budget
+
+        Returns:
+            Tuple of (complete prompt, speculative request future or None)
+        """
         # 🔍 LOG PROMPT GENERATION DETAILS
         logging.info("=" * 60)
         logging.info("🎯 PROMPT GENERATION STARTED:")
@@ -151,10 +299,40 @@ class GeminiFlashProvider(AIProvider):
         print(f"📝 User: '{text[:100]}{'...' if len(text) > 100 else ''}'")
         print(f"🗂️ Context: {list(context.keys()) if context else 'None'}")
 
+        # Start everything that does not depend on the intent result
+        start = time.monotonic()
+        intent_stage = deadline.stage("intent") if deadline is not None else None
+        intent_future = (
+            self._executor.submit(self.intent_analyzer.analyze, text)
+            if self.intent_analyzer
+            else None
+        )
+        top100_future = self._executor.submit(self._load_kid_top100)
+        self._executor.submit(PromptsConfig.preload_prompts)
+        speculation = (
+            self._start_speculation(text, context, speculative_request)
+            if speculative_request
+            else None
+        )
+
         # Create leadership coaching prompt using centralized config
         intent = None
-        if self.intent_analyzer:
-            intent = self.intent_analyzer.analyze(text)
+        if intent_future is not None:
+            try:
+                intent = intent_future.result(
+                    timeout=intent_stage.timeout() if intent_stage else None
+                )
+                metrics.record("intent", time.monotonic() - start)
+                logging.info(
+                    "⏱️ Intent analysis finished after %.2fs", time.monotonic() - start
+                )
+            except FutureTimeoutError:
+                intent_future.cancel()
+                intent = dict(DEFAULT_INTENT)
+                logging.warning(
+                    "⏱️ Intent analysis exceeded its %.2fs budget; using default intent",
+                    intent_stage.budget or 0.0,
+                )
         if intent:
             # Shallow copy to avoid side effects
             context = dict(context or {})
@@ -169,7 +347,7 @@ class GeminiFlashProvider(AIProvider):
             # Generate sound suggestions and inject
             try:
                 # Prefer curated top-100 list if available
-                top100 = self._load_kid_top100()
+                top100 = top100_future.result()
                 if top100:
                     context["sound_suggestions"] = top100
                     logging.info(
@@ -199,48 +377,73 @@ class GeminiFlashProvider(AIProvider):
         print("📝 FULL PROMPT — END")
 
         print("✅ Generated prompt: {} characters".format(len(prompt)))
+        metrics.record("prompt", time.monotonic() - start)
+        return prompt, self._claim_speculation(speculation, prompt)
+
+    def _start_speculation(
+        self,
+        text: str,
+        context: Dict[str, Any],
+        request: Callable[[str], Any],
+    ) -> Optional[Tuple[Any, Future]]:
+        """
+        Start the main generation early, assuming DEFAULT_INTENT.
 
+        Returns:
+            Tuple of (speculative prompt, request future), or None on failure
+        """
+        spec_context = dict(context or {})
+        spec_context["intent"] = dict(DEFAULT_INTENT)
         try:
-            # Make the API request with retry logic
-            response = self._make_api_request(prompt)
-
-            # Validate and clean the response
-            raw_text = response
-            # Print and log raw AI response text
-            logging.info("📩 AI RAW RESPONSE — BEGIN")
-            for i, line in enumerate((raw_text or "").split("\n"), 1):
-                logging.info("%3d: %s", i, line)
-            logging.info("📩 AI RAW RESPONSE — END")
-            print("\n📩 AI RAW RESPONSE — BEGIN")
-            for i, line in enumerate((raw_text or "").split("\n"), 1):
-                print(f"{i:3d}: {line}")
-            print("📩 AI RAW RESPONSE — END")
-
-            cleaned_response = self._clean_response(raw_text)
-
-            logging.info(
-                "Successfully processed text with Gemini Flash: %s chars -> %s chars",
-                len(text),
-                len(cleaned_response),
-            )
-            return cleaned_response
-
-        except Exception as e:
-            logging.error(f"Failed to process text with Gemini Flash: {e}")
-            # Use centralized fallback response
-            return PromptsConfig.get_fallback_response("connection_error")
+            top100 = self._load_kid_top100()
+            if top100:
+                spec_context["sound_suggestions"] = top100
+            elif self.suggester:
+                spec_context["sound_suggestions"] = self.suggester.suggest(
+                    spec_context["intent"], limit=100
+                )
+            prompt = PromptsConfig.get_leadership_prompt(text, spec_context)
+        except Exception as exc:
+            logging.warning("Speculative prompt failed: %s", exc)
+            return None
+        path = PromptsConfig.resolve_prompt_path(spec_context["intent"])
+        logging.info("🔮 Speculative generation started (%s)", path.name)
+        return prompt, self._executor.submit(request, prompt)
+
+    def _claim_speculation(
+        self, speculation: Optional[Tuple[str, Future]], prompt: str
+    ) -> Optional[Future]:
+        """
+        Keep the speculative request only if it was sent exactly the prompt
+        built from the real intent; any difference (prompt file, tone,
+        context, pieces or sound suggestions) cancels it (an in-flight
+        request is abandoned).
+        """
+        if speculation is None:
+            return None
+        spec_prompt, future = speculation
+        if spec_prompt == prompt:
+            logging.info("🔮 Speculative generation kept")
+            return future
+        future.cancel()
+        logging.info("🔮 Speculative generation discarded (intent changed the prompt)")
+        return None
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ConnectionError, TimeoutError)),
+        retry=RETRYABLE,
     )
-    def _make_api_request(self, prompt: str) -> str:
+    @metrics.timed("llm")
+    def _make_api_request(
+        self, prompt: str, deadline: Optional[Deadline] = None
+    ) -> str:
         """
         Make the actual API request to Gemini Flash.
 
         Args:
             prompt: The complete prompt to send to Gemini
+            deadline: Bounds the request timeout; checked before each attempt
 
         Returns:
             Raw response text from Gemini
@@ -276,13 +479,18 @@ class GeminiFlashProvider(AIProvider):
         print(prompt)
         print("📝 Prompt (full) — END")
 
+        timeout = self.timeout
+        if deadline is not None:
+            deadline.check("Gemini request")
+            timeout = deadline.timeout(self.timeout)
+
         try:
             # Do not set max_output_tokens; allow model to output fully
             response = self.model.generate_content(
                 prompt,
                 generation_config=self.generation_config,
                 safety_settings=self.safety_settings,
-                request_options={"timeout": self.timeout},
+                request_options={"timeout": timeout},
             )
 
             # Check if response was blocked by safety filters
@@ -303,6 +511,82 @@ class GeminiFlashProvider(AIProvider):
             logging.error(f"Gemini API request failed: {e}")
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=RETRYABLE,
+    )
+    def _open_stream(self, prompt: str):
+        """Start a streaming generate_content request (retried on connect errors)."""
+        return self.model.generate_content(
+            prompt,
+            generation_config=self.generation_config,
+            safety_settings=self.safety_settings,
+            request_options={"timeout": self.timeout},
+            stream=True,
+        )
+
+    def _make_streaming_api_request(
+        self,
+        prompt: str,
+        opened: Optional[Future] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[str]:
+        """
+        Make a streaming API request to Gemini Flash.
+
+        Args:
+            prompt: The complete prompt to send to Gemini
+            opened: Future of a stream already opened speculatively
+            deadline: Turn deadline; its llm budget bounds the wait for opened,
+                and the stream stops early once it is cancelled
+
+        Yields:
+            Text of each response chunk as it arrives
+
+        Raises:
+            Exception: If the API request fails
+        """
+        logging.info("🤖 GEMINI STREAMING REQUEST (%d chars)", len(prompt))
+        start = time.monotonic()
+        first = True
+        if opened is not None:
+            # A hung speculative open must not outlive the llm budget
+            llm = deadline.stage("llm") if deadline is not None else None
+            try:
+                responses = opened.result(timeout=llm.timeout() if llm else None)
+            except FutureTimeoutError:
+                opened.cancel()
+                raise
+        else:
+            responses = self._open_stream(prompt)
+        for chunk in responses:
+            if deadline is not None and deadline.cancelled:
+                logging.info("⏹️ Gemini stream cancelled by deadline")
+                return
+            feedback = getattr(chunk, "prompt_feedback", None)
+            if feedback is not None and feedback.block_reason:
+                logging.warning(f"Gemini response blocked: {feedback.block_reason}")
+                yield PromptsConfig.get_fallback_response("safety_blocked")
+                return
+            if not chunk.candidates or not chunk.candidates[0].content.parts:
+                continue
+            piece = "".join(
+                getattr(part, "text", "") or ""
+                for part in chunk.candidates[0].content.parts
+            )
+            if not piece:
+                continue
+            if first:
+                first = False
+                metrics.record("llm_first_chunk", time.monotonic() - start)
+                logging.info(
+                    "⏱️ Gemini first chunk after %.2fs", time.monotonic() - start
+                )
+            yield piece
+        metrics.record("llm", time.monotonic() - start)
+        logging.info("🤖 Gemini stream completed in %.2fs", time.monotonic() - start)
+
     def _clean_response(self, response: str) -> str:
         """
         Clean and validate the Gemini response.
@@ -325,6 +609,10 @@ class GeminiFlashProvider(AIProvider):
         """Get the provider name."""
         return "Gemini Flash"
 
+    def cleanup(self) -> None:
+        """Stop the prompt-building executor, dropping queued work."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def is_available(self) -> bool:
         """Check if the provider is available."""
         return self._is_available and GEMINI_AVAILABLE
@@ -369,43 +657,19 @@ class GeminiFlashProvider(AIProvider):
             "max_tokens": self.max_tokens,
             "timeout": self.timeout,
             "available": self.is_available(),
+            "intent_stats": (
+                self.intent_analyzer.get_stats() if self.intent_analyzer else None
+            ),
+            "suggester": self.suggester.model_status() if self.suggester else None,
         }
 
-    def _load_kid_top100(self):
-        import csv
-        from pathlib import Path
+    def warm_up(self) -> None:
+        """Start deferred background work once the app is idle."""
+        if self.suggester:
+            self.suggester.start_model_load()
 
-        p = Path("tmp/top100_kid_story_audio.csv")
-        if not p.exists():
-            return []
-        out = []
-        try:
-            with p.open("r", encoding="utf-8") as f:
-                r = csv.DictReader(f)
-                for row in r:
-                    # Build suggestion dict
-                    title = row.get("title", "")
-                    typ = (row.get("type", "") or "").lower()
-                    try:
-                        dur = float(row.get("duration_seconds", 0) or 0)
-                    except Exception:
-                        dur = 0.0
-                    rel = row.get("relpath", "") or ""
-                    url = row.get("url", "") or ""
-                    out.append(
-                        {
-                            "display_title": title,
-                            "type": typ if typ in ("music", "sfx") else "sfx",
-                            "duration": dur,
-                            "category": row.get("category", "") or "",
-                            "tags": row.get("tags", "") or "",
-                            "filename": rel.split("/")[-1] if rel else title,
-                            "url": url,
-                        }
-                    )
-        except Exception as exc:
-            import logging
+    def _load_kid_top100(self):
+        """Curated top-100 suggestions (parsed once, reloaded when the file changes)."""
+        from .curated_audio import curated_audio
 
-            logging.warning("Failed to load top100 list: %s", exc)
-            return []
-        return out
+        return curated_audio.get().suggestions
@@ -8,7 +8,11 @@ import json
 import logging
 import os
 import re
-from typing import Any, Dict, List
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .fast_intent import FastIntentClassifier
 
 try:
     import google.generativeai as genai
@@ -30,7 +34,14 @@ INTENT_PROMPT_PATH = os.path.join(
 class IntentAnalyzer:
     """Runs a lightweight intent analysis pass before main prompt generation."""
 
-    def __init__(self, model: str = "gemini-1.5-flash", temperature: float = 0.2):
+    def __init__(
+        self,
+        model: str = "gemini-1.5-flash",
+        temperature: float = 0.2,
+        fast_path: bool = True,
+        fast_threshold: float = 0.8,
+        fast_classifier: Optional[FastIntentClassifier] = None,
+    ):
         if not GEMINI_AVAILABLE:
             raise RuntimeError(
                 "google-generativeai not installed. Install with: pip install google-generativeai"
@@ -44,6 +55,17 @@ class IntentAnalyzer:
         self.model = genai.GenerativeModel(model)
         self.temperature = temperature
 
+        # Local classifier answers confident cases without a Gemini round trip
+        self.fast_threshold = fast_threshold
+        self.fast_classifier = None
+        if fast_path:
+            try:
+                self.fast_classifier = fast_classifier or FastIntentClassifier()
+            except Exception as exc:
+                logging.warning("Fast intent classifier unavailable: %s", exc)
+        self._stats_lock = threading.Lock()
+        self._stats = {"fast_hits": 0, "fast_misses": 0, "llm_calls": 0}
+
         # Preload prompt
         try:
             with open(INTENT_PROMPT_PATH, "r", encoding="utf-8") as f:
@@ -57,6 +79,22 @@ class IntentAnalyzer:
 
     def analyze(self, utterance: str) -> Dict[str, Any]:
         """Return dict with keys: request, tone, context, pieces (list)."""
+        if self.fast_classifier:
+            intent, confidence = self.fast_classifier.classify(utterance)
+            if intent and confidence >= self.fast_threshold:
+                self._count("fast_hits")
+                logging.info(
+                    "⚡ Fast-path intent (confidence=%.2f): %s",
+                    confidence,
+                    json.dumps(intent, ensure_ascii=False),
+                )
+                return intent
+            self._count("fast_misses")
+            logging.info(
+                "⚡ Fast-path intent not confident (%.2f); asking Gemini", confidence
+            )
+        self._count("llm_calls")
+
         prompt = self.intent_prompt_template.replace("{utterance}", utterance)
         logging.info("🔎 Running intent analysis")
         # Log and print the raw intent prompt
@@ -89,7 +127,9 @@ class IntentAnalyzer:
             print("📩 INTENT RAW RESPONSE — END")
             data = self._parse_json(text)
             logging.info("🧭 Intent JSON: %s", json.dumps(data, ensure_ascii=False))
-            return self._normalize(data)
+            intent = self._normalize(data)
+            self._record_intent(utterance, intent)
+            return intent
         except Exception as exc:
             logging.warning("Intent analysis failed: %s", exc)
             return {
@@ -99,6 +139,34 @@ class IntentAnalyzer:
                 "pieces": [],
             }
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Fast-path hit/miss counters and the Gemini round trips they saved."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        fast_total = stats["fast_hits"] + stats["fast_misses"]
+        stats["fast_hit_rate"] = stats["fast_hits"] / fast_total if fast_total else 0.0
+        stats["round_trips_saved"] = stats["fast_hits"]
+        return stats
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def _record_intent(self, utterance: str, intent: Dict[str, Any]) -> None:
+        """Append an LLM-classified intent to the log used to build the local model."""
+        try:
+            base = Path(os.environ.get("LB_LOG_DIR", "logs")) / "intents"
+            base.mkdir(parents=True, exist_ok=True)
+            with (base / "intent_log.jsonl").open("a", encoding="utf-8") as f:
+                f.write(
+                    json.dumps(
+                        {"utterance": utterance, "intent": intent}, ensure_ascii=False
+                    )
+                    + "\n"
+                )
+        except Exception as exc:
+            logging.warning("Failed to record intent: %s", exc)
+
     def _extract_text(self, response: Any) -> str:
         try:
             if response.candidates and response.candidates[0].content.parts:
@@ -12,9 +12,10 @@ import platform
 import logging
 import threading
 import time
+from collections import deque
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Optional
 from datetime import datetime, timezone
 
 # Do NOT import pynput at module import time (headless Pi may lack X)
@@ -24,8 +25,14 @@ HAS_PYNPUT = False
 # Assuming these modules exist and are structured as per the specs
 # These will be placeholder imports if the actual files don't exist yet
 from .api_client import APIManager, APIConfig
+from .audio_encoder import upload_payload
 from .audio_handler import AudioHandler, AudioConfig
 from .audio_playback import AudioPlaybackManager
+from .metrics import metrics
+from .speech_stream import StreamingRecognizer
+
+# Number of recent turn response times kept for get_performance_stats
+RESPONSE_TIMES_KEPT = 100
 
 
 class ApplicationState(Enum):
@@ -65,15 +72,26 @@ class MainLoop:
 
         # New: Event for spacebar state, more thread-safe
         self.spacebar_pressed_event = threading.Event()
+        # Set by a press to cut the reply short; unlike spacebar_pressed_event
+        # it is cleared when the VAD ends an utterance with the button held
+        self.playback_interrupt_event = threading.Event()
+        # Held by whichever of button release / VAD end-of-utterance stops
+        # the recording, so the other one does not stop it twice
+        self._recording_stop_lock = threading.Lock()
         self.keyboard_listener: Optional[Any] = None
         self._keyboard_backend: str = "none"
 
         self.audio_handler: Optional[AudioHandler] = None
         self.api_client: Optional[APIManager] = None
         self.playback_manager: Optional[AudioPlaybackManager] = None
+        # Streaming STT session for the recording in progress (if enabled)
+        self._speech_stream: Optional[StreamingRecognizer] = None
 
         self.start_time = 0.0
-        self.response_times: List[float] = []
+        # Release-to-first-audio latency of recent turns (bounded)
+        self.response_times: Deque[float] = deque(maxlen=RESPONSE_TIMES_KEPT)
+        self._recording_started_at: Optional[float] = None
+        self._turn_started_at: Optional[float] = None
         # Commands log setup
         self._commands_log_dir = Path(os.getenv("LB_LOG_DIR", "logs")) / "commands"
         try:
@@ -108,6 +126,7 @@ class MainLoop:
             # Initialize audio handler for microphone recording
             audio_config = AudioConfig(config.config_data)
             self.audio_handler = AudioHandler(audio_config)
+            self.audio_handler.set_utterance_end_callback(self._on_utterance_end)
             self.logger.info("Audio handler initialized for microphone recording")
 
             # Initialize audio playback manager with centralized config
@@ -138,6 +157,13 @@ class MainLoop:
                 "max_tokens": 150,
                 "timeout": 30,
             }
+            # Allow api_config.json's "gemini" section to override the defaults
+            if self.api_client:
+                overrides = getattr(self.api_client.config, "config_data", {})
+                if isinstance(overrides, dict) and isinstance(
+                    overrides.get("gemini"), dict
+                ):
+                    gemini_config.update(overrides["gemini"])
 
             gemini_provider = GeminiFlashProvider(gemini_config)
 
@@ -151,6 +177,16 @@ class MainLoop:
             self.logger.info("Falling back to Mock AI provider")
             self._setup_mock_ai_provider()
 
+    def _warm_up_provider(self) -> None:
+        """Start the AI provider's deferred background loading, if it has any."""
+        provider = getattr(self.api_client, "ai_provider", None)
+        warm_up = getattr(provider, "warm_up", None)
+        if callable(warm_up):
+            try:
+                warm_up()
+            except Exception as e:
+                self.logger.warning(f"AI provider warm-up failed: {e}")
+
     def _setup_mock_ai_provider(self) -> None:
         """Set up a mock AI provider as fallback."""
 
@@ -195,6 +231,9 @@ class MainLoop:
         print("🎤 HOLD THE SPACEBAR TO RECORD")
         print("Press Ctrl+C to exit.")
 
+        # Now IDLE: heavy optional loads (embedding model) run in the background
+        self._warm_up_provider()
+
         # Block the main thread appropriately so the service stays alive
         if self._keyboard_backend == "pynput" and self.keyboard_listener:
             self.keyboard_listener.join()
@@ -222,6 +261,7 @@ class MainLoop:
     def _cleanup(self) -> None:
         """Cleanup resources and stop background threads."""
         try:
+            self._cancel_speech_stream()
             if self.audio_handler:
                 self.audio_handler.stop_recording()
             if self.api_client:
@@ -327,6 +367,7 @@ class MainLoop:
             self._log_command("button_press", {"backend": self._keyboard_backend})
             if not self.spacebar_pressed_event.is_set():
                 self.spacebar_pressed_event.set()
+                self.playback_interrupt_event.set()
                 try:
                     if self.playback_manager:
                         self.playback_manager.stop_playback()
@@ -358,9 +399,32 @@ class MainLoop:
         if is_space_or_enter:
             if self.spacebar_pressed_event.is_set():
                 self.spacebar_pressed_event.clear()
+                self.playback_interrupt_event.clear()
                 self._log_command("button_release", {"backend": self._keyboard_backend})
-                if self.current_state == ApplicationState.RECORDING:
-                    self._handle_spacebar_release()
+                self._stop_recording_once()
+
+    def _on_utterance_end(self) -> None:
+        """VAD heard the speaker go quiet: stop as if the button was released.
+
+        Runs on the capture thread, which stop_recording() joins, so the
+        turn is handed to a thread of its own. The button may still be
+        held; that press must not interrupt the reply it asked for.
+        """
+        self.playback_interrupt_event.clear()
+        self._log_command("utterance_end", {})
+        threading.Thread(
+            target=self._stop_recording_once, name="lb-utterance-end", daemon=True
+        ).start()
+
+    def _stop_recording_once(self) -> None:
+        """Stop the current recording unless another path already is."""
+        if not self._recording_stop_lock.acquire(blocking=False):
+            return
+        try:
+            if self.current_state == ApplicationState.RECORDING:
+                self._handle_spacebar_release()
+        finally:
+            self._recording_stop_lock.release()
 
     def _handle_spacebar_press(self) -> None:
         """Handle spacebar press event."""
@@ -375,7 +439,12 @@ class MainLoop:
 
         try:
             self._transition_state(ApplicationState.RECORDING)
+            self._recording_started_at = time.monotonic()
             self._log_command("recording_start_requested", {})
+            # Reconnect gRPC channels while the user is still talking
+            if self.api_client:
+                self.api_client.prewarm_connections()
+            self._start_speech_stream()
             self.audio_handler.start_recording()
             self.logger.info("Recording started")
             self._log_command(
@@ -404,6 +473,12 @@ class MainLoop:
 
         try:
             self._transition_state(ApplicationState.PROCESSING)
+            self._turn_started_at = time.monotonic()
+            if self._recording_started_at is not None:
+                metrics.record(
+                    "record", self._turn_started_at - self._recording_started_at
+                )
+                self._recording_started_at = None
             self._log_command("recording_stop_requested", {})
             # The test will mock _handle_recording_complete, so this call is fine.
             # The error is in the subsequent calls.
@@ -419,16 +494,75 @@ class MainLoop:
                         "channels": getattr(audio_data, "channels", None),
                     },
                 )
-                self._handle_recording_complete(audio_data.data)
+                transcript = self._finish_speech_stream()
+                self._handle_recording_complete(upload_payload(audio_data), transcript)
             else:
+                self._cancel_speech_stream()
                 self.logger.error("No audio data from recording, returning to idle.")
                 self._log_command("recording_stopped", {"bytes": 0})
                 self._transition_state(ApplicationState.IDLE)
         except Exception as e:
+            self._cancel_speech_stream()
             self._handle_error(e)
 
-    def _handle_recording_complete(self, audio_data: bytes) -> None:
-        """Process completed recording."""
+    def _start_speech_stream(self) -> None:
+        """Open a streaming STT session and feed it chunks while the button is held."""
+        self._speech_stream = None
+        if not self.api_client:
+            return
+        try:
+            session = self.api_client.start_speech_stream()
+        except Exception as e:
+            self.logger.warning(f"Streaming recognition unavailable: {e}")
+            return
+        if not isinstance(session, StreamingRecognizer):
+            return
+        self._speech_stream = session
+        self.audio_handler.set_chunk_callback(session.feed)
+        self._log_command("speech_stream_started", {})
+
+    def _finish_speech_stream(self) -> Optional[str]:
+        """Close the streaming STT session and return its transcript, if any."""
+        session, self._speech_stream = self._speech_stream, None
+        if session is None:
+            return None
+        self.audio_handler.set_chunk_callback(None)
+        try:
+            with metrics.span("stt"):
+                result = session.finish()
+        except Exception as e:
+            self.logger.warning(f"Streaming recognition failed: {e}")
+            return None
+        text = result.text if result else None
+        self._log_command(
+            "speech_stream_finished",
+            {
+                "chars": len(text) if text else 0,
+                "latency": getattr(result, "processing_time", None),
+            },
+        )
+        if not text:
+            self.logger.info("No streaming transcript; falling back to batch STT")
+        return text
+
+    def _cancel_speech_stream(self) -> None:
+        """Abandon the streaming STT session, if one is open."""
+        session, self._speech_stream = self._speech_stream, None
+        if session is None:
+            return
+        try:
+            self.audio_handler.set_chunk_callback(None)
+            session.cancel()
+        except Exception:
+            pass
+
+    def _handle_recording_complete(
+        self, audio_data: Any, transcript: Optional[str] = None
+    ) -> None:
+        """Process completed recording (with a streaming transcript, if available).
+
+        audio_data is raw PCM bytes or an EncodedAudio compressed for upload.
+        """
         if self.current_state != ApplicationState.PROCESSING:
             self.logger.warning(
                 f"Recording complete ignored in state {self.current_state}"
@@ -447,7 +581,12 @@ class MainLoop:
 
         try:
             self.logger.info("Sending audio to API for processing...")
-            response = self.api_client.process_conversation_turn(audio_data)
+            if transcript:
+                response = self.api_client.process_conversation_turn(
+                    audio_data, transcript=transcript
+                )
+            else:
+                response = self.api_client.process_conversation_turn(audio_data)
             self._handle_api_response(response)
         except Exception as e:
             self.logger.error(f"Failed to process audio: {e}")
@@ -473,13 +612,33 @@ class MainLoop:
             self._transition_state(ApplicationState.SPEAKING)
             # Pass the full response object to preserve AudioData sample rate info
             # DO NOT extract .data - that loses the sample rate information!
+            play_started = time.monotonic()
             self.playback_manager.play_audio_and_wait(
-                response, "api_response", stop_event=self.spacebar_pressed_event
+                response, "api_response", stop_event=self.playback_interrupt_event
             )
+            self._record_turn_metrics(play_started)
             self._handle_audio_complete()
         except Exception as e:
             self._handle_error(e)
 
+    def _record_turn_metrics(self, play_started: float) -> None:
+        """Record first-audio, playback and whole-turn latency, then dump them."""
+        ended = time.monotonic()
+        first_audio = getattr(self.playback_manager, "first_audio_at", None)
+        if not isinstance(first_audio, float):
+            first_audio = play_started
+        metrics.record("playback", ended - first_audio)
+        turn_started, self._turn_started_at = self._turn_started_at, None
+        if turn_started is not None:
+            response_time = first_audio - turn_started
+            self.response_times.append(response_time)
+            metrics.record("first_audio", response_time)
+            metrics.record("turn", ended - turn_started)
+            self.logger.info(
+                f"⏱️ Response time (release → first audio): {response_time:.2f}s"
+            )
+        metrics.dump()
+
     def _handle_audio_complete(self) -> None:
         """Handle audio playback completion."""
         if self.current_state != ApplicationState.SPEAKING:
@@ -579,5 +738,6 @@ class MainLoop:
             "uptime": uptime,
             "current_state": self.get_state().value,
             "average_response_time": avg_response_time,
-            "response_times": self.response_times,
+            "response_times": list(self.response_times),
+            "latency": metrics.snapshot(),
         }
@@ -0,0 +1,200 @@
+"""
+Per-stage latency metrics for conversation turns.
+
+Every stage of a turn (record -> STT -> intent -> suggest -> prompt -> LLM ->
+SSML rewrite -> TTS -> first audio -> playback end) reports its duration to a
+LatencyHistogram. Histograms use fixed logarithmic buckets, so memory stays
+constant no matter how long the device runs, while p50/p95/p99 remain within
+one bucket width (~19%) of the true value. Snapshots feed
+MainLoop.get_performance_stats, the status screen, and a JSON dump under
+logs/metrics/latency.json.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Canonical stage order for reports; other names are accepted and listed after
+STAGES = (
+    "record",
+    "stt",
+    "intent",
+    "suggest",
+    "prompt",
+    "llm",
+    "ssml_rewrite",
+    "tts",
+    "first_audio",
+    "playback",
+    "turn",
+)
+
+# Bucket i covers [MIN_SECONDS * GROWTH**(i-1), MIN_SECONDS * GROWTH**i)
+MIN_SECONDS = 0.001
+GROWTH = 2**0.25
+BUCKETS = 84  # up to ~2000 s
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """Fixed-memory, log-bucketed histogram of durations in seconds."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: List[int] = [0] * (BUCKETS + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.last = 0.0
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        if seconds < MIN_SECONDS:
+            return 0
+        index = int(math.log(seconds / MIN_SECONDS, GROWTH)) + 1
+        return min(index, BUCKETS)
+
+    def record(self, seconds: float) -> None:
+        seconds = max(0.0, float(seconds))
+        with self._lock:
+            self.counts[self._bucket(seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            self.min = min(self.min, seconds)
+            self.max = max(self.max, seconds)
+            self.last = seconds
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile (0-100); 0.0 when empty."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(self.count * q / 100.0))
+            seen = 0
+            for index, n in enumerate(self.counts):
+                seen += n
+                if seen >= rank:
+                    break
+            if index == 0:
+                estimate = MIN_SECONDS / 2
+            else:
+                # Geometric midpoint of the bucket
+                estimate = MIN_SECONDS * GROWTH ** (index - 0.5)
+            return min(max(estimate, self.min), self.max)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self.count, self.total
+            low = self.min if count else 0.0
+            high, last = self.max, self.last
+        snap = {
+            "count": count,
+            "mean": total / count if count else 0.0,
+            "min": low,
+            "max": high,
+            "last": last,
+        }
+        for q in PERCENTILES:
+            snap[f"p{q}"] = self.percentile(q)
+        return snap
+
+
+class MetricsRegistry:
+    """Named latency histograms shared by the whole application."""
+
+    def __init__(self, dump_path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self.dump_path = dump_path
+
+    def histogram(self, stage: str) -> LatencyHistogram:
+        with self._lock:
+            hist = self._histograms.get(stage)
+            if hist is None:
+                hist = self._histograms[stage] = LatencyHistogram()
+            return hist
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.histogram(stage).record(seconds)
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block (recorded even if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str) -> Callable:
+        """Decorator form of span()."""
+
+        def decorator(fn: Callable) -> Callable:
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(stage):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Stage -> summary, canonical stages first."""
+        with self._lock:
+            names = list(self._histograms)
+        ordered = [s for s in STAGES if s in names]
+        ordered += sorted(n for n in names if n not in STAGES)
+        return {name: self.histogram(name).snapshot() for name in ordered}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def dump(self, path: Optional[str] = None) -> Optional[Path]:
+        """Write the snapshot as JSON (atomically); returns the path written."""
+        target = Path(
+            path
+            or self.dump_path
+            or Path(os.getenv("LB_LOG_DIR", "logs")) / "metrics" / "latency.json"
+        )
+        payload = {
+            "generated_at": time.time(),
+            "unit": "seconds",
+            "stages": self.snapshot(),
+        }
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(target.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp, target)
+            return target
+        except OSError as exc:
+            logging.warning("Failed to write latency metrics to %s: %s", target, exc)
+            return None
+
+
+def format_report(snapshot: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Human-readable lines (milliseconds) for a registry snapshot."""
+    lines = []
+    for stage, s in snapshot.items():
+        lines.append(
+            f"{stage:<13} n={s['count']:<5} p50={s['p50'] * 1000:8.1f}ms "
+            f"p95={s['p95'] * 1000:8.1f}ms p99={s['p99'] * 1000:8.1f}ms"
+        )
+    return lines
+
+
+# Global registry instance
+metrics = MetricsRegistry()
@@ -6,10 +6,13 @@ throughout the leadership coaching application. Centralizing these ensures
 consistency and makes it easy to update coaching approaches.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import os
+import threading
 from pathlib import Path
 
+from .file_cache import FileBackedCache
+
 
 def _resolve_prompts_dir() -> str:
     """Resolve the absolute path to the prompts directory robustly.
@@ -53,15 +56,33 @@ ADVICE_PROMPT_PATH = str(Path(PROMPTS_DIR) / "advice_prompt.md")
 UNKNOWN_PROMPT_PATH = str(Path(PROMPTS_DIR) / "unknown_prompt.md")
 
 
+# Parsed prompt files keyed by path, invalidated when mtime/size change
+_PROMPT_CACHE: Dict[str, FileBackedCache] = {}
+_PROMPT_CACHE_LOCK = threading.Lock()
+
+
 def _load_prompt_from_md(path: str) -> Dict[str, Any]:
+    """Load and parse a prompt markdown file, reusing the parse while unchanged."""
+    md_path = Path(path)
+    with _PROMPT_CACHE_LOCK:
+        cache = _PROMPT_CACHE.get(str(md_path))
+        if cache is None:
+            cache = _PROMPT_CACHE[str(md_path)] = FileBackedCache(
+                str(md_path), lambda p: _parse_prompt_md(Path(p))
+            )
+    try:
+        md = cache.get()
+    except FileNotFoundError:
+        # Hard error per user instruction
+        raise FileNotFoundError(f"Prompt file not found: {md_path}")
+    return {**md, "guidelines": list(md["guidelines"])}
+
+
+def _parse_prompt_md(md_path: Path) -> Dict[str, Any]:
     role = ""
     context = ""
     guidelines: List[str] = []
     raw_text = ""
-    md_path = Path(path)
-    if not md_path.exists():
-        # Hard error per user instruction
-        raise FileNotFoundError(f"Prompt file not found: {md_path}")
     try:
         with md_path.open("r", encoding="utf-8") as f:
             section = None
@@ -196,6 +217,49 @@ User: {user_text}
         }
     }
 
+    @classmethod
+    def resolve_prompt_path(cls, intent: Optional[Dict[str, Any]]) -> Path:
+        """
+        Choose the prompt file for an intent (story, advice or unknown).
+
+        Args:
+            intent: Intent dict from IntentAnalyzer (may be None or empty)
+
+        Returns:
+            Path to the prompt markdown file
+        """
+        # Re-resolve PROMPTS_DIR at runtime in case environment changed
+        prompts_dir = Path(_resolve_prompts_dir())
+
+        req = str((intent or {}).get("request", "")).lower().strip()
+        if req == "story":
+            return prompts_dir / "story_prompt.md"
+        if req == "advice":
+            return prompts_dir / "advice_prompt.md"
+        # Prefer unknown_prompt, fallback to unkown_prompt typo if needed
+        unknown_path = prompts_dir / "unknown_prompt.md"
+        if not unknown_path.exists():
+            typo_path = prompts_dir / "unkown_prompt.md"
+            return typo_path if typo_path.exists() else unknown_path
+        return unknown_path
+
+    @classmethod
+    def preload_prompts(cls) -> int:
+        """
+        Parse every prompt file into the cache ahead of time.
+
+        Returns:
+            Number of prompt files loaded
+        """
+        loaded = 0
+        for request in ("story", "advice", "unknown"):
+            try:
+                _load_prompt_from_md(str(cls.resolve_prompt_path({"request": request})))
+                loaded += 1
+            except FileNotFoundError:
+                pass
+        return loaded
+
     @classmethod
     def get_leadership_prompt(cls, user_text: str, context: Dict[str, Any]) -> str:
         """
@@ -217,24 +281,10 @@ User: {user_text}
         logging.info(f"📝 User Text: '{user_text}'")
         logging.info(f"🗂️ Context: {context}")
 
-        # Re-resolve PROMPTS_DIR at runtime in case environment changed
-        prompts_dir = Path(_resolve_prompts_dir())
-
         # Select prompt file based on intent.request
         intent = context.get("intent", {}) if isinstance(context, dict) else {}
         req = str(intent.get("request", "")).lower().strip()
-        if req == "story":
-            chosen = prompts_dir / "story_prompt.md"
-        elif req == "advice":
-            chosen = prompts_dir / "advice_prompt.md"
-        else:
-            # Prefer unknown_prompt, fallback to unkown_prompt typo if needed
-            unknown_path = prompts_dir / "unknown_prompt.md"
-            if not unknown_path.exists():
-                typo_path = prompts_dir / "unkown_prompt.md"
-                chosen = typo_path if typo_path.exists() else unknown_path
-            else:
-                chosen = unknown_path
+        chosen = cls.resolve_prompt_path(intent)
 
         logging.info(f"📄 Using prompt file: {chosen}")
         md = _load_prompt_from_md(str(chosen))  # will raise if missing
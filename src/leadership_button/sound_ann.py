@@ -0,0 +1,149 @@
+"""
+Approximate nearest-neighbour index over the sound library embeddings.
+
+The lexical prefilter only surfaces rows that share tokens with the intent,
+so semantically close sounds with different wording are never reranked.
+IVFIndex is an inverted-file index in pure NumPy: spherical k-means splits
+the unit-length row embeddings into ~sqrt(n) lists, and a query scans only
+the rows in its n_probe closest lists. Lists are stored as one row-id array
+ordered by list plus offsets, so a search is a small matmul against the
+centroids followed by one against the probed rows.
+
+The index is saved as <sidecar>.ivf.npz next to the embeddings sidecar and
+is only as fresh as the matrix it was built from; SoundSuggester rebuilds
+it when the row-aligned matrix changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+KMEANS_ITERATIONS = 8
+# Rows sampled to train the centroids; assignment always uses every row
+TRAIN_SAMPLE = 20000
+
+
+class IVFIndex:
+    """Inverted lists over unit-length row vectors (cosine = dot product)."""
+
+    def __init__(self, centroids: Any, order: Any, offsets: Any, n_rows: int):
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.order = np.asarray(order, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.n_rows = int(n_rows)
+
+    @property
+    def n_lists(self) -> int:
+        return int(self.centroids.shape[0])
+
+    @property
+    def dim(self) -> int:
+        return int(self.centroids.shape[1])
+
+    @classmethod
+    def build(
+        cls, matrix: Any, n_lists: Optional[int] = None, seed: int = 0
+    ) -> "IVFIndex":
+        """Cluster the non-zero rows of matrix with spherical k-means."""
+        start = time.time()
+        matrix = np.asarray(matrix, dtype=np.float32)
+        n_rows = matrix.shape[0]
+        present = np.flatnonzero(matrix.any(axis=1))
+        if n_lists is None:
+            n_lists = int(np.sqrt(len(present))) or 1
+        n_lists = max(1, min(n_lists, len(present) or 1))
+        rng = np.random.default_rng(seed)
+
+        train = present
+        if len(train) > TRAIN_SAMPLE:
+            train = rng.choice(train, TRAIN_SAMPLE, replace=False)
+        vectors = matrix[train]
+        if len(vectors):
+            centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)]
+        else:
+            centroids = np.zeros((n_lists, matrix.shape[1]), dtype=np.float32)
+        for _ in range(KMEANS_ITERATIONS if len(vectors) else 0):
+            assign = np.argmax(vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, vectors)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # An empty list keeps its previous centroid
+            filled = norms[:, 0] > 0
+            centroids[filled] = sums[filled] / norms[filled]
+
+        if len(present):
+            assign = np.argmax(matrix[present] @ centroids.T, axis=1)
+        else:
+            assign = np.zeros(0, dtype=np.int64)
+        by_list = np.argsort(assign, kind="stable")
+        order = present[by_list]
+        offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(assign, minlength=n_lists)))
+        )
+        index = cls(centroids, order, offsets, n_rows)
+        LOGGER.info(
+            "IVF index: %d rows in %d lists (%.1fms)",
+            len(order),
+            n_lists,
+            (time.time() - start) * 1000.0,
+        )
+        return index
+
+    def search(
+        self, matrix: Any, query: Any, k: int, n_probe: int = 8
+    ) -> Tuple[Any, Any]:
+        """Row ids and cosine scores of the (approximate) top-k rows."""
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0 or query.shape[0] != self.dim or not len(self.order):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        query = query / norm
+        n_probe = min(max(1, n_probe), self.n_lists)
+        nearest = np.argsort(-(self.centroids @ query), kind="stable")[:n_probe]
+        rows = np.concatenate(
+            [self.order[self.offsets[c] : self.offsets[c + 1]] for c in nearest]
+        )
+        scores = np.asarray(matrix[rows], dtype=np.float32) @ query
+        if len(rows) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return rows[top], scores[top]
+
+    def save(self, path: str) -> None:
+        tmp = path + ".tmp.npz"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez(
+            tmp,
+            format_version=FORMAT_VERSION,
+            n_rows=self.n_rows,
+            centroids=self.centroids,
+            order=self.order,
+            offsets=self.offsets,
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["IVFIndex"]:
+        """Saved index, or None if missing, unreadable or another format."""
+        try:
+            with np.load(path) as data:
+                if int(data["format_version"]) != FORMAT_VERSION:
+                    return None
+                return cls(
+                    data["centroids"],
+                    data["order"],
+                    data["offsets"],
+                    int(data["n_rows"]),
+                )
+        except Exception:
+            return None
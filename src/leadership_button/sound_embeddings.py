@@ -0,0 +1,190 @@
+"""
+Binary sidecar for the sound library embeddings.
+
+The sidecar used to be a parquet file with one JSON-encoded vector per row,
+parsed with iterrows() + json.loads on every start. It is now two files
+sharing a base name:
+
+    soundlibrary_embeddings.npy   float32 (rows, dim), unit-length rows
+    soundlibrary_embeddings.json  header: format_version, model, dim, rows,
+                                  library_sha256, filenames, built_at
+
+The .npy is memory-mapped, so loading is a JSON parse plus an mmap and the
+process holds one contiguous array. Row i belongs to filenames[i]; when the
+header's library hash matches the current library snapshot the rows are
+already aligned, otherwise they are realigned by filename. A legacy parquet
+sidecar with the same base name is migrated on first load.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+
+def sidecar_paths(path: str) -> Tuple[str, str]:
+    """(.npy, .json) paths for a sidecar path given with any extension."""
+    base = os.path.splitext(str(path))[0]
+    return base + ".npy", base + ".json"
+
+
+def legacy_parquet_path(path: str) -> str:
+    return os.path.splitext(str(path))[0] + ".parquet"
+
+
+def normalize_rows(matrix: Any) -> Any:
+    """Unit-length float32 rows; all-zero rows (no embedding) stay zero."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+class EmbeddingSidecar:
+    """Unit-length embeddings for a list of library filenames."""
+
+    def __init__(
+        self,
+        vectors: Any,
+        filenames: Sequence[str],
+        model: str,
+        library_hash: Optional[str] = None,
+    ):
+        self.vectors = vectors
+        self.filenames = list(filenames)
+        self.model = model
+        self.library_hash = library_hash
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    @classmethod
+    def open(cls, path: str) -> Optional["EmbeddingSidecar"]:
+        """Memory-map a binary sidecar; None if missing or inconsistent."""
+        npy_path, header_path = sidecar_paths(path)
+        try:
+            with open(header_path, "r", encoding="utf-8") as f:
+                header = json.load(f)
+            if header.get("format_version") != FORMAT_VERSION:
+                return None
+            vectors = np.load(npy_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        filenames = header.get("filenames") or []
+        if vectors.dtype != np.float32 or vectors.shape != (
+            len(filenames),
+            header.get("dim"),
+        ):
+            LOGGER.warning("Embedding sidecar %s does not match its header", npy_path)
+            return None
+        return cls(
+            vectors, filenames, header.get("model", ""), header.get("library_sha256")
+        )
+
+    @classmethod
+    def from_parquet(cls, path: str) -> Optional["EmbeddingSidecar"]:
+        """Read a legacy parquet sidecar (filename, JSON embedding, model)."""
+        try:
+            import pandas as pd  # type: ignore
+
+            df = pd.read_parquet(path)
+        except Exception as exc:
+            LOGGER.warning("Failed to read parquet sidecar %s: %s", path, exc)
+            return None
+        if "filename" not in df.columns or "embedding" not in df.columns:
+            return None
+        filenames: List[str] = []
+        vectors: List[List[float]] = []
+        for fn, emb in zip(df["filename"].tolist(), df["embedding"].tolist()):
+            try:
+                vec = json.loads(emb)
+            except Exception:
+                continue
+            if vec and (not vectors or len(vec) == len(vectors[0])):
+                filenames.append(str(fn))
+                vectors.append(vec)
+        if not vectors:
+            return None
+        model = str(df["model"].iloc[0]) if "model" in df.columns else ""
+        return cls(normalize_rows(vectors), filenames, model)
+
+    def save(self, path: str) -> None:
+        """Write the .npy then the header, each via an atomic rename."""
+        npy_path, header_path = sidecar_paths(path)
+        os.makedirs(os.path.dirname(npy_path) or ".", exist_ok=True)
+        header = {
+            "format_version": FORMAT_VERSION,
+            "model": self.model,
+            "dim": self.dim,
+            "rows": len(self.filenames),
+            "library_sha256": self.library_hash,
+            "built_at": time.time(),
+            "filenames": self.filenames,
+        }
+        np.save(npy_path + ".tmp.npy", np.ascontiguousarray(self.vectors, np.float32))
+        os.replace(npy_path + ".tmp.npy", npy_path)
+        with open(header_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(header, f, ensure_ascii=False)
+        os.replace(header_path + ".tmp", header_path)
+
+    def aligned(
+        self, filenames: Sequence[str], library_hash: Optional[str] = None
+    ) -> Any:
+        """Vectors in the order of filenames; unknown filenames get zero rows.
+
+        Returns the memory-mapped array itself when the sidecar was built
+        for the same library (or the same filename order).
+        """
+        same_library = library_hash is not None and library_hash == self.library_hash
+        if len(filenames) == len(self.filenames) and (
+            same_library or list(filenames) == self.filenames
+        ):
+            return self.vectors
+        positions: Dict[str, int] = {}
+        for i, fn in enumerate(self.filenames):
+            positions.setdefault(fn, i)
+        src = [positions.get(fn, -1) for fn in filenames]
+        rows = np.asarray(src, dtype=np.int64)
+        matrix = np.zeros((len(src), self.dim), dtype=np.float32)
+        found = rows >= 0
+        matrix[found] = self.vectors[rows[found]]
+        return matrix
+
+
+def load_sidecar(path: str) -> Optional[EmbeddingSidecar]:
+    """Binary sidecar at path, migrating a legacy parquet sidecar if needed."""
+    sidecar = EmbeddingSidecar.open(path)
+    if sidecar is not None:
+        return sidecar
+    parquet = legacy_parquet_path(path)
+    if not os.path.exists(parquet):
+        return None
+    start = time.time()
+    sidecar = EmbeddingSidecar.from_parquet(parquet)
+    if sidecar is None:
+        return None
+    try:
+        sidecar.save(path)
+        LOGGER.info(
+            "🔄 Migrated %d embeddings from %s to %s (%.1fms)",
+            len(sidecar),
+            parquet,
+            sidecar_paths(path)[0],
+            (time.time() - start) * 1000.0,
+        )
+    except Exception as exc:
+        LOGGER.warning("Failed writing binary sidecar: %s", exc)
+    return sidecar
@@ -0,0 +1,226 @@
+"""
+Prebuilt lookup index for resolving SSML <audio src="..."> tokens.
+
+The LLM refers to sounds by loose tokens ("feeling_paper", "Rain Light.ogg",
+a kit title or tag). SoundURLIndex resolves them against the sound library
+without touching disk after it is built:
+
+- an exact hash of normalized keys (filename stem, kit title, tags),
+- a trigram inverted index for the "one key contains the other" partial
+  match, so candidates come from posting-list intersections rather than a
+  scan over every key,
+- a filename map for the last-resort filename match.
+
+The index is built once per library (from the compiled SoundLibrary
+snapshot) and shared process-wide through get_sound_url_index().
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+DEFAULT_CSV_PATH = "helpers/soundscripts/data/soundlibrary.csv"
+GCS_BASE_URL = "https://storage.googleapis.com/cwsounds/"
+PUBLIC_SOUNDS_ANCHOR = "/public/sounds/"
+
+EXTENSION_RE = re.compile(r"\.[a-z0-9]+$")
+NON_KEY_CHARS_RE = re.compile(r"[^a-z0-9_]+")
+UNDERSCORES_RE = re.compile(r"_+")
+
+GRAM = 3
+
+
+def normalize_key(s: str) -> str:
+    """Lower-case, drop the extension and reduce to [a-z0-9_] words."""
+    s = (s or "").strip().lower()
+    s = EXTENSION_RE.sub("", s)
+    s = s.replace("-", "_").replace(" ", "_")
+    s = NON_KEY_CHARS_RE.sub("_", s)
+    return UNDERSCORES_RE.sub("_", s).strip("_")
+
+
+def path_url(row: Dict[str, Any]) -> str:
+    """GCS URL derived from file_path (relative to public/sounds) or filename."""
+    file_path = (row.get("file_path") or "").strip().replace("\\", "/")
+    rel_path = (row.get("filename") or "").strip()
+    i = file_path.lower().find(PUBLIC_SOUNDS_ANCHOR)
+    if i != -1:
+        rel_path = file_path[i + len(PUBLIC_SOUNDS_ANCHOR) :]
+    return f"{GCS_BASE_URL}{quote(rel_path, safe='/')}"
+
+
+def row_url(row: Dict[str, Any]) -> str:
+    """The row's google_cloud_url, or one derived from its file path."""
+    url = (row.get("google_cloud_url") or "").strip()
+    if url or not (row.get("filename") or "").strip():
+        return url
+    return path_url(row)
+
+
+def _grams(key: str) -> Set[str]:
+    return {key[i : i + GRAM] for i in range(len(key) - GRAM + 1)}
+
+
+class _TrigramIndex:
+    """Find keys that contain, or are contained in, a query string."""
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self._gram_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._short: List[int] = []  # keys too short to have a trigram
+
+    def add(self, key: str) -> int:
+        key_id = len(self.keys)
+        self.keys.append(key)
+        grams = _grams(key)
+        self._gram_counts.append(len(grams))
+        if not grams:
+            self._short.append(key_id)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(key_id)
+        return key_id
+
+    def first_match(
+        self, queries: Iterable[str], both_ways: bool = True
+    ) -> Optional[int]:
+        """Lowest key id k with q in k (or k in q if both_ways) for any query."""
+        best: Optional[int] = None
+        for query in queries:
+            if not query:
+                continue
+            for key_id in self._candidates(query, both_ways):
+                if best is not None and key_id >= best:
+                    continue
+                key = self.keys[key_id]
+                if query in key or (both_ways and key in query):
+                    best = key_id
+        return best
+
+    def _candidates(self, query: str, both_ways: bool) -> Iterable[int]:
+        grams = _grams(query)
+        if not grams:
+            # Query shorter than a trigram: any key may contain it
+            return range(len(self.keys))
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        # query in key: the key has every query gram
+        found = [key_id for key_id, n in shared.items() if n == len(grams)]
+        if both_ways:
+            # key in query: every key gram is one of the query's; keys shorter
+            # than a trigram can only be checked directly
+            found += self._short
+            found += [
+                key_id for key_id, n in shared.items() if n == self._gram_counts[key_id]
+            ]
+        return found
+
+
+class SoundURLIndex:
+    """Exact, partial and filename lookups from sound tokens to URLs."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()):
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self._partial = _TrigramIndex()
+        self._filenames: Dict[str, str] = {}
+        self._filename_urls: List[Tuple[str, str]] = []
+        self._filename_index = _TrigramIndex()
+        for row in rows:
+            self.add_row(row)
+
+    @classmethod
+    def from_library(cls, library: Any) -> "SoundURLIndex":
+        """Build from a SoundLibrary snapshot using its precomputed columns."""
+        index = cls()
+        rows = library.rows()
+        keys = library.split_column("_keys")
+        urls = library.column("_index_url")
+        file_urls = library.column("_url")
+        for i, row in enumerate(rows):
+            index.add_row(row, keys=keys[i], url=urls[i], file_url=file_urls[i])
+        logging.info("📚 Built sound URL index with %d keys", len(index))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add_row(
+        self,
+        row: Dict[str, Any],
+        keys: Optional[Iterable[str]] = None,
+        url: Optional[str] = None,
+        file_url: Optional[str] = None,
+    ) -> None:
+        """Index one library row; keys/url/file_url may be precomputed."""
+        filename = str(row.get("filename") or "").strip()
+        entry = {
+            "url": row_url(row) if url is None else url,
+            "filename": filename,
+            "source_directory": str(row.get("source_directory") or "").strip().lower(),
+        }
+        if keys is None:
+            raw = [filename, str(row.get("kit_title") or "")]
+            raw += str(row.get("kit_tags") or "").split(",")
+            keys = [normalize_key(k) for k in raw if k.strip()]
+        for key in keys:
+            if key and key not in self.entries:
+                self.entries[key] = entry
+                self._partial.add(key)
+        if filename:
+            lowered = filename.lower()
+            url = path_url(row) if file_url is None else file_url
+            self._filenames.setdefault(lowered, url)
+            self._filename_urls.append((lowered, url))
+            self._filename_index.add(normalize_key(lowered))
+
+    def resolve(self, token: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return (url, matched_key) for a src token, or (None, None).
+
+        Tries, in order: an exact key, the extension-less stem, the first key
+        containing (or contained in) the token, then the library filenames.
+        """
+        tok = token.strip()
+        key = normalize_key(tok)
+        if key in self.entries:
+            return self.entries[key]["url"], key
+        stem = normalize_key(EXTENSION_RE.sub("", tok))
+        if stem in self.entries:
+            return self.entries[stem]["url"], stem
+        if key:
+            key_id = self._partial.first_match((key, stem))
+            if key_id is not None:
+                matched = self._partial.keys[key_id]
+                return self.entries[matched]["url"], matched
+        tok_lower = tok.lower()
+        if tok_lower in self._filenames:
+            return self._filenames[tok_lower], tok_lower
+        if stem:
+            key_id = self._filename_index.first_match((stem,), both_ways=False)
+            if key_id is not None:
+                lowered, url = self._filename_urls[key_id]
+                return url, lowered
+        return None, None
+
+
+_indexes: Dict[str, SoundURLIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_sound_url_index(csv_path: str = DEFAULT_CSV_PATH) -> SoundURLIndex:
+    """Process-wide SoundURLIndex for csv_path, built on first use."""
+    key = os.path.abspath(csv_path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            from .sound_library import get_sound_library
+
+            library = get_sound_library(csv_path)
+            index = _indexes[key] = SoundURLIndex.from_library(library)
+        return index
@@ -0,0 +1,448 @@
+"""
+Compiled, memory-mapped snapshot of the sound library CSV.
+
+soundlibrary.csv used to be parsed separately by every consumer (pandas in
+SoundSuggester, csv.DictReader for the SSML src index). compile_snapshot()
+turns it into one binary file next to the CSV:
+
+    b"LBSNDLIB" | uint32 header length | JSON header | 8-byte aligned columns
+
+The header records the format version, byte order, row count, column layout,
+the source CSV's size/mtime/sha256 and a hash of the derivation code.
+Numeric columns are raw float64 or int64 arrays; text columns are a uint32
+offset array into a UTF-8 blob.
+Derived columns (prefixed "_") carry normalized lookup keys, resolved GCS
+URLs and the suggester's token sets, so nothing is re-derived at startup.
+Loading is an mmap plus a JSON header parse; strings decode on access.
+
+get_sound_library() returns the process-wide instance, rebuilding the
+snapshot from the CSV when it is missing or stale: the CSV changed, or the
+functions that fill the derived columns (_derived and the sound_suggester /
+sound_index helpers it calls) did.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import inspect
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from .sound_index import DEFAULT_CSV_PATH, normalize_key, path_url, row_url
+
+MAGIC = b"LBSNDLIB"
+FORMAT_VERSION = 2
+SNAPSHOT_SUFFIX = ".snapshot"
+ALIGN = 8
+
+# Separator for multi-valued derived columns (never appears in keys or terms)
+LIST_SEP = "\x1f"
+
+# Always stored as text, even when every value happens to look numeric
+TEXT_COLUMNS = {
+    "filename",
+    "file_path",
+    "google_cloud_url",
+    "source_directory",
+    "audio_type",
+    "kit_title",
+    "kit_category",
+    "kit_tags",
+    "kit_description",
+}
+
+DERIVED_COLUMNS = ("_keys", "_url", "_index_url", "_terms", "_sim_terms")
+
+_TYPECODES = {"f8": "d", "i8": "q"}
+_INT64_LIMIT = 2**63
+
+_derivation_hash: Optional[str] = None
+
+
+def default_snapshot_path(csv_path: str) -> Path:
+    return Path(csv_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def source_fingerprint(csv_path: str, with_hash: bool = True) -> Dict[str, Any]:
+    """Size, mtime and (optionally) sha256 of the source CSV."""
+    st = os.stat(csv_path)
+    info: Dict[str, Any] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(csv_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        info["sha256"] = digest.hexdigest()
+    return info
+
+
+def _code_fingerprint(func: Callable[..., Any]) -> str:
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        # No source on disk (e.g. a .pyc-only install): fall back to bytecode
+        code = func.__code__
+        return repr((code.co_code, code.co_consts, code.co_names))
+
+
+def derivation_hash() -> str:
+    """sha256 of the code and constants behind the derived columns.
+
+    Stored in the snapshot header and checked by is_current(), so changing a
+    tokenizer or URL helper recompiles snapshots instead of serving stale
+    keys and terms (FORMAT_VERSION only covers the binary layout).
+    """
+    global _derivation_hash
+    if _derivation_hash is None:
+        from . import sound_index, sound_suggester
+
+        funcs = (
+            _derived,
+            sound_suggester._safe_lower,
+            sound_suggester._tokens,
+            sound_suggester._filename_tokens,
+            sound_index.normalize_key,
+            sound_index.path_url,
+            sound_index.row_url,
+        )
+        parts = [_code_fingerprint(f) for f in funcs]
+        parts += [
+            repr(sorted(sound_suggester.STOPWORDS)),
+            sound_index.GCS_BASE_URL,
+            sound_index.PUBLIC_SOUNDS_ANCHOR,
+            sound_index.EXTENSION_RE.pattern,
+            sound_index.NON_KEY_CHARS_RE.pattern,
+            sound_index.UNDERSCORES_RE.pattern,
+            LIST_SEP,
+        ]
+        digest = hashlib.sha256("\0".join(parts).encode("utf-8"))
+        _derivation_hash = digest.hexdigest()
+    return _derivation_hash
+
+
+def _infer_type(name: str, values: Sequence[str]) -> str:
+    if name in TEXT_COLUMNS:
+        return "str"
+    present = [v for v in values if v.strip()]
+    if not present:
+        return "str"
+    if len(present) == len(values):
+        try:
+            if all(abs(int(v)) < _INT64_LIMIT for v in present):
+                return "i8"
+        except ValueError:
+            pass
+    try:
+        for v in present:
+            float(v)
+    except ValueError:
+        return "str"
+    return "f8"
+
+
+def _derived(row: Dict[str, str]) -> Dict[str, str]:
+    from .sound_suggester import _filename_tokens, _tokens
+
+    filename = (row.get("filename") or "").strip()
+    keys = [filename, (row.get("kit_title") or "").strip()]
+    keys += (row.get("kit_tags") or "").split(",")
+    normalized = []
+    for key in keys:
+        key = normalize_key(key) if key.strip() else ""
+        if key and key not in normalized:
+            normalized.append(key)
+
+    title = (row.get("kit_title") or "").lower()
+    tags = (row.get("kit_tags") or "").lower()
+    cat = (row.get("kit_category") or "").lower()
+    terms = set(_tokens(title)) | set(_filename_tokens(filename.lower()))
+    terms |= set(_tokens(tags))
+    if cat:
+        terms.add(cat)
+    # MMR similarity terms, as SoundSuggester._sim_features builds them
+    sim_terms = set(_tokens(row.get("kit_tags") or ""))
+    sim_terms |= set(_filename_tokens(row.get("filename") or ""))
+    return {
+        "_keys": LIST_SEP.join(normalized),
+        "_url": path_url(row),
+        "_index_url": row_url(row),
+        "_terms": LIST_SEP.join(sorted(terms)),
+        "_sim_terms": LIST_SEP.join(sorted(sim_terms)),
+    }
+
+
+def encode_snapshot(
+    rows: Sequence[Dict[str, Any]], source: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """Serialize CSV rows (str values) into snapshot bytes."""
+    names: List[str] = []
+    for row in rows:
+        for name in row:
+            if name is not None and name not in names:
+                names.append(name)
+    text = {n: [str(row.get(n) or "") for row in rows] for n in names}
+    derived = [_derived(text_row) for text_row in _text_rows(text, len(rows))]
+    for name in DERIVED_COLUMNS:
+        text[name] = [d[name] for d in derived]
+
+    columns: List[Dict[str, Any]] = []
+    chunks: List[bytes] = []
+    offset = 0
+
+    def _append(data: bytes) -> int:
+        nonlocal offset
+        start = offset
+        pad = -len(data) % ALIGN
+        chunks.append(data + b"\0" * pad)
+        offset += len(data) + pad
+        return start
+
+    for name in names + list(DERIVED_COLUMNS):
+        values = text[name]
+        kind = "str" if name.startswith("_") else _infer_type(name, values)
+        column: Dict[str, Any] = {"name": name, "type": kind}
+        if kind == "f8":
+            floats = [float(v) if v.strip() else math.nan for v in values]
+            column["offset"] = _append(struct.pack(f"={len(floats)}d", *floats))
+        elif kind == "i8":
+            ints = [int(v) for v in values]
+            column["offset"] = _append(struct.pack(f"={len(ints)}q", *ints))
+        else:
+            encoded = [v.encode("utf-8") for v in values]
+            ends = [0]
+            for blob in encoded:
+                ends.append(ends[-1] + len(blob))
+            column["offset"] = _append(struct.pack(f"={len(ends)}I", *ends))
+            column["blob_offset"] = _append(b"".join(encoded))
+        columns.append(column)
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": len(rows),
+        "csv_columns": names,
+        "columns": columns,
+        "source": source or {},
+        "derivation": derivation_hash(),
+        "built_at": time.time(),
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix_len = len(MAGIC) + 4 + len(header_bytes)
+    pad = -prefix_len % ALIGN
+    return b"".join(
+        [
+            MAGIC,
+            struct.pack("<I", len(header_bytes) + pad),
+            header_bytes,
+            b" " * pad,
+        ]
+        + chunks
+    )
+
+
+def _text_rows(text: Dict[str, List[str]], n: int) -> Iterator[Dict[str, str]]:
+    for i in range(n):
+        yield {name: values[i] for name, values in text.items()}
+
+
+class _StringColumn:
+    """Lazily decoded view over a text column."""
+
+    def __init__(self, ends: memoryview, blob: memoryview):
+        self._ends = ends
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._ends) - 1
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        return str(self._blob[self._ends[i] : self._ends[i + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        blob = self._blob
+        ends = self._ends.tolist()
+        for start, end in zip(ends, ends[1:]):
+            yield str(blob[start:end], "utf-8")
+
+
+class SoundLibrary:
+    """Read-only columnar view over a snapshot buffer."""
+
+    def __init__(self, buffer: Any, path: Optional[Path] = None):
+        view = memoryview(buffer)
+        if bytes(view[: len(MAGIC)]) != MAGIC:
+            raise ValueError("not a sound library snapshot")
+        (header_len,) = struct.unpack_from("<I", view, len(MAGIC))
+        start = len(MAGIC) + 4
+        self.header: Dict[str, Any] = json.loads(
+            bytes(view[start : start + header_len])
+        )
+        if self.header.get("format_version") != FORMAT_VERSION:
+            raise ValueError("unsupported snapshot version")
+        if self.header.get("byteorder") != sys.byteorder:
+            raise ValueError("snapshot byte order does not match this machine")
+        self.path = path
+        self._buffer = buffer
+        self._data = view[start + header_len :]
+        self._columns = {c["name"]: c for c in self.header["columns"]}
+        self._cache: Dict[str, Any] = {}
+        self._rows: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[Dict[str, Any]], source: Optional[Dict[str, Any]] = None
+    ) -> "SoundLibrary":
+        return cls(encode_snapshot(rows, source))
+
+    @classmethod
+    def open(cls, path: Path) -> "SoundLibrary":
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path=Path(path))
+
+    def __len__(self) -> int:
+        return int(self.header["rows"])
+
+    @property
+    def csv_columns(self) -> List[str]:
+        return list(self.header["csv_columns"])
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Column values: a typed memoryview for numbers, lazy strings for text."""
+        cached = self._cache.get(name)
+        if cached is not None:
+            return cached
+        meta = self._columns[name]
+        n = len(self)
+        if meta["type"] in _TYPECODES:
+            size = 8 * n
+            raw = self._data[meta["offset"] : meta["offset"] + size]
+            values: Any = raw.cast(_TYPECODES[meta["type"]])
+        else:
+            ends = self._data[meta["offset"] : meta["offset"] + 4 * (n + 1)]
+            ends = ends.cast("I")
+            blob_start = meta["blob_offset"]
+            blob = self._data[blob_start : blob_start + ends[n]]
+            values = _StringColumn(ends, blob)
+        self._cache[name] = values
+        return values
+
+    def split_column(self, name: str) -> List[List[str]]:
+        """Decode a multi-valued derived column (_keys, _terms, _sim_terms)."""
+        return [value.split(LIST_SEP) if value else [] for value in self.column(name)]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """CSV rows as dicts (built once); missing numbers become ""."""
+        if self._rows is None:
+            names = self.csv_columns
+            columns = []
+            for name in names:
+                values = self.column(name)
+                if self._columns[name]["type"] == "f8":
+                    values = ["" if math.isnan(v) else v for v in values.tolist()]
+                elif self._columns[name]["type"] == "i8":
+                    values = values.tolist()
+                else:
+                    values = list(values)
+                columns.append(values)
+            self._rows = [dict(zip(names, values)) for values in zip(*columns)]
+        return self._rows
+
+    def is_current(self, csv_path: str) -> bool:
+        """Whether this snapshot matches csv_path's content and derivation code."""
+        source = self.header.get("source") or {}
+        try:
+            quick = source_fingerprint(csv_path, with_hash=False)
+        except OSError:
+            # No CSV to compare against (e.g. a deployed snapshot): trust it
+            return True
+        if self.header.get("derivation") != derivation_hash():
+            return False
+        if all(source.get(k) == v for k, v in quick.items()):
+            return True
+        return source.get("sha256") == source_fingerprint(csv_path)["sha256"]
+
+    def save(self, path: Path) -> None:
+        """Write the snapshot atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(bytes(memoryview(self._buffer)))
+        os.replace(tmp, path)
+
+
+def read_csv_rows(csv_path: str) -> List[Dict[str, str]]:
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        return [{k: (v or "") for k, v in row.items()} for row in csv.DictReader(f)]
+
+
+def compile_snapshot(
+    csv_path: str = DEFAULT_CSV_PATH, snapshot_path: Optional[str] = None
+) -> SoundLibrary:
+    """Compile csv_path into its snapshot file and return the library."""
+    rows = read_csv_rows(csv_path)
+    library = SoundLibrary.from_rows(rows, source_fingerprint(csv_path))
+    library.save(Path(snapshot_path or default_snapshot_path(csv_path)))
+    return library
+
+
+def load_sound_library(
+    csv_path: str = DEFAULT_CSV_PATH, snapshot_path: Optional[str] = None
+) -> SoundLibrary:
+    """Open the snapshot for csv_path, recompiling it if missing or stale.
+
+    Falls back to parsing the CSV in memory when the snapshot cannot be
+    written, and to an empty library when neither source is readable.
+    """
+    snap = Path(snapshot_path or default_snapshot_path(csv_path))
+    if snap.exists():
+        try:
+            library = SoundLibrary.open(snap)
+            if library.is_current(csv_path):
+                return library
+            logging.info("🔁 Sound library snapshot is stale; recompiling")
+        except (OSError, ValueError) as exc:
+            logging.warning("Ignoring unreadable sound library snapshot: %s", exc)
+
+    try:
+        rows = read_csv_rows(csv_path)
+        source = source_fingerprint(csv_path)
+    except Exception as exc:
+        logging.error("Failed to read CSV %s: %s", csv_path, exc)
+        return SoundLibrary.from_rows([])
+    library = SoundLibrary.from_rows(rows, source)
+    if rows and os.path.isfile(csv_path):
+        try:
+            library.save(snap)
+            logging.info(
+                "📦 Compiled sound library snapshot (%d rows) %s", len(rows), snap
+            )
+        except OSError as exc:
+            logging.warning("Could not write sound library snapshot: %s", exc)
+    return library
+
+
+_libraries: Dict[str, SoundLibrary] = {}
+_libraries_lock = threading.Lock()
+
+
+def get_sound_library(csv_path: str = DEFAULT_CSV_PATH) -> SoundLibrary:
+    """Process-wide SoundLibrary for csv_path, loaded on first use."""
+    key = os.path.abspath(csv_path)
+    with _libraries_lock:
+        library = _libraries.get(key)
+        if library is None:
+            library = _libraries[key] = load_sound_library(csv_path)
+        return library
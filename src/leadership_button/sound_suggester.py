@@ -2,19 +2,23 @@
 Sound and Music Suggestion Engine
 
 Select up to N sound/music files that best match an utterance intent.
-- Stateless per request; reads CSV on init; optional sidecar embeddings file
-- Fast lexical prefilter + optional embedding rerank + diversity (MMR)
+- Stateless per request; reads the compiled library snapshot on init;
+  optional binary sidecar of row-aligned float32 embeddings
+- Fast lexical prefilter (+ ANN semantic candidates when embeddings exist)
+  + optional embedding rerank + diversity (MMR)
 """
 
 from __future__ import annotations
 
 import os
 import re
-import json
 import time
 import logging
+import threading
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .metrics import metrics
+
 try:
     import numpy as np
 
@@ -23,8 +27,6 @@ except Exception:
     NUMPY_AVAILABLE = False
 
 # Optional deps; guarded (we import where used)
-PANDAS_AVAILABLE = True
-
 try:
     from sentence_transformers import SentenceTransformer
 
@@ -43,7 +45,7 @@ LOGGER = logging.getLogger(__name__)
 
 
 DEFAULT_CSV_PATH = "helpers/soundscripts/data/soundlibrary.csv"
-DEFAULT_SIDECAR_PATH = "helpers/soundscripts/data/soundlibrary_embeddings.parquet"
+DEFAULT_SIDECAR_PATH = "helpers/soundscripts/data/soundlibrary_embeddings.npy"
 DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 
 # Minimal denylist for safety
@@ -83,6 +85,18 @@ STOPWORDS = {
 
 ALLOWED_AUDIO_EXTENSIONS = {".mp3", ".ogg"}
 
+# Lexical prefilter limits
+PREFILTER_KEEP = 300
+FUZZY_QUERY_TERMS = 6
+FUZZY_CACHE_SIZE = 512
+
+# Rows embedded per model.encode call when filling the embedding matrix
+EMBED_BATCH_SIZE = 64
+
+# Semantic (ANN) candidates merged with the lexical prefilter
+ANN_CANDIDATES = 100
+ANN_PROBES = 8
+
 
 def _safe_lower(s: Any) -> str:
     return str(s).lower() if s is not None else ""
@@ -116,16 +130,105 @@ def _jaccard(a: Iterable[str], b: Iterable[str]) -> float:
     return len(sa & sb) / float(len(sa | sb))
 
 
-def _cosine(a: Any, b: Any) -> float:
-    if not NUMPY_AVAILABLE:
-        return 0.0
-    va = np.asarray(a, dtype=np.float32)
-    vb = np.asarray(b, dtype=np.float32)
-    na = np.linalg.norm(va)
-    nb = np.linalg.norm(vb)
-    if na == 0.0 or nb == 0.0:
-        return 0.0
-    return float(np.dot(va, vb) / (na * nb))
+def _term_csr(terms: Iterable[Iterable[str]]) -> Tuple[Any, Any]:
+    """CSR (ptr, ids) arrays of per-row term ids."""
+    vocab: Dict[str, int] = {}
+    ids: List[int] = []
+    ptr = [0]
+    for row_terms in terms:
+        ids.extend(vocab.setdefault(t, len(vocab)) for t in row_terms)
+        ptr.append(len(ids))
+    return np.asarray(ptr, dtype=np.int64), np.asarray(ids, dtype=np.int64)
+
+
+def _category_ids(categories: Iterable[str]) -> Any:
+    ids: Dict[str, int] = {}
+    return np.asarray([ids.setdefault(c, len(ids)) for c in categories], np.int64)
+
+
+class _LexicalFeatures:
+    """Per-row prefilter and MMR features, computed once per library.
+
+    Row terms are stored as a token -> rows inverted index (the CSC form of
+    a sparse row x token matrix), so a query's term overlap for every row is
+    one bincount over the postings of its tokens. The extension, safety and
+    duration gates are folded into a single boolean eligibility mask. The
+    MMR similarity terms (tags + filename) are kept as CSR term ids, with a
+    category id per row.
+    """
+
+    def __init__(
+        self,
+        terms: List[Iterable[str]],
+        eligible: Any,
+        sim_terms: List[Iterable[str]],
+        categories: List[str],
+    ):
+        vocab: Dict[str, int] = {}
+        token_ids: List[int] = []
+        counts: List[int] = []
+        for row_terms in terms:
+            before = len(token_ids)
+            for term in row_terms:
+                token_ids.append(vocab.setdefault(term, len(vocab)))
+            counts.append(len(token_ids) - before)
+        self.n_rows = len(counts)
+        self.vocab = vocab
+        self.tokens = list(vocab)
+        ids = np.asarray(token_ids, dtype=np.int64)
+        rows = np.repeat(np.arange(self.n_rows, dtype=np.int64), counts)
+        order = np.argsort(ids, kind="stable")
+        self.token_rows = rows[order]
+        self.token_ptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(ids, minlength=len(vocab))))
+        )
+        self.eligible = eligible
+        self._fuzzy: Dict[str, Any] = {}
+        self.sim_ptr, self.sim_ids = _term_csr(sim_terms)
+        self.cat_ids = _category_ids(categories)
+
+    def sim_rows(self, rows: Any) -> Tuple[Any, Any, Any]:
+        """(ptr, term ids, category ids) of the MMR features of rows."""
+        starts = self.sim_ptr[rows]
+        lengths = self.sim_ptr[rows + 1] - starts
+        ptr = np.concatenate(([0], np.cumsum(lengths)))
+        gather = np.repeat(starts - ptr[:-1], lengths) + np.arange(ptr[-1])
+        return ptr, self.sim_ids[gather], self.cat_ids[rows]
+
+    def postings(self, token_ids: Iterable[int]) -> Any:
+        parts = [
+            self.token_rows[self.token_ptr[i] : self.token_ptr[i + 1]]
+            for i in token_ids
+        ]
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(parts)
+
+    def overlap(self, terms: Iterable[str]) -> Any:
+        """Number of query terms present in each row."""
+        ids = [self.vocab[t] for t in set(terms) if t in self.vocab]
+        return np.bincount(self.postings(ids), minlength=self.n_rows)
+
+    def fuzzy_hits(self, term: str) -> Any:
+        """Boolean mask of rows with a token that partially matches term."""
+        hits = self._fuzzy.get(term)
+        if hits is None:
+            matched = [
+                i for i, tok in enumerate(self.tokens) if _fuzzy_match(term, tok)
+            ]
+            hits = np.zeros(self.n_rows, dtype=bool)
+            hits[self.postings(matched)] = True
+            if len(self._fuzzy) >= FUZZY_CACHE_SIZE:
+                self._fuzzy.clear()
+            self._fuzzy[term] = hits
+        return hits
+
+
+def _fuzzy_match(term: str, token: str) -> bool:
+    try:
+        return partial_ratio(term, token) >= 90
+    except Exception:
+        return False
 
 
 class SoundSuggester:
@@ -138,16 +241,38 @@ class SoundSuggester:
         self.csv_path = csv_path
         self.sidecar_path = sidecar_path
         self.embedding_model_name = embedding_model_name
-        self.rows: List[Dict[str, Any]] = self._load_csv_rows(csv_path)
-        self.embeddings_index: Dict[str, Any] = self._load_sidecar(sidecar_path)
-        self.model = self._load_model(embedding_model_name) if ST_AVAILABLE else None
+        self._library = None
+        self._features: Optional[_LexicalFeatures] = None
+        self._embeddings: Optional[Any] = None
+        self._ann = None
+        self.rows = self._load_csv_rows(csv_path)
+        # The embedding model is loaded later (start_model_load / load_model);
+        # until then suggest() ranks lexically
+        self.model = None
+        self._model_state = "not_loaded" if ST_AVAILABLE else "unavailable"
+        self._model_load_seconds: Optional[float] = None
+        self._model_lock = threading.Lock()
+        self._model_thread: Optional[threading.Thread] = None
         LOGGER.info(
-            "SoundSuggester initialized: rows=%d, sidecar=%s, model=%s",
+            "SoundSuggester initialized: rows=%d, model=%s",
             len(self.rows),
-            "loaded" if self.embeddings_index else "none",
-            embedding_model_name if self.model else "none",
+            self._model_state,
         )
 
+    @property
+    def rows(self) -> List[Dict[str, Any]]:
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows: List[Dict[str, Any]]) -> None:
+        # Replacing the rows (e.g. in tests) rebuilds the prefilter features
+        self._rows = rows
+        self._row_ids = {id(r): i for i, r in enumerate(rows)}
+        self._features = self._build_features(rows) if NUMPY_AVAILABLE else None
+        # Realigned to the new rows on the next rerank
+        self._embeddings = None
+        self._ann = None
+
     # ---------- Public API ----------
     def suggest(self, intent: Dict[str, Any], limit: int = 20) -> List[Dict[str, Any]]:
         start = time.time()
@@ -155,97 +280,287 @@ class SoundSuggester:
 
         # Prefilter
         candidates = self._prefilter(self.rows, palette_terms)
+        # Semantic candidates the lexical prefilter has no overlap with
+        query_vec = self._query_vector(query_text)
+        semantic = self._merge_candidates(
+            candidates, self._semantic_candidates(query_vec)
+        )
         # Rerank
-        ranked = self._rerank(candidates, query_text, palette_terms)
+        ranked = self._rerank(
+            candidates, query_text, palette_terms, query_vec=query_vec
+        )
         # Select with diversity and quotas
         picks = self._select_diverse(ranked, target_music, target_sfx, limit)
+        metrics.record("suggest", time.time() - start)
         LOGGER.info(
-            "SoundSuggester: intent terms=%d candidates=%d picks=%d (%.2fms)",
+            "SoundSuggester: intent terms=%d candidates=%d (+%d semantic) "
+            "picks=%d (%.2fms)",
             len(palette_terms),
-            len(candidates),
+            len(candidates) - semantic,
+            semantic,
             len(picks),
             (time.time() - start) * 1000.0,
         )
         return picks
 
+    def start_model_load(self) -> bool:
+        """Load the embedding model on a background thread (once)."""
+        with self._model_lock:
+            if self._model_state != "not_loaded":
+                return False
+            self._model_state = "loading"
+            self._model_thread = threading.Thread(
+                target=self._load_model_now, name="lb-suggester-model", daemon=True
+            )
+            self._model_thread.start()
+        return True
+
+    def load_model(self) -> bool:
+        """Load the embedding model now (or wait for the background load)."""
+        with self._model_lock:
+            thread = self._model_thread if self._model_state == "loading" else None
+            if self._model_state == "not_loaded":
+                self._model_state = "loading"
+            elif thread is None:
+                return self.model is not None
+        if thread is not None:
+            thread.join()
+        else:
+            self._load_model_now()
+        return self.model is not None
+
+    def model_status(self) -> Dict[str, Any]:
+        """Embedding model readiness for status output."""
+        return {
+            "state": self._model_state,
+            "model": self.embedding_model_name,
+            "load_seconds": self._model_load_seconds,
+            "rows_embedded": (
+                int(self._embeddings.shape[0]) if self._embeddings is not None else 0
+            ),
+        }
+
+    def _load_model_now(self) -> None:
+        start = time.time()
+        model = self._load_model(self.embedding_model_name)
+        if model is not None:
+            # Prepare row vectors and the ANN index before suggest() sees the
+            # model, so no request pays for them
+            self._embeddings = self._load_embedding_matrix(model)
+            self._ann = self._load_ann_index()
+            self.model = model
+        self._model_load_seconds = time.time() - start
+        self._model_state = "ready" if model is not None else "failed"
+        LOGGER.info(
+            "SoundSuggester: embedding model %s in %.2fs",
+            self._model_state,
+            self._model_load_seconds,
+        )
+
     # Optional: build sidecar for all rows
     def build_sidecar(self, out_path: Optional[str] = None) -> int:
-        if not (ST_AVAILABLE and PANDAS_AVAILABLE and NUMPY_AVAILABLE):
+        if not (ST_AVAILABLE and NUMPY_AVAILABLE):
             LOGGER.warning("Cannot build sidecar: missing deps")
             return 0
-        if self.model is None:
-            self.model = self._load_model(self.embedding_model_name)
-            if self.model is None:
-                return 0
-        texts = [self._row_text(r) for r in self.rows]
-        LOGGER.info("Embedding %d rows with %s", len(texts), self.embedding_model_name)
-        vectors = self.model.encode(texts, normalize_embeddings=False)
-        import pandas as pd  # type: ignore
-
-        df = pd.DataFrame(
-            {
-                "filename": [r.get("filename", "") for r in self.rows],
-                "embedding": [json.dumps(list(map(float, v))) for v in vectors],
-                "model": self.embedding_model_name,
-                "dim": len(vectors[0]) if len(vectors) else 0,
-            }
+        if not self.load_model():
+            return 0
+        from .sound_embeddings import EmbeddingSidecar, normalize_rows
+
+        LOGGER.info(
+            "Embedding %d rows with %s", len(self.rows), self.embedding_model_name
+        )
+        vectors = self._encode_rows(list(range(len(self.rows))))
+        if vectors is None:
+            return 0
+        sidecar = EmbeddingSidecar(
+            normalize_rows(vectors),
+            [r.get("filename", "") for r in self.rows],
+            self.embedding_model_name,
+            self._library_hash(),
         )
         out = out_path or self.sidecar_path
-        os.makedirs(os.path.dirname(out), exist_ok=True)
         try:
-            df.to_parquet(out, index=False)
+            sidecar.save(out)
             LOGGER.info("Saved sidecar embeddings: %s", out)
-            # refresh in-memory index
-            self.embeddings_index = self._load_sidecar(out)
-            return len(df)
         except Exception as exc:
             LOGGER.warning("Failed saving sidecar: %s", exc)
             return 0
+        if out == self.sidecar_path:
+            # refresh the row-aligned matrix and its ANN index
+            self._embeddings = self._load_embedding_matrix()
+            self._ann = self._load_ann_index()
+        return len(sidecar)
 
     # ---------- Internals ----------
     def _load_csv_rows(self, path: str) -> List[Dict[str, Any]]:
-        rows: List[Dict[str, Any]] = []
-        if PANDAS_AVAILABLE:
-            try:
-                import pandas as pd  # type: ignore
+        # Shared compiled snapshot (rebuilt from the CSV when stale)
+        from .sound_library import get_sound_library
+
+        self._library = get_sound_library(path)
+        return self._library.rows()
+
+    def _persist_matrix(self) -> bool:
+        # Only the library's own rows have a stable row order worth caching
+        return self._library is not None and self._rows is self._library.rows()
 
-                df = pd.read_csv(path)
-                rows = df.fillna("").to_dict(orient="records")  # type: ignore
-                return rows
+    def _library_hash(self) -> Optional[str]:
+        if not self._persist_matrix():
+            return None
+        return self._library.header.get("source", {}).get("sha256")
+
+    def _load_embedding_matrix(self, model: Any = None) -> Optional[Any]:
+        """Row-aligned, pre-normalized float32 embeddings for self.rows.
+
+        Row i holds the unit vector for self.rows[i]; rows without an
+        embedding are zero and score 0. Vectors come from the memory-mapped
+        binary sidecar (realigned by filename if the library changed); rows
+        still missing are encoded in batches here rather than per query, and
+        the completed matrix is written back as the new sidecar.
+        """
+        model = model if model is not None else self.model
+        if not NUMPY_AVAILABLE or not self._rows:
+            return None
+        from .sound_embeddings import EmbeddingSidecar, load_sidecar, normalize_rows
+
+        persist = self._persist_matrix()
+        filenames = [r.get("filename", "") for r in self._rows]
+        library_hash = self._library_hash()
+        matrix = None
+        sidecar = load_sidecar(self.sidecar_path)
+        if sidecar is not None and sidecar.model not in ("", self.embedding_model_name):
+            LOGGER.warning(
+                "Ignoring sidecar embeddings from %s (using %s)",
+                sidecar.model,
+                self.embedding_model_name,
+            )
+            sidecar = None
+        if sidecar is not None:
+            matrix = sidecar.aligned(filenames, library_hash)
+        dirty = sidecar is not None and (
+            matrix is not sidecar.vectors or sidecar.library_hash != library_hash
+        )
+        if model is not None:
+            if matrix is None:
+                missing = np.arange(len(self._rows))
+            else:
+                missing = np.flatnonzero(~np.asarray(matrix).any(axis=1))
+            if len(missing):
+                encoded = self._encode_rows(missing.tolist(), model)
+                if encoded is not None:
+                    if matrix is None:
+                        matrix = np.zeros(
+                            (len(self._rows), encoded.shape[1]), dtype=np.float32
+                        )
+                    else:
+                        matrix = np.array(matrix)
+                    matrix[missing] = normalize_rows(encoded)
+                    dirty = True
+        if matrix is not None and dirty and persist:
+            try:
+                EmbeddingSidecar(
+                    matrix, filenames, self.embedding_model_name, library_hash
+                ).save(self.sidecar_path)
             except Exception as exc:
-                LOGGER.warning("Pandas CSV load failed: %s; falling back", exc)
-        # Fallback minimal CSV loader
-        import csv
+                LOGGER.warning("Failed saving sidecar: %s", exc)
+        return matrix
 
+    def _encode_rows(self, row_ids: List[int], model: Any = None) -> Optional[Any]:
+        texts = [self._row_text(self._rows[i]) for i in row_ids]
+        start = time.time()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    rows.append({k: (v or "") for k, v in row.items()})
+            model = model if model is not None else self.model
+            vectors = model.encode(texts, batch_size=EMBED_BATCH_SIZE)
         except Exception as exc:
-            LOGGER.error("Failed to read CSV %s: %s", path, exc)
-        return rows
+            LOGGER.warning("Row embedding failed: %s", exc)
+            return None
+        LOGGER.info(
+            "SoundSuggester: embedded %d rows (%.1fms)",
+            len(texts),
+            (time.time() - start) * 1000.0,
+        )
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+
+    def _ann_path(self) -> str:
+        return os.path.splitext(self.sidecar_path)[0] + ".ivf.npz"
+
+    def _load_ann_index(self):
+        """IVF index over the embedding matrix, reusing the saved one if fresh."""
+        matrix = self._embeddings
+        if matrix is None:
+            return None
+        from .sound_ann import IVFIndex
+        from .sound_embeddings import sidecar_paths
+
+        persist = self._persist_matrix()
+        path = self._ann_path()
+        if persist:
+            try:
+                fresh = os.path.getmtime(path) >= os.path.getmtime(
+                    sidecar_paths(self.sidecar_path)[0]
+                )
+            except OSError:
+                fresh = False
+            index = IVFIndex.load(path) if fresh else None
+            if (
+                index is not None
+                and index.n_rows == matrix.shape[0]
+                and index.dim == matrix.shape[1]
+            ):
+                return index
+        index = IVFIndex.build(matrix)
+        if persist:
+            try:
+                index.save(path)
+            except Exception as exc:
+                LOGGER.warning("Failed saving ANN index: %s", exc)
+        return index
 
-    def _load_sidecar(self, path: str) -> Dict[str, Any]:
-        if not (PANDAS_AVAILABLE and os.path.exists(path)):
-            return {}
+    def _query_vector(self, query_text: str) -> Optional[Any]:
+        if self.model is None or not ST_AVAILABLE or not NUMPY_AVAILABLE:
+            return None
         try:
-            import pandas as pd  # type: ignore
-
-            df = pd.read_parquet(path)
-            index: Dict[str, Any] = {}
-            for _, row in df.iterrows():  # type: ignore
-                fn = str(row["filename"]) if "filename" in row else ""
-                emb_json = row.get("embedding", "[]")
-                try:
-                    vec = json.loads(emb_json)
-                except Exception:
-                    vec = []
-                index[fn] = vec
-            return index
+            return self.model.encode([query_text])[0]
         except Exception as exc:
-            LOGGER.warning("Failed to load sidecar: %s", exc)
-            return {}
+            LOGGER.warning("Query embedding failed: %s", exc)
+            return None
+
+    def _semantic_candidates(self, query_vec: Optional[Any]) -> List[Dict[str, Any]]:
+        """Eligible rows nearest to the query in embedding space."""
+        if query_vec is None:
+            return []
+        if self._embeddings is None:
+            self._embeddings = self._load_embedding_matrix()
+        if self._ann is None:
+            self._ann = self._load_ann_index()
+        if self._ann is None:
+            return []
+        ids, _ = self._ann.search(
+            self._embeddings, query_vec, ANN_CANDIDATES, n_probe=ANN_PROBES
+        )
+        features = self._features
+        rows = self._rows
+        out = []
+        for i in ids.tolist():
+            if features is not None:
+                ok = bool(features.eligible[i])
+            else:
+                ok = self._row_gate(rows[i])
+            if ok:
+                out.append(rows[i])
+        return out
+
+    def _merge_candidates(
+        self, candidates: List[Dict[str, Any]], extra: List[Dict[str, Any]]
+    ) -> int:
+        """Append rows from extra not already in candidates; returns the count."""
+        seen = {id(r) for r in candidates}
+        added = 0
+        for r in extra:
+            if id(r) not in seen:
+                seen.add(id(r))
+                candidates.append(r)
+                added += 1
+        return added
 
     def _load_model(self, model_name: str):
         try:
@@ -305,66 +620,107 @@ class SoundSuggester:
                 out += vs
         return out
 
+    def _item_terms(self, r: Dict[str, Any]) -> set:
+        fn = _safe_lower(r.get("filename", ""))
+        title = _safe_lower(r.get("kit_title", ""))
+        tags = _safe_lower(r.get("kit_tags", ""))
+        cat = _safe_lower(r.get("kit_category", ""))
+        return (
+            set(_tokens(title))
+            | set(_filename_tokens(fn))
+            | set(_tokens(tags))
+            | ({cat} if cat else set())
+        )
+
+    def _row_gate(self, r: Dict[str, Any]) -> bool:
+        """Extension, safety and duration gates for one row."""
+        fn = _safe_lower(r.get("filename", ""))
+        fp = _safe_lower(r.get("file_path", ""))
+        ext = os.path.splitext(fn)[1] or os.path.splitext(fp)[1]
+        if ext and ext.lower() not in ALLOWED_AUDIO_EXTENSIONS:
+            return False
+        title = _safe_lower(r.get("kit_title", ""))
+        tags = _safe_lower(r.get("kit_tags", ""))
+        cat = _safe_lower(r.get("kit_category", ""))
+        hay = " ".join([fn, title, tags, cat])
+        if any(bad in hay for bad in DENY_TAGS):
+            return False
+        try:
+            dur = float(r.get("duration", 0) or 0)
+        except Exception:
+            dur = 0.0
+        if self._is_mixkit_source(r):
+            return 8.0 <= dur <= 90.0
+        return 0.2 <= dur <= 10.0
+
+    def _build_features(self, rows: List[Dict[str, Any]]) -> _LexicalFeatures:
+        start = time.time()
+        library = self._library
+        if library is not None and rows is library.rows():
+            # Token sets were precomputed when the snapshot was compiled
+            terms: List[Iterable[str]] = library.split_column("_terms")
+            sim_terms: List[Iterable[str]] = library.split_column("_sim_terms")
+        else:
+            terms = [self._item_terms(r) for r in rows]
+            sim_terms = [self._sim_features(r)[0] for r in rows]
+        categories = [_safe_lower(r.get("kit_category", "")) for r in rows]
+        eligible = np.fromiter(
+            (self._row_gate(r) for r in rows), dtype=bool, count=len(rows)
+        )
+        features = _LexicalFeatures(terms, eligible, sim_terms, categories)
+        LOGGER.info(
+            "SoundSuggester: prefilter features for %d rows, %d tokens (%.1fms)",
+            features.n_rows,
+            len(features.tokens),
+            (time.time() - start) * 1000.0,
+        )
+        return features
+
     def _prefilter(
         self, rows: List[Dict[str, Any]], terms: List[str]
+    ) -> List[Dict[str, Any]]:
+        features = self._features
+        if features is not None and rows is self._rows:
+            return self._prefilter_vectorized(features, terms)
+        return self._prefilter_rows(rows, terms)
+
+    def _prefilter_vectorized(
+        self, features: _LexicalFeatures, terms: List[str]
+    ) -> List[Dict[str, Any]]:
+        tset = set(terms)
+        score = features.overlap(tset).astype(np.float64)
+        if FUZZ_AVAILABLE and terms:
+            for q in terms[:FUZZY_QUERY_TERMS]:
+                score += 0.25 * features.fuzzy_hits(q)
+        keep = features.eligible if not tset else features.eligible & (score > 0)
+        idx = np.flatnonzero(keep)
+        # Stable: ties keep library order, as the row-by-row version did
+        idx = idx[np.argsort(-score[idx], kind="stable")][:PREFILTER_KEEP]
+        rows = self._rows
+        return [rows[i] for i in idx.tolist()]
+
+    def _prefilter_rows(
+        self, rows: List[Dict[str, Any]], terms: List[str]
     ) -> List[Dict[str, Any]]:
         tset = set(terms)
         cands: List[Tuple[float, Dict[str, Any]]] = []
         for r in rows:
-            # Enforce allowed audio extensions (exclude WAV and others)
-            fn_raw = r.get("filename", "") or ""
-            fp_raw = r.get("file_path", "") or ""
-            fn_lower = _safe_lower(fn_raw)
-            fp_lower = _safe_lower(fp_raw)
-            ext = os.path.splitext(fn_lower)[1] or os.path.splitext(fp_lower)[1]
-            if ext and ext.lower() not in ALLOWED_AUDIO_EXTENSIONS:
-                continue
-            fn = _safe_lower(r.get("filename", ""))
-            title = _safe_lower(r.get("kit_title", ""))
-            tags = _safe_lower(r.get("kit_tags", ""))
-            cat = _safe_lower(r.get("kit_category", ""))
-            # url unused here; kept in final output only
-
-            # Safety gate
-            hay = " ".join([fn, title, tags, cat])
-            if any(bad in hay for bad in DENY_TAGS):
-                continue
-
-            # Duration gate
-            try:
-                dur = float(r.get("duration", 0) or 0)
-            except Exception:
-                dur = 0.0
-            is_music = self._is_mixkit_source(r)
-            if is_music and not (8.0 <= dur <= 90.0):
-                continue
-            if (not is_music) and not (0.2 <= dur <= 10.0):
+            if not self._row_gate(r):
                 continue
-
-            item_terms = (
-                set(_tokens(title))
-                | set(_filename_tokens(fn))
-                | set(_tokens(tags))
-                | ({cat} if cat else set())
-            )
+            item_terms = self._item_terms(r)
             overlap = len(item_terms & tset)
             # Fuzzy bonus for pieces names
             fuzzy_bonus = 0
             if FUZZ_AVAILABLE and terms:
-                for q in terms[:6]:
-                    for tok in list(item_terms)[:12]:
-                        try:
-                            if partial_ratio(q, tok) >= 90:
-                                fuzzy_bonus += 1
-                                break
-                        except Exception:
-                            pass
+                for q in terms[:FUZZY_QUERY_TERMS]:
+                    if any(_fuzzy_match(q, tok) for tok in item_terms):
+                        fuzzy_bonus += 1
             score = overlap + 0.25 * fuzzy_bonus
             if score > 0 or not tset:
                 cands.append((score, r))
-        # Keep top 300 by lexical score
+        # Keep the best PREFILTER_KEEP by lexical score
         cands.sort(key=lambda x: x[0], reverse=True)
-        return [r for _, r in cands[:300]]
+        return [r for _, r in cands[:PREFILTER_KEEP]]
 
     def _row_text(self, r: Dict[str, Any]) -> str:
         parts = [
@@ -376,7 +732,11 @@ class SoundSuggester:
         return " ".join([p for p in parts if p]).strip()
 
     def _rerank(
-        self, candidates: List[Dict[str, Any]], query_text: str, terms: List[str]
+        self,
+        candidates: List[Dict[str, Any]],
+        query_text: str,
+        terms: List[str],
+        query_vec: Optional[Any] = None,
     ) -> List[Tuple[float, Dict[str, Any], Dict[str, Any]]]:
         # Compute base lexical features
         tset = set(terms)
@@ -406,28 +766,30 @@ class SoundSuggester:
             base.append((base_score, r, {"overlap": overlap, "dur_fit": dur_fit}))
 
         # Embedding similarity (optional)
-        if self.model is None or not ST_AVAILABLE or not NUMPY_AVAILABLE:
+        if self.model is None or not ST_AVAILABLE or not NUMPY_AVAILABLE or not base:
             return base
-        try:
-            qv = self.model.encode([query_text])[0]
-        except Exception as exc:
-            LOGGER.warning("Query embedding failed: %s", exc)
+        if self._embeddings is None:
+            self._embeddings = self._load_embedding_matrix()
+        matrix = self._embeddings
+        if matrix is None:
+            return base
+        qv = query_vec if query_vec is not None else self._query_vector(query_text)
+        if qv is None:
             return base
+        ids = [self._row_ids.get(id(r), -1) for _, r, _ in base]
+        rows = np.asarray(ids, dtype=np.int64)
+        qv = np.asarray(qv, dtype=np.float32).reshape(-1)
+        qnorm = float(np.linalg.norm(qv))
+        if qnorm == 0.0 or qv.shape[0] != matrix.shape[1]:
+            return base
+        # One gather + matmul scores every candidate against the query
+        sims = matrix[np.maximum(rows, 0)] @ (qv / qnorm)
+        sims[rows < 0] = 0.0
 
         enriched: List[Tuple[float, Dict[str, Any], Dict[str, Any]]] = []
-        for base_score, r, meta in base:
-            fn = r.get("filename", "")
-            vec = self.embeddings_index.get(fn)
-            if vec is None and ST_AVAILABLE:
-                # Compute on the fly (not persisted)
-                try:
-                    vec = list(map(float, self.model.encode([self._row_text(r)])[0]))
-                except Exception:
-                    vec = None
-            sim = _cosine(qv, vec) if vec is not None else 0.0
-            final_score = 0.5 * sim + base_score
+        for (base_score, r, meta), sim in zip(base, sims.tolist()):
             meta["emb_sim"] = float(sim)
-            enriched.append((final_score, r, meta))
+            enriched.append((0.5 * sim + base_score, r, meta))
         enriched.sort(key=lambda x: x[0], reverse=True)
         return enriched
 
@@ -471,7 +833,8 @@ class SoundSuggester:
         )
         if len(picks) < limit:
             # fill remainder by highest remaining
-            remaining = [r for r in ranked if r[1] not in picks]
+            picked = {id(r) for r in picks}
+            remaining = [r for r in ranked if id(r[1]) not in picked]
             for _, r, _ in remaining[: max(0, limit - len(picks))]:
                 picks.append(r)
 
@@ -512,43 +875,112 @@ class SoundSuggester:
     def _mmr_pick(
         self, items: List[Tuple[float, Dict[str, Any], Dict[str, Any]]], k: int
     ) -> List[Dict[str, Any]]:
-        selected: List[Tuple[float, Dict[str, Any], Dict[str, Any]]] = []
-        used: set = set()
-        while items and len(selected) < k:
-            best_idx = -1
-            best_mmr = -1e9
-            for idx, (score, r, meta) in enumerate(items):
-                if id(r) in used:
-                    continue
-                sim_max = 0.0
-                for _, rr, _ in selected:
-                    sim = self._item_sim(r, rr)
-                    if sim > sim_max:
-                        sim_max = sim
-                mmr = 0.8 * score - 0.2 * sim_max
-                if mmr > best_mmr:
-                    best_mmr = mmr
-                    best_idx = idx
-            if best_idx < 0:
-                break
-            chosen = items.pop(best_idx)
-            selected.append(chosen)
-            used.add(id(chosen[1]))
-        return [r for _, r, _ in selected]
-
-    def _item_sim(self, a: Dict[str, Any], b: Dict[str, Any]) -> float:
-        a_terms = set(_tokens(a.get("kit_tags", ""))) | set(
-            _filename_tokens(a.get("filename", ""))
+        """Greedy MMR: 0.8 * relevance - 0.2 * max similarity to the picks.
+
+        Similarity term ids come from the per-library features (rows outside
+        the library are tokenized here). Each pick updates a running
+        max-similarity vector with one bincount over the candidates'
+        postings of the pick's terms, so a pick costs O(n + postings).
+        """
+        # Each row is eligible once, at its first (highest ranked) entry
+        seen: set = set()
+        uniq = []
+        for item in items:
+            if id(item[1]) not in seen:
+                seen.add(id(item[1]))
+                uniq.append(item)
+        k = min(k, len(uniq))
+        if k <= 0:
+            return []
+        if not NUMPY_AVAILABLE:
+            feats = [self._sim_features(r) for _, r, _ in uniq]
+            order = self._mmr_order_rows(uniq, feats, k)
+            return [uniq[i][1] for i in order]
+        row_ids = np.fromiter(
+            (self._row_ids.get(id(r), -1) for _, r, _ in uniq),
+            dtype=np.int64,
+            count=len(uniq),
         )
-        b_terms = set(_tokens(b.get("kit_tags", ""))) | set(
-            _filename_tokens(b.get("filename", ""))
+        features = self._features
+        if features is not None and (row_ids >= 0).all():
+            ptr, term_ids, cat_ids = features.sim_rows(row_ids)
+        else:
+            feats = [self._sim_features(r) for _, r, _ in uniq]
+            ptr, term_ids = _term_csr(terms for terms, _ in feats)
+            cat_ids = _category_ids(cat for _, cat in feats)
+        relevance = np.fromiter(
+            (score for score, _, _ in uniq), dtype=np.float64, count=len(uniq)
         )
-        cat_sim = (
-            1.0
-            if _safe_lower(a.get("kit_category", ""))
-            == _safe_lower(b.get("kit_category", ""))
-            else 0.0
+        order = self._mmr_order_vectorized(relevance, ptr, term_ids, cat_ids, k)
+        return [uniq[i][1] for i in order]
+
+    def _mmr_order_vectorized(
+        self, scores: Any, ptr: Any, term_ids: Any, cat_ids: Any, k: int
+    ) -> List[int]:
+        n = len(scores)
+        sizes = np.diff(ptr)
+        # Postings: candidate term ids sorted, with the candidate owning each
+        by_term = np.argsort(term_ids, kind="stable")
+        sorted_terms = term_ids[by_term]
+        posting_rows = np.repeat(np.arange(n), sizes)[by_term]
+        relevance = 0.8 * scores
+
+        max_sim = np.zeros(n, dtype=np.float64)
+        available = np.ones(n, dtype=bool)
+        order: List[int] = []
+        for _ in range(k):
+            mmr = np.where(available, relevance - 0.2 * max_sim, -np.inf)
+            best = int(np.argmax(mmr))
+            order.append(best)
+            available[best] = False
+            # Similarity of every item to the new pick (Jaccard + category)
+            terms = term_ids[ptr[best] : ptr[best + 1]]
+            lo = np.searchsorted(sorted_terms, terms, side="left")
+            hi = np.searchsorted(sorted_terms, terms, side="right")
+            hits = [posting_rows[a:b] for a, b in zip(lo.tolist(), hi.tolist())]
+            inter = np.bincount(
+                np.concatenate(hits) if hits else np.zeros(0, dtype=np.int64),
+                minlength=n,
+            )
+            union = sizes + sizes[best] - inter
+            jac = np.divide(inter, union, out=np.zeros(n), where=union > 0)
+            sim = 0.6 * jac + 0.4 * (cat_ids == cat_ids[best])
+            np.maximum(max_sim, sim, out=max_sim)
+        return order
+
+    def _mmr_order_rows(
+        self,
+        items: List[Tuple[float, Dict[str, Any], Dict[str, Any]]],
+        feats: List[Tuple[frozenset, str]],
+        k: int,
+    ) -> List[int]:
+        max_sim = [0.0] * len(items)
+        available = set(range(len(items)))
+        order: List[int] = []
+        for _ in range(k):
+            best = min(
+                available, key=lambda i: (-(0.8 * items[i][0] - 0.2 * max_sim[i]), i)
+            )
+            order.append(best)
+            available.discard(best)
+            terms, cat = feats[best]
+            for i in available:
+                sim = 0.6 * _jaccard(feats[i][0], terms) + 0.4 * (feats[i][1] == cat)
+                if sim > max_sim[i]:
+                    max_sim[i] = sim
+        return order
+
+    def _sim_features(self, r: Dict[str, Any]) -> Tuple[frozenset, str]:
+        """Tag/filename terms and lowercased category used by _item_sim."""
+        terms = set(_tokens(r.get("kit_tags", ""))) | set(
+            _filename_tokens(r.get("filename", ""))
         )
+        return frozenset(terms), _safe_lower(r.get("kit_category", ""))
+
+    def _item_sim(self, a: Dict[str, Any], b: Dict[str, Any]) -> float:
+        a_terms, a_cat = self._sim_features(a)
+        b_terms, b_cat = self._sim_features(b)
+        cat_sim = 1.0 if a_cat == b_cat else 0.0
         return 0.6 * _jaccard(a_terms, b_terms) + 0.4 * cat_sim
 
     def _is_mixkit_source(self, row: Dict[str, Any]) -> bool:
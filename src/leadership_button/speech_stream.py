@@ -0,0 +1,188 @@
+"""
+Streaming Speech-to-Text for the Leadership Button.
+
+A StreamingRecognizer is fed raw PCM chunks while the button is held and
+returns the final transcript shortly after release, instead of uploading the
+whole recording and running a full recognition pass afterwards.
+
+GoogleStreamingRecognizer wraps the Cloud Speech streaming_recognize API;
+StubStreamingRecognizer implements the same interface locally for tests.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Optional
+
+from .api_client import TranscriptionResult
+
+try:
+    from google.cloud import speech
+
+    GOOGLE_SPEECH_AVAILABLE = True
+except ImportError:
+    GOOGLE_SPEECH_AVAILABLE = False
+
+DEFAULT_FINISH_TIMEOUT = 3.0
+
+
+class StreamingRecognizer:
+    """Interface for chunk-fed speech recognizers (one instance per utterance)."""
+
+    def feed(self, chunk: bytes) -> None:
+        """Queue a chunk of raw audio for recognition"""
+        raise NotImplementedError("StreamingRecognizer must be implemented by subclass")
+
+    def finish(self, timeout: Optional[float] = None) -> Optional[TranscriptionResult]:
+        """Signal end of audio and wait (up to timeout seconds) for the transcript"""
+        raise NotImplementedError("StreamingRecognizer must be implemented by subclass")
+
+    def cancel(self) -> None:
+        """Abandon recognition without waiting for a result"""
+        pass
+
+
+class GoogleStreamingRecognizer(StreamingRecognizer):
+    """Google Cloud Speech streaming_recognize session.
+
+    Recognition starts immediately on a background thread; chunks passed to
+    feed() are forwarded as StreamingRecognizeRequests while the user is still
+    speaking, so only the tail of the utterance is outstanding at finish().
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        client: Any,
+        recognition_config: Any,
+        language_code: str = "en-US",
+        timeout: Optional[float] = None,
+        finish_timeout: float = DEFAULT_FINISH_TIMEOUT,
+    ):
+        if not GOOGLE_SPEECH_AVAILABLE:
+            raise RuntimeError("Google Cloud Speech library not available")
+        self._client = client
+        self._streaming_config = speech.StreamingRecognitionConfig(
+            config=recognition_config, interim_results=False
+        )
+        self._language_code = language_code
+        self._timeout = timeout
+        self._finish_timeout = finish_timeout
+        self._chunks: "queue.Queue[Any]" = queue.Queue()
+        self._finals: List[Any] = []
+        self._error: Optional[Exception] = None
+        self._cancelled = threading.Event()
+        self._bytes_fed = 0
+        self._thread = threading.Thread(
+            target=self._run, name="lb-stt-stream", daemon=True
+        )
+        self._thread.start()
+
+    def feed(self, chunk: bytes) -> None:
+        if chunk and not self._cancelled.is_set():
+            self._bytes_fed += len(chunk)
+            self._chunks.put(bytes(chunk))
+
+    def finish(self, timeout: Optional[float] = None) -> Optional[TranscriptionResult]:
+        released_at = time.time()
+        if timeout is None:
+            timeout = self._finish_timeout
+        self._chunks.put(self._END)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logging.warning(
+                "Streaming recognition did not finish within %.1fs", timeout
+            )
+            self.cancel()
+            return None
+        if self._error is not None:
+            logging.error(f"Streaming recognition failed: {self._error}")
+            return None
+        if not self._finals:
+            logging.warning("No streaming transcription results returned")
+            return None
+
+        text = " ".join(alt.transcript.strip() for alt in self._finals).strip()
+        if not text:
+            return None
+        confidence = min(alt.confidence for alt in self._finals)
+        result = TranscriptionResult(text=text, confidence=confidence)
+        result.language_code = self._language_code
+        result.processing_time = time.time() - released_at
+        logging.info(
+            "🎤 Streaming transcript ready %.2fs after release (%d bytes streamed)",
+            result.processing_time,
+            self._bytes_fed,
+        )
+        return result
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        self._chunks.put(self._END)
+
+    def _requests(self) -> Iterator[Any]:
+        while True:
+            chunk = self._chunks.get()
+            if chunk is self._END or self._cancelled.is_set():
+                return
+            yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+    def _run(self) -> None:
+        try:
+            responses = self._client.streaming_recognize(
+                config=self._streaming_config,
+                requests=self._requests(),
+                timeout=self._timeout,
+            )
+            for response in responses:
+                if self._cancelled.is_set():
+                    return
+                for result in response.results:
+                    if result.is_final and result.alternatives:
+                        self._finals.append(result.alternatives[0])
+        except Exception as e:
+            if not self._cancelled.is_set():
+                self._error = e
+
+
+class StubStreamingRecognizer(StreamingRecognizer):
+    """Local recognizer that returns a fixed (or computed) transcript.
+
+    The transcript may be a string, or a callable receiving the concatenated
+    audio bytes. Useful for tests and offline development.
+    """
+
+    def __init__(
+        self,
+        transcript: "str | Callable[[bytes], Optional[str]]" = "",
+        confidence: float = 1.0,
+    ):
+        self.transcript = transcript
+        self.confidence = confidence
+        self.chunks: List[bytes] = []
+        self.finished = False
+        self.cancelled = False
+
+    def feed(self, chunk: bytes) -> None:
+        if chunk and not self.cancelled:
+            self.chunks.append(bytes(chunk))
+
+    def finish(self, timeout: Optional[float] = None) -> Optional[TranscriptionResult]:
+        self.finished = True
+        if self.cancelled:
+            return None
+        text = self.transcript
+        if callable(text):
+            text = text(b"".join(self.chunks))
+        if not text:
+            return None
+        result = TranscriptionResult(text=text, confidence=self.confidence)
+        result.processing_time = 0.0
+        return result
+
+    def cancel(self) -> None:
+        self.cancelled = True
@@ -0,0 +1,387 @@
+"""
+Single-pass SSML transformation engine.
+
+SSML bound for Google TTS used to be rewritten by a chain of regex passes
+(whitespace collapse, <audio> inner-text fix-up, src resolution, break
+capping, <s> stripping) followed by a full ElementTree parse just to validate
+it. SSMLEngine tokenizes the document once into a flat stream of tags and
+text, pipes every token through the registered rewrite rules in order,
+checks well-formedness while walking the result, and serializes once — so
+adding a rule adds O(1) work per token rather than another pass.
+
+Rules are plugins: subclass SSMLRule, decorate it with @register_rule(name)
+and list the name (optionally with keyword options) when building an engine.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+# One alternation per token type; a bare "<" that starts no valid tag is stray
+TOKEN_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<\?.*?\?>"
+    r"|<\s*(/)?\s*([A-Za-z_][\w:.-]*)"
+    r"((?:\s*[^\s=/<>\"']+\s*=\s*(?:\"[^\"]*\"|'[^']*'))*)"
+    r"\s*(/)?\s*>"
+    r"|<",
+    re.DOTALL,
+)
+ATTR_RE = re.compile(r"([^\s=/<>\"']+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+NAME_RE = re.compile(r"[A-Za-z_][\w:.-]*\Z")
+# Only the predefined XML entities and character references; Google TTS (like
+# ElementTree) rejects HTML entities such as &nbsp;
+BAD_AMPERSAND_RE = re.compile(r"&(?!(?:amp|lt|gt|quot|apos);|#[0-9]+;|#x[0-9a-fA-F]+;)")
+WHITESPACE_RE = re.compile(r"\s+")
+BREAK_TIME_RE = re.compile(r"\s*([0-9]+\.?[0-9]*)\s*(ms|s)\s*\Z", re.IGNORECASE)
+
+TEXT = "text"
+START = "start"
+END = "end"
+EMPTY = "empty"
+COMMENT = "comment"
+
+
+class SSMLToken:
+    """One tag, text run or comment from an SSML document."""
+
+    __slots__ = ("kind", "name", "attrs", "text")
+
+    def __init__(
+        self,
+        kind: str,
+        name: str = "",
+        attrs: Optional[Dict[str, str]] = None,
+        text: str = "",
+    ):
+        self.kind = kind
+        self.name = name
+        self.attrs: Dict[str, str] = attrs if attrs is not None else {}
+        self.text = text
+
+    @classmethod
+    def text_node(cls, text: str) -> "SSMLToken":
+        return cls(TEXT, text=text)
+
+    @property
+    def tag(self) -> str:
+        """Lower-cased element name ('' for text and comments)."""
+        return self.name.lower()
+
+    def is_tag(self, name: str) -> bool:
+        return self.kind in (START, END, EMPTY) and self.tag == name
+
+    def serialize(self) -> str:
+        if self.kind in (TEXT, COMMENT):
+            return self.text
+        if self.kind == END:
+            return f"</{self.name}>"
+        parts = [self.name]
+        for key, value in self.attrs.items():
+            # Values are kept escaped except for the quote that delimited them
+            value = value.replace('"', "&quot;")
+            parts.append(f'{key}="{value}"')
+        close = "/>" if self.kind == EMPTY else ">"
+        return f"<{' '.join(parts)}{close}"
+
+    def __repr__(self) -> str:
+        return f"SSMLToken({self.kind}, {self.serialize()!r})"
+
+
+def tokenize(ssml: str, errors: Optional[List[str]] = None) -> Iterable[SSMLToken]:
+    """Yield the tokens of ssml in document order.
+
+    Malformed markup (stray '<', bad or duplicate attributes) is passed
+    through as text and reported in errors rather than raising.
+    """
+    if errors is None:
+        errors = []
+    pos = 0
+    for match in TOKEN_RE.finditer(ssml):
+        start = match.start()
+        if start > pos:
+            yield SSMLToken.text_node(ssml[pos:start])
+        pos = match.end()
+        raw = match.group(0)
+        closing, name, attr_text, self_closing = match.groups()
+        if name is None:
+            if raw.startswith("<!--") or raw.startswith("<?"):
+                yield SSMLToken(COMMENT, text=raw)
+            else:
+                errors.append(f"stray '<' at offset {start}")
+                yield SSMLToken.text_node(raw)
+            continue
+        attrs: Dict[str, str] = {}
+        for attr in ATTR_RE.finditer(attr_text or ""):
+            key = attr.group(1)
+            value = attr.group(2) if attr.group(2) is not None else attr.group(3)
+            if not NAME_RE.match(key):
+                errors.append(f"invalid attribute name {key!r} on <{name}>")
+            elif key in attrs:
+                errors.append(f"duplicate attribute {key!r} on <{name}>")
+            attrs[key] = value
+        if closing:
+            if attrs or self_closing:
+                errors.append(f"malformed end tag {raw!r}")
+            yield SSMLToken(END, name)
+        else:
+            yield SSMLToken(EMPTY if self_closing else START, name, attrs)
+    if pos < len(ssml):
+        yield SSMLToken.text_node(ssml[pos:])
+
+
+class SSMLRule:
+    """Base class for rewrite rules.
+
+    A fresh instance is created for every transform, so rules may keep
+    per-document state. visit() returns the tokens to emit in place of the
+    given one (an empty list drops it); finish() flushes anything held back.
+    """
+
+    name = ""
+
+    def visit(self, token: SSMLToken) -> List[SSMLToken]:
+        return [token]
+
+    def finish(self) -> List[SSMLToken]:
+        return []
+
+
+RULES: Dict[str, Type[SSMLRule]] = {}
+
+
+def register_rule(name: str) -> Callable[[Type[SSMLRule]], Type[SSMLRule]]:
+    """Class decorator adding a rule to the plugin registry under name."""
+
+    def decorator(cls: Type[SSMLRule]) -> Type[SSMLRule]:
+        cls.name = name
+        RULES[name] = cls
+        return cls
+
+    return decorator
+
+
+@register_rule("collapse_whitespace")
+class CollapseWhitespace(SSMLRule):
+    """Collapse runs of whitespace in text to a single space."""
+
+    def visit(self, token: SSMLToken) -> List[SSMLToken]:
+        if token.kind == TEXT:
+            token.text = WHITESPACE_RE.sub(" ", token.text)
+        return [token]
+
+
+@register_rule("audio_inner_text")
+class AudioInnerText(SSMLRule):
+    """Move text out of <audio>...</audio> so TTS won't treat it as content.
+
+    Example: <audio src="...">Some text</audio> -> <audio src="..."></audio> Some text
+    """
+
+    def __init__(self):
+        self._inside = False
+        self._depth = 0
+        self._held: List[SSMLToken] = []
+
+    def visit(self, token: SSMLToken) -> List[SSMLToken]:
+        if not self._inside:
+            if token.kind == START and token.tag == "audio":
+                self._inside, self._depth, self._held = True, 0, []
+            return [token]
+        if token.kind == START:
+            self._depth += 1
+        elif token.kind == END and self._depth:
+            self._depth -= 1
+        elif token.kind == END and token.tag == "audio":
+            held, self._held, self._inside = self._held, [], False
+            inner = WHITESPACE_RE.sub(" ", "".join(t.text for t in held)).strip()
+            if inner:
+                logging.info("✂️ Moved inner text out of <audio>: '%s'", inner[:120])
+                return [token, SSMLToken.text_node(f" {inner}")]
+            return held + [token]
+        elif token.kind == TEXT and self._depth == 0:
+            self._held.append(token)
+            return []
+        return [token]
+
+    def finish(self) -> List[SSMLToken]:
+        held, self._held = self._held, []
+        return held
+
+
+@register_rule("audio_src")
+class AudioSrc(SSMLRule):
+    """Resolve <audio src="token"> references through a resolver callable.
+
+    resolve(token) returns (url, matched_key), or (None, None) if unknown.
+    """
+
+    def __init__(self, resolve: Callable[[str], Tuple[Optional[str], Optional[str]]]):
+        self.resolve = resolve
+
+    def visit(self, token: SSMLToken) -> List[SSMLToken]:
+        if token.kind in (START, EMPTY) and token.tag == "audio":
+            src = token.attrs.get("src")
+            if src is not None:
+                logging.info("👂 Found <audio> tag src='%s'", src)
+                try:
+                    resolved, matched_key = self.resolve(src)
+                except Exception as exc:
+                    logging.warning("SSML audio URL rewrite failed: %s", exc)
+                    resolved, matched_key = None, None
+                if resolved:
+                    logging.info(
+                        "🔗 <audio> src mapped: token='%s' key='%s' -> '%s'",
+                        src,
+                        matched_key,
+                        resolved,
+                    )
+                    token.attrs["src"] = resolved
+                else:
+                    logging.warning(
+                        "⚠️ No mapping found for <audio> src token '%s'", src
+                    )
+        return [token]
+
+
+@register_rule("cap_breaks")
+class CapBreaks(SSMLRule):
+    """Cap <break time="..."> durations to keep the total output short."""
+
+    def __init__(self, max_seconds: float = 2.0):
+        self.max_seconds = max_seconds
+
+    def visit(self, token: SSMLToken) -> List[SSMLToken]:
+        if token.kind in (START, EMPTY) and token.tag == "break":
+            match = BREAK_TIME_RE.match(token.attrs.get("time", ""))
+            if match:
+                value, unit = match.groups()
+                seconds = float(value) / (1000.0 if unit.lower() == "ms" else 1.0)
+                if seconds > self.max_seconds:
+                    token.attrs["time"] = f"{self.max_seconds}s"
+        return [token]
+
+
+@register_rule("strip_sentences")
+class StripSentences(SSMLRule):
+    """Drop <s> sentence tags, which LLMs frequently nest incorrectly."""
+
+    def visit(self, token: SSMLToken) -> List[SSMLToken]:
+        if token.is_tag("s"):
+            return []
+        return [token]
+
+
+class SSMLResult:
+    """Output of SSMLEngine.transform."""
+
+    def __init__(self, ssml: str, errors: List[str]):
+        self.ssml = ssml
+        self.errors = errors
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        if self.errors:
+            raise ValueError(f"Invalid SSML: {'; '.join(self.errors)}")
+
+
+RuleSpec = Union[str, Tuple[str, Dict[str, Any]]]
+
+
+class SSMLEngine:
+    """Tokenize once, rewrite through a rule chain, validate and serialize.
+
+    rules lists registered rule names, each optionally paired with keyword
+    options: ["collapse_whitespace", ("cap_breaks", {"max_seconds": 2.0})].
+    Rules run in the order given. An engine is safe to share across threads.
+    """
+
+    def __init__(self, rules: Iterable[RuleSpec] = ()):
+        self._specs: List[Tuple[Type[SSMLRule], Dict[str, Any]]] = []
+        for spec in rules:
+            name, options = (spec, {}) if isinstance(spec, str) else spec
+            if name not in RULES:
+                raise KeyError(f"Unknown SSML rule: {name}")
+            self._specs.append((RULES[name], dict(options)))
+
+    @property
+    def rule_names(self) -> List[str]:
+        return [cls.name for cls, _ in self._specs]
+
+    def transform(self, ssml: str, root: str = "speak") -> SSMLResult:
+        """Rewrite ssml; the result records any well-formedness errors.
+
+        Validation mirrors what an XML parser would reject (unbalanced tags,
+        stray markup, bad entities, content outside a single root element)
+        and additionally requires the root element to be root.
+        """
+        errors: List[str] = []
+        rules = [cls(**options) for cls, options in self._specs]
+        validator = _Validator(root, errors)
+        out: List[str] = []
+
+        def _emit(tokens: List[SSMLToken], start: int) -> None:
+            for index in range(start, len(rules)):
+                rule = rules[index]
+                tokens = [t for token in tokens for t in rule.visit(token)]
+                if not tokens:
+                    return
+            for token in tokens:
+                validator.check(token)
+                out.append(token.serialize())
+
+        for token in tokenize(ssml or "", errors):
+            _emit([token], 0)
+        for index, rule in enumerate(rules):
+            _emit(rule.finish(), index + 1)
+        validator.close()
+        return SSMLResult("".join(out).strip(), errors)
+
+
+class _Validator:
+    """Incremental well-formedness checks over the emitted token stream."""
+
+    def __init__(self, root: str, errors: List[str]):
+        self.root = root
+        self.errors = errors
+        self.stack: List[str] = []
+        self.roots = 0
+
+    def _enter(self, token: SSMLToken) -> None:
+        if not self.stack:
+            self.roots += 1
+            if self.roots == 2:
+                self.errors.append("multiple root elements")
+            elif self.roots == 1 and self.root and token.tag != self.root:
+                self.errors.append(f"SSML must have <{self.root}> as the root element")
+        for value in token.attrs.values():
+            if "<" in value or BAD_AMPERSAND_RE.search(value):
+                self.errors.append(f"invalid attribute value on <{token.name}>")
+
+    def check(self, token: SSMLToken) -> None:
+        if token.kind == TEXT:
+            if not self.stack and token.text.strip():
+                self.errors.append("text outside the root element")
+            elif BAD_AMPERSAND_RE.search(token.text):
+                self.errors.append("unescaped '&' in text")
+        elif token.kind == START:
+            self._enter(token)
+            self.stack.append(token.name)
+        elif token.kind == EMPTY:
+            self._enter(token)
+        elif token.kind == END:
+            if not self.stack or self.stack[-1] != token.name:
+                self.errors.append(f"unexpected </{token.name}>")
+            else:
+                self.stack.pop()
+
+    def close(self) -> None:
+        if self.stack:
+            self.errors.append(f"unclosed <{self.stack[-1]}>")
+        if not self.roots:
+            self.errors.append("no root element")
@@ -0,0 +1,219 @@
+"""
+Incremental SSML assembly for streamed LLM output.
+
+The batch cleaner (APIManager._clean_llm_response_to_ssml_or_text) needs the
+whole response before it can strip code fences, normalize quotes, escape
+stray ampersands and extract the <speak> document. SSMLStreamAssembler applies
+the same rules to partial input: anything whose meaning depends on text that
+has not arrived yet (a half-received fence, entity or tag) is held back, and
+cleaned text is handed to the sentence segmenters so complete sentences and
+<audio> elements can be synthesized before the model has finished.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Optional
+
+from .tts_pipeline import (
+    DEFAULT_MIN_SEGMENT_CHARS,
+    SSMLSegmenter,
+    TextSegmenter,
+    split_ssml_segments,
+    split_text_segments,
+)
+
+# Code fences like ```xml or ```
+CODE_FENCE_RE = re.compile(r"```[a-zA-Z]*\n?")
+# Zero-width and control chars that break XML
+ILLEGAL_XML_CHARS_RE = re.compile(r"[\u200B\uFEFF\x00-\x08\x0B\x0C\x0E-\x1F]")
+# Ampersands that are not already one of the predefined XML entities
+STRAY_AMPERSAND_RE = re.compile(r"&(?!amp;|lt;|gt;|quot;|apos;)")
+XML_ENTITIES = ("amp;", "lt;", "gt;", "quot;", "apos;")
+
+SMART_PUNCTUATION = {
+    ord("“"): '"',
+    ord("”"): '"',
+    ord("‘"): "'",
+    ord("’"): "'",
+    ord("—"): "-",
+    ord("–"): "-",
+}
+
+# Plain-text mode is chosen once this much text has arrived without any '<'
+DEFAULT_DETECT_CHARS = 160
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove markdown code fences (```xml ... ```)."""
+    return CODE_FENCE_RE.sub("", text).replace("```", "")
+
+
+def normalize_llm_text(text: str) -> str:
+    """Normalize smart quotes/dashes and fix the common </"prosody> typo."""
+    return text.translate(SMART_PUNCTUATION).replace('</"prosody>', "</prosody>")
+
+
+def sanitize_ssml_chars(ssml: str) -> str:
+    """Drop XML-illegal characters and escape stray ampersands."""
+    ssml = ILLEGAL_XML_CHARS_RE.sub("", ssml)
+    return STRAY_AMPERSAND_RE.sub("&amp;", ssml)
+
+
+def clean_llm_response(raw: str) -> tuple[str, bool]:
+    """Extract a valid SSML document from LLM text if present; otherwise plain text.
+
+    Returns (output, is_ssml).
+    """
+    if not raw:
+        return "", False
+
+    text = strip_code_fences(raw.strip()).strip()
+    text = normalize_llm_text(text)
+
+    lower = text.lower()
+    start = lower.find("<speak")
+    end = lower.rfind("</speak>")
+    if start != -1 and end != -1:
+        ssml = text[start : end + len("</speak>")]
+        return sanitize_ssml_chars(ssml).strip(), True
+
+    plain = re.sub(r"\s+", " ", text).strip()
+    return plain, False
+
+
+def _holdback_index(data: str) -> int:
+    """Index from which data may still change meaning once more input arrives."""
+    cut = len(data)
+
+    # Unterminated tag: the typo fix and <speak> detection need the whole tag
+    lt = data.rfind("<")
+    if lt != -1 and data.find(">", lt) == -1:
+        cut = min(cut, lt)
+
+    # Code fence whose language tag may continue (```xm|l\n)
+    tick = data.rfind("`")
+    if tick != -1:
+        run_start = tick
+        while run_start > 0 and data[run_start - 1] == "`":
+            run_start -= 1
+        if data[tick + 1 :].isalpha() or tick + 1 == len(data):
+            cut = min(cut, run_start)
+
+    # Ampersand that may still turn into a known entity
+    amp = data.rfind("&")
+    if amp != -1:
+        tail = data[amp + 1 :]
+        if any(entity.startswith(tail) for entity in XML_ENTITIES) and (
+            tail not in XML_ENTITIES
+        ):
+            cut = min(cut, amp)
+
+    return cut
+
+
+class SSMLStreamAssembler:
+    """Turn a stream of LLM text chunks into speakable segments.
+
+    feed() returns segments as soon as they are complete: standalone
+    <speak> documents when the response is SSML, plain sentence groups
+    otherwise. finish() returns whatever remains.
+    """
+
+    def __init__(
+        self,
+        min_chars: int = DEFAULT_MIN_SEGMENT_CHARS,
+        detect_chars: int = DEFAULT_DETECT_CHARS,
+    ):
+        self.min_chars = min_chars
+        self.detect_chars = detect_chars
+        self.mode: Optional[str] = None  # None until decided, then "ssml"/"text"
+        self._raw: List[str] = []
+        self._pending = ""
+        self._preamble = ""
+        self._started = False
+        self._done = False
+        self._ssml = SSMLSegmenter(min_chars=min_chars)
+        self._text = TextSegmenter(min_chars=min_chars)
+
+    @property
+    def raw_text(self) -> str:
+        """Everything fed so far, unmodified."""
+        return "".join(self._raw)
+
+    def feed(self, chunk: str) -> List[str]:
+        """Consume the next chunk of model output."""
+        if not chunk:
+            return []
+        self._raw.append(chunk)
+        if self._done:
+            return []
+        self._pending += chunk
+        cut = _holdback_index(self._pending)
+        safe, self._pending = self._pending[:cut], self._pending[cut:]
+        return self._route(safe)
+
+    def finish(self) -> List[str]:
+        """Consume any held-back input and return the final segments."""
+        if self._done:
+            return []
+        safe, self._pending = self._pending, ""
+        out = self._route(safe)
+        self._done = True
+
+        if self.mode is None:
+            # Never decided: apply the batch rules to the whole response
+            cleaned, is_ssml = clean_llm_response(self.raw_text)
+            self.mode = "ssml" if is_ssml else "text"
+            if is_ssml:
+                return out + split_ssml_segments(cleaned, min_chars=self.min_chars)
+            return out + split_text_segments(cleaned, min_chars=self.min_chars)
+
+        if self.mode == "ssml":
+            return out + self._ssml.flush()
+        return out + [self._collapse(s) for s in self._text.flush()]
+
+    # ---------- Internals ----------
+    def _route(self, safe: str) -> List[str]:
+        if not safe or self._done:
+            return []
+        if not self._started:
+            safe = safe.lstrip()
+            if not safe:
+                return []
+            self._started = True
+        cleaned = normalize_llm_text(strip_code_fences(safe))
+
+        if self.mode is None:
+            self._preamble += cleaned
+            start = self._preamble.lower().find("<speak")
+            if start != -1:
+                self.mode = "ssml"
+                cleaned = self._preamble[start:]
+            elif (
+                "<" not in self._preamble
+                and "<" not in self._pending
+                and len(self._preamble.strip()) >= self.detect_chars
+            ):
+                self.mode = "text"
+                cleaned = self._preamble
+            else:
+                return []
+            self._preamble = ""
+
+        if self.mode == "ssml":
+            end = cleaned.lower().find("</speak>")
+            if end != -1:
+                # Text after the document is dropped, as in the batch cleaner
+                cleaned = cleaned[: end + len("</speak>")]
+                out = self._ssml.feed(sanitize_ssml_chars(cleaned))
+                out += self._ssml.flush()
+                self._done = True
+                return out
+            return self._ssml.feed(sanitize_ssml_chars(cleaned))
+
+        return [self._collapse(s) for s in self._text.feed(cleaned)]
+
+    @staticmethod
+    def _collapse(text: str) -> str:
+        return re.sub(r"\s+", " ", text).strip()
@@ -0,0 +1,234 @@
+"""
+Content-addressed cache for synthesized speech.
+
+TTSCache maps a synthesis request — normalized text or SSML plus every voice
+parameter that affects the waveform — to the LINEAR16 payload Google returned.
+Payloads live on disk as <sha256>.wav so they survive restarts; a small
+in-memory LRU sits in front for the hot set (fallback phrases, greetings).
+Both tiers are bounded in bytes and evict least-recently-used entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "data",
+    "tts_cache",
+)
+DEFAULT_MEMORY_BYTES = 16 * 1024 * 1024
+DEFAULT_DISK_BYTES = 256 * 1024 * 1024
+
+WHITESPACE_RE = re.compile(r"\s+")
+TAG_GAP_RE = re.compile(r">\s+<")
+
+
+def normalize_input(kind: str, content: str) -> str:
+    """Collapse whitespace so formatting-only differences share an entry."""
+    text = WHITESPACE_RE.sub(" ", content or "").strip()
+    if kind == "ssml":
+        text = TAG_GAP_RE.sub("><", text)
+    return text
+
+
+def make_cache_key(
+    kind: str,
+    content: str,
+    voice_name: Optional[str],
+    language_code: Optional[str],
+    speaking_rate: float,
+    pitch: float,
+    volume_gain_db: float,
+    sample_rate: int,
+) -> str:
+    """Return the sha256 key for one synthesis request."""
+    payload = json.dumps(
+        [
+            kind,
+            normalize_input(kind, content),
+            voice_name or "",
+            language_code or "",
+            round(float(speaking_rate), 4),
+            round(float(pitch), 4),
+            round(float(volume_gain_db), 4),
+            int(sample_rate),
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """Two-tier (memory LRU + disk) byte-bounded cache of TTS payloads."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        max_disk_bytes: int = DEFAULT_DISK_BYTES,
+    ):
+        self.cache_dir = Path(
+            cache_dir or os.getenv("LB_TTS_CACHE_DIR", DEFAULT_CACHE_DIR)
+        )
+        self.max_memory_bytes = int(max_memory_bytes)
+        self.max_disk_bytes = int(max_disk_bytes)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        # key -> size on disk, oldest access first
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._scan_disk()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.wav"
+
+    def _scan_disk(self) -> None:
+        """Index existing payloads, least recently touched first."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entries = []
+            for path in self.cache_dir.glob("*.wav"):
+                st = path.stat()
+                entries.append((st.st_mtime, path.stem, st.st_size))
+        except OSError as exc:
+            logging.warning(
+                "TTS cache directory unavailable (%s): %s", self.cache_dir, exc
+            )
+            return
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+        if self._disk:
+            logging.info(
+                "🗃️ TTS cache: %d entries (%.1f MB) in %s",
+                len(self._disk),
+                self._disk_bytes / 1e6,
+                self.cache_dir,
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached payload for key, or None."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                if key in self._disk:
+                    self._disk.move_to_end(key)
+                self.hits += 1
+                return data
+            if key not in self._disk:
+                self.misses += 1
+                return None
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            with self._lock:
+                self._forget_disk(key)
+                self.misses += 1
+            return None
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+            self._remember(key, data)
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a payload in memory and on disk."""
+        if not data:
+            return
+        data = bytes(data)
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logging.warning("Failed to write TTS cache entry %s: %s", key[:12], exc)
+            path = None
+        with self._lock:
+            self._remember(key, data)
+            if path is not None:
+                self._forget_disk(key)
+                self._disk[key] = len(data)
+                self._disk_bytes += len(data)
+                self._evict_disk()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            keys = list(self._disk)
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._disk.clear()
+            self._disk_bytes = 0
+        for key in keys:
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._disk),
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+    # Internal helpers below expect self._lock to be held
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _forget_disk(self, key: str) -> None:
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self.evictions += 1
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= len(old)
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
@@ -0,0 +1,371 @@
+"""
+Sentence-level TTS pipeline for the Leadership Button.
+
+Splits a model response into sentence / <p> / <s> sized segments, synthesizes
+them concurrently and exposes the results as an ordered stream, so playback
+can start on the first segment while later ones are still being synthesized.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sentence terminator (optionally followed by closing quotes/brackets) + whitespace
+SENTENCE_BOUNDARY_RE = re.compile(r"[.!?…]+[\"')\]]*\s+")
+TAG_NAME_RE = re.compile(r"<\s*(/)?\s*([a-zA-Z][\w:.-]*)")
+
+# Elements that may be closed at a segment boundary and re-opened in the next one
+REOPENABLE_TAGS = {"prosody", "voice", "lang", "p", "s"}
+# Elements that end a segment when they close
+BOUNDARY_TAGS = {"p", "s", "audio"}
+
+DEFAULT_MIN_SEGMENT_CHARS = 60
+
+
+class SSMLSegmenter:
+    """Incrementally split an SSML document into standalone <speak> segments.
+
+    Segments break at closing </p>, </s> and </audio> tags and at sentence
+    terminators in text, but only while every open element is one that can be
+    safely closed and re-opened (see REOPENABLE_TAGS). Each emitted segment is
+    a complete document: the original <speak> tag plus any carried wrappers
+    such as <prosody> are re-opened and closed around it.
+
+    feed() accepts partial input; incomplete tags and unfinished sentences are
+    held back until more input arrives or flush() is called.
+    """
+
+    def __init__(self, min_chars: int = DEFAULT_MIN_SEGMENT_CHARS):
+        self.min_chars = max(0, int(min_chars))
+        self._speak_open = "<speak>"
+        # (name, raw open tag) of currently open elements
+        self._stack: List[Tuple[str, str]] = []
+        # Wrappers still open from the previous segment, re-opened in the next
+        self._prefix = ""
+        self._buf: List[str] = []
+        self._text_chars = 0
+        self._has_content = False
+        self._pending = ""
+        self._out: List[str] = []
+
+    def feed(self, chunk: str) -> List[str]:
+        """Consume more SSML and return any segments completed by it."""
+        self._pending += chunk or ""
+        self._consume(final=False)
+        return self._take()
+
+    def flush(self) -> List[str]:
+        """Consume everything left and return the final segment(s)."""
+        self._consume(final=True)
+        self._emit(force=True)
+        return self._take()
+
+    # ---------- Internals ----------
+    def _take(self) -> List[str]:
+        out, self._out = self._out, []
+        return out
+
+    def _consume(self, final: bool) -> None:
+        data = self._pending
+        self._pending = ""
+        pos = 0
+        n = len(data)
+        while pos < n:
+            if data[pos] == "<":
+                end = data.find(">", pos)
+                if end == -1:
+                    if final:
+                        # Unterminated tag at end of document; keep as text
+                        self._on_text(data[pos:], final=True)
+                    else:
+                        self._pending = data[pos:]
+                    return
+                self._on_tag(data[pos : end + 1])
+                pos = end + 1
+            else:
+                end = data.find("<", pos)
+                last = end == -1
+                text = data[pos:] if last else data[pos:end]
+                tail = self._on_text(text, final=final or not last)
+                if tail:
+                    self._pending = tail
+                    return
+                pos = n if last else end
+
+    def _on_text(self, text: str, final: bool) -> str:
+        """Append text, emitting at sentence boundaries. Returns held-back tail."""
+        if self._inside_atomic():
+            self._append_text(text)
+            return ""
+        start = 0
+        for m in SENTENCE_BOUNDARY_RE.finditer(text):
+            self._append_text(text[start : m.end()])
+            start = m.end()
+            self._emit()
+        rest = text[start:]
+        if not rest:
+            return ""
+        if final:
+            self._append_text(rest)
+            return ""
+        return rest
+
+    def _append_text(self, text: str) -> None:
+        if not text:
+            return
+        self._buf.append(text)
+        stripped = text.strip()
+        if stripped:
+            self._text_chars += len(stripped)
+            self._has_content = True
+
+    def _on_tag(self, raw: str) -> None:
+        m = TAG_NAME_RE.match(raw)
+        if not m:
+            # Comments, processing instructions, stray '<' - pass through
+            self._buf.append(raw)
+            return
+        closing, name = bool(m.group(1)), m.group(2).lower()
+        if name == "speak":
+            if closing:
+                self._emit(force=True)
+                self._stack = []
+                self._prefix = ""
+            else:
+                self._speak_open = raw
+            return
+        self._buf.append(raw)
+        if raw.rstrip().endswith("/>"):
+            if name == "audio":
+                self._has_content = True
+                self._emit()
+            return
+        if not closing:
+            self._stack.append((name, raw))
+            return
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == name:
+                del self._stack[i:]
+                break
+        if name == "audio":
+            self._has_content = True
+        if name in BOUNDARY_TAGS:
+            self._emit()
+
+    def _inside_atomic(self) -> bool:
+        return any(name not in REOPENABLE_TAGS for name, _ in self._stack)
+
+    def _emit(self, force: bool = False) -> None:
+        if not self._has_content:
+            return
+        if self._inside_atomic():
+            return
+        if not force and self._text_chars < self.min_chars:
+            return
+        suffix = "".join(f"</{name}>" for name, _ in reversed(self._stack))
+        body = "".join(self._buf).strip()
+        self._out.append(f"{self._speak_open}{self._prefix}{body}{suffix}</speak>")
+        self._prefix = "".join(raw for _, raw in self._stack)
+        self._buf = []
+        self._text_chars = 0
+        self._has_content = False
+
+
+def split_ssml_segments(
+    ssml: str, min_chars: int = DEFAULT_MIN_SEGMENT_CHARS
+) -> List[str]:
+    """Split a complete SSML document into standalone <speak> segments."""
+    segmenter = SSMLSegmenter(min_chars=min_chars)
+    return segmenter.feed(ssml) + segmenter.flush()
+
+
+class TextSegmenter:
+    """Incrementally group plain text into sentence runs of at least min_chars.
+
+    An unfinished sentence (no terminator followed by whitespace yet) is held
+    back until more input arrives or flush() is called.
+    """
+
+    def __init__(self, min_chars: int = DEFAULT_MIN_SEGMENT_CHARS):
+        self.min_chars = max(0, int(min_chars))
+        self._buf = ""
+
+    def feed(self, chunk: str) -> List[str]:
+        """Consume more text and return any segments completed by it."""
+        self._buf += chunk or ""
+        out: List[str] = []
+        start = 0
+        for m in SENTENCE_BOUNDARY_RE.finditer(self._buf):
+            piece = self._buf[start : m.end()].strip()
+            if len(piece) >= self.min_chars:
+                out.append(piece)
+                start = m.end()
+        self._buf = self._buf[start:]
+        return out
+
+    def flush(self) -> List[str]:
+        """Return whatever text is left as a final segment."""
+        rest, self._buf = self._buf.strip(), ""
+        return [rest] if rest else []
+
+
+def split_text_segments(
+    text: str, min_chars: int = DEFAULT_MIN_SEGMENT_CHARS
+) -> List[str]:
+    """Split plain text into sentence groups of at least min_chars characters."""
+    segmenter = TextSegmenter(min_chars=min_chars)
+    return segmenter.feed(text) + segmenter.flush()
+
+
+def is_ssml_document(text: str) -> bool:
+    """True if text looks like a complete <speak>...</speak> document."""
+    t = (text or "").strip().lower()
+    return t.startswith("<speak") and t.endswith("</speak>")
+
+
+class StreamingAudioResponse:
+    """Ordered stream of synthesized segments.
+
+    Segments are submitted in speaking order; iteration yields each segment's
+    AudioData as soon as it (and every segment before it) is ready. Segments
+    that fail to synthesize are skipped.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        synthesize: Callable[[str], Optional[Any]],
+    ):
+        self._executor = executor
+        self._synthesize = synthesize
+        self._futures: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._cancelled = threading.Event()
+        self.segment_count = 0
+        self.created_at = time.monotonic()
+        self.first_audio_at: Optional[float] = None
+
+    def submit(self, segment: str) -> None:
+        """Queue a segment for synthesis (ignored after close/cancel)."""
+        if not segment or not segment.strip():
+            return
+        with self._lock:
+            if self._closed or self._cancelled.is_set():
+                return
+            index = self.segment_count
+            self.segment_count += 1
+            future = self._executor.submit(self._run, index, segment)
+            self._futures.put(future)
+
+    def close(self) -> None:
+        """Mark the end of the segment stream."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._futures.put(self._END)
+
+    def cancel(self) -> None:
+        """Stop iteration and drop any segments that have not started yet."""
+        self._cancelled.set()
+        self.close()
+        while True:
+            try:
+                item = self._futures.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, Future):
+                item.cancel()
+        # Unblock an iterator waiting on the queue
+        self._futures.put(self._END)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _run(self, index: int, segment: str) -> Optional[Any]:
+        if self._cancelled.is_set():
+            return None
+        start = time.monotonic()
+        try:
+            audio = self._synthesize(segment)
+        except Exception as exc:
+            logger.warning("Segment %d synthesis failed: %s", index, exc)
+            return None
+        logger.info(
+            "🧩 Segment %d synthesized in %.2fs (%d chars)",
+            index,
+            time.monotonic() - start,
+            len(segment),
+        )
+        return audio
+
+    def __iter__(self) -> Iterator[Any]:
+        while not self._cancelled.is_set():
+            item = self._futures.get()
+            if item is self._END:
+                return
+            try:
+                audio = item.result()
+            except Exception as exc:
+                logger.warning("Segment synthesis raised: %s", exc)
+                continue
+            if self._cancelled.is_set():
+                return
+            if audio is None:
+                continue
+            if self.first_audio_at is None:
+                self.first_audio_at = time.monotonic()
+                logger.info(
+                    "⏱️ First audio segment ready after %.2fs",
+                    self.first_audio_at - self.created_at,
+                )
+            yield audio
+
+    def __bool__(self) -> bool:
+        return not (self._closed and self.segment_count == 0)
+
+
+class TTSPipeline:
+    """Concurrent segment synthesizer backed by a shared thread pool."""
+
+    def __init__(
+        self, synthesize: Callable[[str], Optional[Any]], max_workers: int = 3
+    ):
+        self._synthesize = synthesize
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="lb-tts"
+        )
+
+    def stream(
+        self,
+        segments: Optional[List[str]] = None,
+        synthesize: Optional[Callable[[str], Optional[Any]]] = None,
+    ) -> StreamingAudioResponse:
+        """Open a response stream; if segments are given, submit and close it.
+
+        synthesize overrides the pipeline's function for this stream only.
+        """
+        response = StreamingAudioResponse(
+            self._executor, synthesize or self._synthesize
+        )
+        if segments is not None:
+            for segment in segments:
+                response.submit(segment)
+            response.close()
+        return response
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Optional
 
 from leadership_button.main_loop import MainLoop
+from leadership_button.metrics import format_report
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -144,6 +145,33 @@ class ApplicationManager:
         print(
             f"API Client: {'✓ Ready' if self.main_loop.api_client else '✗ Not Available'}"
         )
+        provider = getattr(self.main_loop.api_client, "ai_provider", None)
+        if hasattr(provider, "get_model_info"):
+            model_info = provider.get_model_info()
+            intent_stats = model_info.get("intent_stats")
+            if intent_stats:
+                print(
+                    f"Intent Fast-Path: {intent_stats['fast_hits']} hits / "
+                    f"{intent_stats['fast_misses']} misses "
+                    f"({intent_stats['round_trips_saved']} Gemini calls saved)"
+                )
+            suggester = model_info.get("suggester")
+            if suggester:
+                state = suggester["state"]
+                if state == "ready":
+                    detail = f"✓ Ready (loaded in {suggester['load_seconds']:.1f}s)"
+                elif state in ("not_loaded", "loading"):
+                    detail = f"⏳ {state.replace('_', ' ').title()} (lexical ranking)"
+                else:
+                    detail = f"✗ {state.title()} (lexical ranking)"
+                print(f"Sound Embeddings: {detail}")
+
+        # Per-stage latency histograms
+        latency = stats.get("latency") or {}
+        if latency:
+            print("\n=== Latency (p50 / p95 / p99) ===")
+            for line in format_report(latency):
+                print(line)
 
         # Configuration status
         print("\n=== Configuration ===")
@@ -0,0 +1,142 @@
+"""
+Tests for callback-mode (non-blocking) PyAudio recording and playback.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.leadership_button import audio_handler as ah
+from src.leadership_button.audio_devices import AudioDeviceManager
+from src.leadership_button.audio_handler import (
+    AudioConfig,
+    AudioData,
+    AudioHandler,
+    DeviceState,
+)
+from src.leadership_button.capture_buffer import CaptureBuffer
+
+FAKE_PYAUDIO = SimpleNamespace(paContinue=0, paComplete=1, paAbort=2, paInt16=8)
+
+
+class FakeStream:
+    def __init__(self, callback):
+        self.callback = callback
+        self.active = True
+        self.closed = False
+
+    def is_active(self):
+        return self.active
+
+    def stop_stream(self):
+        self.active = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakePyAudio:
+    def __init__(self):
+        self.streams = []
+
+    def open(self, **kwargs):
+        stream = FakeStream(kwargs.get("stream_callback"))
+        self.streams.append(stream)
+        return stream
+
+
+@pytest.fixture
+def handler(monkeypatch, tmp_path):
+    monkeypatch.setenv("LB_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(ah, "pyaudio", FAKE_PYAUDIO, raising=False)
+    monkeypatch.setattr(ah, "PYAUDIO_AVAILABLE", True)
+    h = AudioHandler(AudioConfig())
+    h.config.stream_mode = "callback"
+    h.devices = AudioDeviceManager(FakePyAudio)
+    h.audio = h.devices.acquire()
+    return h
+
+
+def test_stream_mode_is_validated():
+    config = AudioConfig()
+    assert config.stream_mode == "blocking"
+    config.stream_mode = "polling"
+    with pytest.raises(ValueError):
+        config.validate()
+
+
+def test_callback_recording_without_a_thread(handler):
+    seen = []
+    handler.set_chunk_callback(seen.append)
+    assert handler.start_recording()
+    assert handler.recording_thread is None
+    feed = handler.audio.streams[0].callback
+
+    chunk = b"\x01\x00" * 1024
+    assert feed(chunk, 1024, None, 0) == (None, FAKE_PYAUDIO.paContinue)
+    assert feed(chunk, 1024, None, 0) == (None, FAKE_PYAUDIO.paContinue)
+    audio = handler.stop_recording()
+
+    assert bytes(audio.data) == chunk * 2
+    assert seen == [chunk, chunk]
+    # Buffers arriving after the stop request end the stream
+    assert feed(chunk, 1024, None, 0)[1] == FAKE_PYAUDIO.paComplete
+
+
+def test_chunk_work_runs_off_the_portaudio_thread(handler):
+    release = threading.Event()
+    threads = []
+
+    def _slow_consumer(chunk):
+        threads.append(threading.current_thread().name)
+        release.wait(2.0)
+
+    handler.set_chunk_callback(_slow_consumer)
+    assert handler.start_recording()
+    feed = handler.audio.streams[0].callback
+
+    chunk = b"\x01\x00" * 1024
+    # The callback only copies, even while the consumer is blocked
+    for _ in range(3):
+        assert feed(chunk, 1024, None, 0) == (None, FAKE_PYAUDIO.paContinue)
+    release.set()
+    audio = handler.stop_recording()
+
+    assert bytes(audio.data) == chunk * 3
+    assert threads == ["lb-capture-worker"] * 3
+
+
+def test_callback_recording_stops_at_max_duration(handler):
+    handler.capture_buffer = CaptureBuffer(1 << 20)
+    handler._capture_frames_left = 1500
+    chunk = b"\x00\x00" * 1024
+    assert handler._capture_callback(chunk, 1024, None, 0)[1] == 0
+    assert handler._capture_callback(chunk, 1024, None, 0)[1] == 1
+
+
+def test_callback_playback_drains_and_returns_to_idle(handler):
+    audio = AudioData(b"\x01\x02" * 1500, "int16", 24000, 1)
+    assert handler.play_audio(audio)
+    assert handler.playback_thread is None
+    stream = handler.audio.streams[0]
+
+    first, flag = stream.callback(None, 1024, None, 0)
+    assert first == b"\x01\x02" * 1024 and flag == FAKE_PYAUDIO.paContinue
+    last, flag = stream.callback(None, 1024, None, 0)
+    assert flag == FAKE_PYAUDIO.paComplete
+    assert last == b"\x01\x02" * 476 + b"\x00\x00" * 548
+    assert handler.is_playing()
+
+    stream.active = False  # PortAudio finished draining
+    assert not handler.is_playing()
+    assert stream.closed and handler.get_state() == DeviceState.IDLE
+
+
+def test_stop_playback_aborts_callback_stream(handler):
+    assert handler.play_audio(b"\x00\x00" * 48000)
+    stream = handler.audio.streams[0]
+
+    handler.stop_playback()
+    assert stream.closed and not handler.is_playing()
+    assert stream.callback(None, 1024, None, 0)[1] == FAKE_PYAUDIO.paAbort
@@ -0,0 +1,117 @@
+"""
+Tests for the shared PyAudio context and device manager.
+"""
+
+from types import SimpleNamespace
+
+from src.leadership_button import audio_handler as ah
+from src.leadership_button.audio_devices import (
+    AudioDeviceManager,
+    get_audio_device_manager,
+)
+from src.leadership_button.audio_handler import AudioConfig, AudioHandler
+
+DEVICES = [
+    {"index": 0, "name": "bcm2835 Headphones", "maxInputChannels": 0},
+    {"index": 1, "name": "USB PnP Sound Device", "maxInputChannels": 1},
+]
+
+
+class FakeStream:
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+        self.stopped = False
+        self.closed = False
+
+    def is_stopped(self):
+        return self.stopped
+
+    def start_stream(self):
+        self.stopped = False
+
+    def stop_stream(self):
+        self.stopped = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakePyAudio:
+    created = 0
+
+    def __init__(self):
+        FakePyAudio.created += 1
+        self.enumerations = 0
+        self.opened = []
+        self.terminated = False
+
+    def get_device_count(self):
+        self.enumerations += 1
+        return len(DEVICES)
+
+    def get_device_info_by_index(self, i):
+        return DEVICES[i]
+
+    def open(self, **kwargs):
+        stream = FakeStream(kwargs)
+        self.opened.append(stream)
+        return stream
+
+    def terminate(self):
+        self.terminated = True
+
+
+def test_handlers_share_one_context(monkeypatch):
+    FakePyAudio.created = 0
+    manager = AudioDeviceManager(FakePyAudio)
+    monkeypatch.setattr(ah, "pyaudio", SimpleNamespace(paInt16=8), raising=False)
+    monkeypatch.setattr(ah, "PYAUDIO_AVAILABLE", True)
+    monkeypatch.setattr(ah, "get_audio_device_manager", lambda: manager)
+
+    recorder = AudioHandler(AudioConfig())
+    player = AudioHandler(AudioConfig())
+    assert recorder.audio is player.audio
+    assert FakePyAudio.created == 1
+
+    recorder.cleanup()
+    assert not player.audio.terminated
+    context = player.audio
+    player.cleanup()
+    assert context.terminated
+
+
+def test_device_enumeration_is_cached():
+    manager = AudioDeviceManager(FakePyAudio)
+    context = manager.acquire()
+
+    assert manager.resolve_input("usb pnp") == 1
+    assert manager.resolve_input("headphones") is None  # output only
+    assert manager.resolve_input(3) == 3
+    assert context.enumerations == 1
+
+
+def test_kept_output_stream_is_reused_across_playbacks():
+    manager = AudioDeviceManager(FakePyAudio)
+    context = manager.acquire()
+
+    first = manager.open_output(8, 1, 24000, 1024, keep_open=True)
+    manager.close_output(first)
+    assert not first.closed
+    first.stop_stream()  # e.g. stop_playback interrupted it
+
+    second = manager.open_output(8, 1, 24000, 1024, keep_open=True)
+    assert second is first and not second.stopped
+    assert len(context.opened) == 1
+
+    other = manager.open_output(8, 1, 16000, 1024, keep_open=True)
+    assert other is not first
+    once = manager.open_output(8, 1, 24000, 1024)
+    manager.close_output(once)
+    assert once.closed
+
+    manager.release()
+    assert first.closed and other.closed and context.terminated
+
+
+def test_process_wide_manager_is_a_singleton():
+    assert get_audio_device_manager() is get_audio_device_manager()
@@ -0,0 +1,162 @@
+"""
+Tests for compressed (FLAC / OGG_OPUS) Speech-to-Text uploads.
+"""
+
+import io
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.leadership_button import audio_encoder
+from src.leadership_button import audio_handler as ah
+from src.leadership_button.api_client import SpeechClient
+from src.leadership_button.audio_devices import AudioDeviceManager
+from src.leadership_button.audio_encoder import (
+    EncodedAudio,
+    StreamingEncoder,
+    encode_pcm,
+    resolve_encoding,
+    upload_payload,
+)
+from src.leadership_button.audio_handler import AudioConfig, AudioHandler
+
+RATE = 16000
+FAKE_PYAUDIO = SimpleNamespace(paContinue=0, paComplete=1, paAbort=2, paInt16=8)
+
+needs_soundfile = pytest.mark.skipif(
+    not audio_encoder.SOUNDFILE_AVAILABLE, reason="soundfile not installed"
+)
+
+
+def _pcm(ms, amplitude):
+    t = np.arange(RATE * ms // 1000) / RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.int16).tobytes()
+
+
+def _decode(encoded):
+    import soundfile as sf
+
+    samples, rate = sf.read(io.BytesIO(encoded.content), dtype="int16")
+    return samples.tobytes(), rate
+
+
+class FakeStream:
+    def __init__(self, callback):
+        self.callback = callback
+
+    def stop_stream(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    def __init__(self):
+        self.streams = []
+
+    def open(self, **kwargs):
+        stream = FakeStream(kwargs.get("stream_callback"))
+        self.streams.append(stream)
+        return stream
+
+
+@pytest.fixture
+def handler(monkeypatch, tmp_path):
+    monkeypatch.setenv("LB_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(ah, "pyaudio", FAKE_PYAUDIO, raising=False)
+    monkeypatch.setattr(ah, "PYAUDIO_AVAILABLE", True)
+    h = AudioHandler(AudioConfig())
+    h.config.stream_mode = "callback"
+    h.devices = AudioDeviceManager(FakePyAudio)
+    h.audio = h.devices.acquire()
+    return h
+
+
+def _record(handler, pcm):
+    assert handler.start_recording()
+    feed = handler.audio.streams[0].callback
+    for i in range(0, len(pcm), 2048):
+        chunk = pcm[i : i + 2048]
+        feed(chunk, len(chunk) // 2, None, 0)
+    return handler.stop_recording()
+
+
+def test_falls_back_to_linear16(monkeypatch):
+    assert resolve_encoding("LINEAR16", RATE) == "LINEAR16"
+    assert encode_pcm(b"\x00\x00", "LINEAR16", RATE, 1) is None
+    monkeypatch.setattr(audio_encoder, "SOUNDFILE_AVAILABLE", True)
+    assert resolve_encoding("OGG_OPUS", 44100) == "LINEAR16"
+    assert resolve_encoding("FLAC", 44100) == "FLAC"
+    monkeypatch.setattr(audio_encoder, "SOUNDFILE_AVAILABLE", False)
+    assert resolve_encoding("FLAC", RATE) == "LINEAR16"
+
+    config = AudioConfig()
+    config.upload_encoding = "MP3"
+    with pytest.raises(ValueError):
+        config.validate()
+
+
+def test_linear16_recording_uploads_raw_pcm(handler):
+    handler.upload_encoding = "LINEAR16"
+    audio = _record(handler, _pcm(300, 0) + _pcm(400, 8000) + _pcm(300, 0))
+    assert audio.encoded is None
+    assert upload_payload(audio) is audio.data
+
+
+@needs_soundfile
+def test_streamed_flac_matches_the_trimmed_upload(handler):
+    handler.upload_encoding = "FLAC"
+    audio = _record(handler, _pcm(1000, 0) + _pcm(700, 8000) + _pcm(1000, 0))
+
+    encoded = audio.encoded
+    assert encoded.encoding == "FLAC" and encoded.content[:4] == b"fLaC"
+    assert encoded.pcm_bytes == len(audio.data) < (2700 * 32) // 2
+    assert _decode(encoded) == (bytes(audio.data), RATE)
+    assert upload_payload(audio) is encoded
+
+
+@needs_soundfile
+def test_silent_recording_is_encoded_at_stop(handler):
+    handler.upload_encoding = "FLAC"
+    audio = _record(handler, _pcm(500, 0))
+    assert _decode(audio.encoded)[0] == bytes(audio.data)
+
+
+@needs_soundfile
+def test_opus_is_much_smaller():
+    pcm = _pcm(2000, 8000)
+    encoder = StreamingEncoder("OGG_OPUS", RATE, 1)
+    for i in range(0, len(pcm), 2048):
+        encoder.write(memoryview(pcm)[i : i + 2048])
+    encoded = encoder.finish()
+    assert encoded.content[:4] == b"OggS"
+    assert encoded.ratio > 4
+
+
+def test_speech_client_sends_the_matching_encoding():
+    speech = pytest.importorskip("google.cloud.speech")
+    client = SpeechClient.__new__(SpeechClient)
+    speech_config = {
+        "sample_rate_hertz": 16000,
+        "language_code": "en-US",
+        "model": "latest_long",
+        "enable_automatic_punctuation": True,
+        "max_alternatives": 1,
+    }
+    encoded = EncodedAudio(b"OggS...", "OGG_OPUS", 48000, 1, 9000)
+    audio = SimpleNamespace(data=memoryview(b"\x00" * 4), encoded=encoded)
+
+    assert client._prepare_audio_for_api(audio).content == b"OggS..."
+    config = client._build_recognition_config(
+        speech_config, encoded=client._encoded_audio(audio)
+    )
+    assert config.encoding == speech.RecognitionConfig.AudioEncoding.OGG_OPUS
+    assert config.sample_rate_hertz == 48000
+
+    raw = SimpleNamespace(data=memoryview(b"\x00" * 4))
+    assert client._encoded_audio(raw) is None
+    assert client._prepare_audio_for_api(raw).content == b"\x00" * 4
+    linear = client._build_recognition_config(speech_config)
+    assert linear.encoding == speech.RecognitionConfig.AudioEncoding.LINEAR16
@@ -0,0 +1,92 @@
+"""
+Tests for the preallocated capture buffer and AudioHandler's use of it.
+"""
+
+import pytest
+
+from src.leadership_button.audio_handler import (
+    AudioConfig,
+    AudioHandler,
+    DeviceState,
+)
+from src.leadership_button.capture_buffer import CaptureBuffer, capture_capacity
+
+
+def test_capacity_covers_max_duration_plus_a_chunk():
+    assert capture_capacity(16000, 1, 30, 1024) == (16000 * 30 + 1024) * 2
+    with pytest.raises(ValueError):
+        CaptureBuffer(0)
+
+
+def test_writes_in_place_and_views_without_copying():
+    buf = CaptureBuffer(16)
+    buf.write(b"abcd")
+    buf.write(bytearray(b"efgh"))
+    view = buf.view()
+    assert isinstance(view, memoryview)
+    assert bytes(view) == b"abcdefgh" and len(buf) == 8
+
+    # readinto-style: fill a slice in place, then commit it
+    slot = buf.writable(4)
+    slot[:] = b"ijkl"
+    buf.commit(4)
+    assert bytes(buf.view()) == b"abcdefghijkl"
+    assert not buf.overflowed
+
+
+def test_ring_keeps_latest_audio_when_full():
+    buf = CaptureBuffer(8)
+    buf.write(b"012345")
+    buf.write(b"6789")
+    assert buf.overflowed
+    assert buf.view() == b"23456789"
+
+    buf.write(b"ABCDEFGHIJ")
+    assert buf.view() == b"CDEFGHIJ"
+
+    buf.clear()
+    buf.write(b"012345")
+    buf.writable(4)[:] = b"wxyz"
+    buf.commit(4)
+    # Bytes past the old write position were never part of this lap
+    assert buf.view() == b"45wxyz" and len(buf) == 6
+
+
+class FakeStream:
+    def __init__(self, chunks, handler):
+        self.chunks = list(chunks)
+        self.handler = handler
+
+    def read(self, n, exception_on_overflow=True):
+        chunk = self.chunks.pop(0)
+        if not self.chunks:
+            self.handler.stop_recording_event.set()
+        return chunk
+
+    def stop_stream(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_recording_hands_audio_data_a_view(monkeypatch, tmp_path):
+    monkeypatch.setenv("LB_LOG_DIR", str(tmp_path))
+    handler = AudioHandler(AudioConfig())
+    chunks = [bytes([i]) * 2048 for i in range(5)]
+    seen = []
+    handler.set_chunk_callback(seen.append)
+
+    handler.capture_buffer = CaptureBuffer(64 * 1024)
+    handler.recording_stream = FakeStream(chunks, handler)
+    handler.state = DeviceState.RECORDING
+    handler._record_audio_stream()
+    audio = handler.stop_recording()
+
+    assert isinstance(audio.data, memoryview)
+    assert audio.data.obj is handler.capture_buffer._buf
+    assert bytes(audio.data) == b"".join(chunks)
+    assert audio.duration == len(b"".join(chunks)) / (audio.sample_rate * 2)
+    assert seen == chunks
+    assert handler.get_state() == DeviceState.IDLE
+    assert list((tmp_path / "audio" / "recordings").glob("*.wav"))
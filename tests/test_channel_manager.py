@@ -0,0 +1,80 @@
+"""
+Tests for persistent gRPC channel management.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import grpc
+import pytest
+
+from src.leadership_button.channel_manager import ChannelManager, channel_options
+
+
+def test_options_keep_idle_connections_alive():
+    options = dict(channel_options(keepalive_seconds=45))
+
+    assert options["grpc.keepalive_time_ms"] == 45000
+    assert options["grpc.keepalive_permit_without_calls"] == 1
+
+
+def test_create_client_uses_shared_channel():
+    manager = ChannelManager(keepalive_seconds=30)
+    channel = Mock()
+    transport_cls = Mock()
+    transport_cls.create_channel.return_value = channel
+    client_cls = Mock(DEFAULT_ENDPOINT="speech.googleapis.com")
+    client_cls.get_transport_class.return_value = transport_cls
+
+    manager.create_client("speech", client_cls)
+
+    transport_cls.create_channel.assert_called_once_with(
+        "speech.googleapis.com:443", options=manager.options
+    )
+    transport_cls.assert_called_once_with(channel=channel)
+    client_cls.assert_called_once_with(transport=transport_cls.return_value)
+    assert manager.get_status()["speech"]["state"] == "idle"
+
+
+def test_state_tracking_and_prewarm():
+    manager = ChannelManager()
+    speech, tts = Mock(), Mock()
+    manager.register("speech", speech)
+    manager.register("tts", tts)
+    on_state = speech.subscribe.call_args.args[0]
+
+    on_state(grpc.ChannelConnectivity.READY)
+    on_state(grpc.ChannelConnectivity.IDLE)
+    on_state(grpc.ChannelConnectivity.READY)
+
+    status = manager.get_status()
+    assert status["speech"]["state"] == "ready"
+    assert status["speech"]["reconnects"] == 1
+
+    with patch("src.leadership_button.channel_manager.grpc") as mock_grpc:
+        manager.prewarm()
+    mock_grpc.channel_ready_future.assert_called_once_with(tts)
+
+    manager.close()
+    speech.close.assert_called_once()
+    assert manager.get_status() == {}
+
+
+def test_close_while_prewarm_is_connecting(monkeypatch):
+    errors = []
+    monkeypatch.setattr(threading, "excepthook", lambda args: errors.append(args))
+    manager = ChannelManager()
+    # Nothing listens on port 1, so the pre-warm never becomes READY
+    channel = grpc.insecure_channel("localhost:1")
+    manager.register("speech", channel)
+    manager.prewarm()
+    time.sleep(0.05)
+
+    manager.close()
+    time.sleep(0.5)
+
+    assert errors == []
+    assert manager.get_status() == {}
+    with pytest.raises(ValueError):
+        channel.unary_unary("/test/Call")(b"")
@@ -40,6 +40,12 @@ class TestCompleteVoiceWorkflow(unittest.TestCase):
         """Set up test environment with mocked dependencies"""
         self.main_loop = None
         self.mock_audio_data = self._create_mock_audio_data()
+        # Keep MainLoop's command logs out of the repo's logs/ directory
+        log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(log_dir.cleanup)
+        log_env = patch.dict(os.environ, {"LB_LOG_DIR": log_dir.name})
+        log_env.start()
+        self.addCleanup(log_env.stop)
 
     def tearDown(self):
         """Clean up test environment"""
@@ -0,0 +1,77 @@
+"""
+Tests for turn deadlines, stage budgets and cooperative cancellation.
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.leadership_button.api_client import APIManager
+from src.leadership_button.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    run_with_deadline,
+)
+
+
+def test_stage_budget_is_capped_by_parent():
+    turn = Deadline.for_turn({"turn": 0.5, "llm": 10.0, "stt": 0.1})
+
+    assert turn.stage("llm").remaining() <= 0.5
+    assert turn.stage("stt").timeout() <= 0.1
+    assert Deadline().timeout(default=7) == 7
+
+
+def test_cancelling_parent_cancels_children():
+    turn = Deadline(10)
+    stage = turn.stage("tts", 5)
+
+    turn.cancel()
+
+    assert stage.expired()
+    with pytest.raises(DeadlineExceeded):
+        stage.check()
+
+
+def test_run_with_deadline_abandons_slow_call_and_cancels():
+    deadline = Deadline(0.1, "slow")
+    start = time.monotonic()
+
+    with pytest.raises(TimeoutError):
+        run_with_deadline(time.sleep, deadline, 1.0)
+
+    assert time.monotonic() - start < 0.5
+    assert deadline.cancelled
+    assert run_with_deadline(lambda x: x * 2, 1.0, 21) == 42
+
+
+def test_timeout_context_manager_works_off_main_thread():
+    manager = APIManager.__new__(APIManager)
+
+    def overrun():
+        with manager._timeout(0.05, "worker op"):
+            time.sleep(0.1)
+
+    with pytest.raises(DeadlineExceeded, match="worker op"):
+        run_with_deadline(overrun, 1.0)
+
+
+def test_turn_falls_back_when_ai_overruns_the_turn():
+    manager = APIManager.__new__(APIManager)
+    manager.config = Mock(performance={})
+    manager.ai_provider = Mock()
+    manager.ai_provider.process_text.side_effect = lambda text, ctx: time.sleep(1.0)
+    manager.get_fallback_audio = Mock(return_value="fallback-audio")
+    deadline = Deadline.for_turn({"turn": 0.1})
+    start = time.monotonic()
+
+    result = manager.process_conversation_turn(
+        b"\x00", transcript="hello", deadline=deadline
+    )
+
+    assert result == "fallback-audio"
+    assert time.monotonic() - start < 0.5
+    manager.get_fallback_audio.assert_called_once_with("api_unavailable")
+    context = manager.ai_provider.process_text.call_args.args[1]
+    assert context["deadline"] is deadline
@@ -0,0 +1,65 @@
+"""
+Tests for the pre-rendered fallback response audio bank.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from src.leadership_button.api_client import APIManager
+from src.leadership_button.fallback_audio import FallbackAudioBank
+
+RESPONSES = {
+    "general_help": "How can I help?",
+    "api_unavailable": "Please press the button again.",
+}
+
+
+def _bank(tmp_path, synthesize, signature="voice-a", responses=RESPONSES):
+    return FallbackAudioBank(
+        synthesize=synthesize,
+        responses=responses,
+        signature=signature,
+        sample_rate=24000,
+        bank_dir=str(tmp_path),
+    )
+
+
+def _synth(text):
+    return SimpleNamespace(data=f"RIFF:{text}".encode())
+
+
+def test_rendered_bank_loads_offline_on_restart(tmp_path):
+    bank = _bank(tmp_path, Mock(side_effect=_synth))
+    assert bank.render_missing() == 2
+
+    offline = Mock(side_effect=RuntimeError("no network"))
+    restarted = _bank(tmp_path, offline)
+    restarted.start()
+
+    assert restarted.ready.is_set()
+    assert (
+        restarted.get("api_unavailable").data == b"RIFF:Please press the button again."
+    )
+    assert restarted.get("unknown_type").data == b"RIFF:How can I help?"
+    offline.assert_not_called()
+
+
+def test_changed_voice_or_text_is_rerendered(tmp_path):
+    _bank(tmp_path, Mock(side_effect=_synth)).render_missing()
+
+    edited = dict(RESPONSES, general_help="What should we talk about?")
+    assert _bank(tmp_path, Mock(), responses=edited).load() == 1
+    assert _bank(tmp_path, Mock(), signature="voice-b").load() == 0
+
+
+def test_manager_prefers_bank_over_live_tts(tmp_path):
+    manager = APIManager.__new__(APIManager)
+    manager.fallback_bank = _bank(tmp_path, Mock(side_effect=_synth))
+    manager.fallback_bank.render_missing()
+    manager.text_to_speech = Mock()
+    manager.ai_provider = None
+
+    audio = manager.process_conversation_turn(b"\x00" * 32)
+
+    assert audio.data == b"RIFF:Please press the button again."
+    manager.text_to_speech.assert_not_called()
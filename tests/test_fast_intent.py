@@ -0,0 +1,98 @@
+"""
+Tests for the local fast-path intent classifier and IntentAnalyzer fallback.
+"""
+
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.leadership_button.fast_intent import (
+    FastIntentClassifier,
+    build_intent_model,
+)
+from src.leadership_button.intent_analyzer import IntentAnalyzer
+
+
+@pytest.fixture
+def classifier(tmp_path):
+    return FastIntentClassifier(model_path=str(tmp_path / "missing.json"))
+
+
+def test_rules_cover_common_requests(classifier):
+    intent, conf = classifier.classify("Tell me a bedtime story please")
+    assert intent["request"] == "story"
+    assert conf >= 0.8
+
+    intent, conf = classifier.classify("How do I share my toys with my sister?")
+    assert intent["request"] == "advice"
+    assert intent["pieces"] == []
+    assert conf >= 0.8
+
+    intent, _ = classifier.classify("I'm scared, what should I do at the recital?")
+    assert intent["tone"] == "gentle"
+
+
+def test_specific_story_extracts_pieces(classifier):
+    intent, conf = classifier.classify(
+        "Can you tell me a story about a brave dragon and Luna the cat."
+    )
+
+    assert intent["request"] == "specific_story"
+    names = [p["name"] for p in intent["pieces"]]
+    assert "brave dragon" in names
+    assert "Luna" in names
+    assert set(intent) == {"request", "tone", "context", "pieces"}
+    assert conf >= 0.8
+
+
+def test_unmatched_utterance_has_no_confidence(classifier):
+    assert classifier.classify("banana") == (None, 0.0)
+
+
+def test_model_built_from_logged_intents(tmp_path):
+    records = [
+        {"utterance": "dragons and castles adventure", "intent": {"request": "story"}},
+        {"utterance": "sharing is hard at school", "intent": {"request": "advice"}},
+    ] * 15
+    path = tmp_path / "model.json"
+    path.write_text(json.dumps(build_intent_model(records)))
+
+    clf = FastIntentClassifier(model_path=str(path))
+
+    intent, conf = clf.classify("castles")
+    assert intent["request"] == "story"
+    assert conf > 0.8
+
+
+def _analyzer(**kwargs):
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        with patch("src.leadership_button.intent_analyzer.genai"):
+            return IntentAnalyzer(**kwargs)
+
+
+def test_analyzer_counts_fast_hits_and_llm_fallbacks(tmp_path):
+    analyzer = _analyzer(
+        fast_classifier=FastIntentClassifier(model_path=str(tmp_path / "none.json"))
+    )
+    part = Mock(
+        text=json.dumps(
+            {"request": "advice", "tone": "regular", "context": "x", "pieces": []}
+        )
+    )
+    response = Mock(candidates=[Mock(content=Mock(parts=[part]))])
+    analyzer.model.generate_content = Mock(return_value=response)
+
+    with patch.dict(os.environ, {"LB_LOG_DIR": str(tmp_path)}):
+        assert analyzer.analyze("Tell me a story")["request"] == "story"
+        assert analyzer.analyze("banana pancakes")["request"] == "advice"
+
+    stats = analyzer.get_stats()
+    assert stats["fast_hits"] == 1
+    assert stats["fast_misses"] == 1
+    assert stats["llm_calls"] == 1
+    assert stats["round_trips_saved"] == 1
+    analyzer.model.generate_content.assert_called_once()
+    logged = (tmp_path / "intents" / "intent_log.jsonl").read_text().splitlines()
+    assert json.loads(logged[0])["utterance"] == "banana pancakes"
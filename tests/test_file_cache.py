@@ -0,0 +1,69 @@
+"""
+Tests for mtime-invalidated file caches and the curated top-100 list.
+"""
+
+import os
+
+import pytest
+
+from src.leadership_button.curated_audio import parse_top100
+from src.leadership_button.file_cache import FileBackedCache
+
+TOP100 = (
+    "title,type,duration_seconds,relpath,url,source_directory,category,tags\n"
+    "Lullaby Night,music,103.2,mixkit/lullaby.mp3,https://x/lullaby.mp3,"
+    'mixkit,Piano,"Piano,Kids"\n'
+    "Pop,weird,bad,,https://x/pop.mp3,filmcow,Fx,\n"
+)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_parses_once_and_reloads_on_change(tmp_path):
+    path = tmp_path / "list.txt"
+    path.write_text("a\nb\n")
+    cache = FileBackedCache(str(path), lambda p: tuple(open(p).read().split()))
+
+    first = cache.get()
+    assert first == ("a", "b")
+    assert cache.get() is first
+    assert cache.loads == 1
+
+    path.write_text("a\nb\nc\n")
+    _bump_mtime(path)
+    assert cache.get() == ("a", "b", "c")
+    assert cache.loads == 2
+
+
+def test_missing_and_broken_files(tmp_path):
+    path = tmp_path / "gone.txt"
+    assert FileBackedCache(str(path), len, default=()).get() == ()
+    with pytest.raises(FileNotFoundError):
+        FileBackedCache(str(path), len).get()
+
+    path.write_text("x")
+
+    def _boom(p):
+        raise ValueError("bad file")
+
+    broken = FileBackedCache(str(path), _boom, default=())
+    assert broken.get() == ()
+    assert broken.get() == ()
+    assert broken.loads == 1
+
+
+def test_top100_yields_shared_suggestions_and_whitelist(tmp_path):
+    path = tmp_path / "top100.csv"
+    path.write_text(TOP100, encoding="utf-8")
+    cache = FileBackedCache(str(path), parse_top100)
+
+    curated = cache.get()
+    assert isinstance(curated.suggestions, tuple)
+    assert curated.suggestions[0]["filename"] == "lullaby.mp3"
+    assert curated.suggestions[1]["type"] == "sfx"
+    assert curated.suggestions[1]["duration"] == 0.0
+    assert curated.whitelist == frozenset({"mixkit/lullaby.mp3"})
+    assert cache.get() is curated
@@ -0,0 +1,142 @@
+"""
+Tests for concurrent prompt preparation and speculative generation in
+GeminiFlashProvider.
+"""
+
+import os
+import time
+from concurrent.futures import Future
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.leadership_button.api_client import APIManager
+from src.leadership_button.deadline import Deadline
+from src.leadership_button.gemini_provider import GeminiFlashProvider
+from src.leadership_button.prompts_config import PromptsConfig
+
+
+class _SlowIntent:
+    def __init__(self, request, delay=0.2, tone="regular", context=""):
+        self.request = request
+        self.delay = delay
+        self.tone = tone
+        self.context = context
+
+    def analyze(self, text):
+        time.sleep(self.delay)
+        return {
+            "request": self.request,
+            "tone": self.tone,
+            "context": self.context,
+            "pieces": [],
+        }
+
+
+@pytest.fixture
+def provider():
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        with patch("src.leadership_button.gemini_provider.genai"):
+            with patch("src.leadership_button.intent_analyzer.genai"):
+                p = GeminiFlashProvider({"model": "gemini-1.5-flash"})
+    p.suggester = None
+    yield p
+    p.cleanup()
+
+
+def test_intent_and_sound_list_load_concurrently(provider):
+    provider.intent_analyzer = _SlowIntent("story")
+
+    def slow_top100():
+        time.sleep(0.2)
+        return [{"display_title": "Rain", "type": "sfx", "duration": 3.0}]
+
+    provider._load_kid_top100 = slow_top100
+
+    start = time.monotonic()
+    prompt, speculative = provider._build_prompt("Tell me a story", {})
+    elapsed = time.monotonic() - start
+
+    assert speculative is None
+    assert "Rain" in prompt
+    assert elapsed < 0.35
+
+
+def test_speculation_kept_when_prompt_matches(provider):
+    provider.intent_analyzer = _SlowIntent("advice")
+    provider._load_kid_top100 = lambda: []
+    request = Mock(return_value="speculative answer")
+
+    _, speculative = provider._build_prompt("How do I share?", {}, request)
+
+    assert speculative is not None
+    assert speculative.result(timeout=1) == "speculative answer"
+    request.assert_called_once()
+
+
+def test_speculation_discarded_when_intent_changes_prompt_file(provider):
+    provider.intent_analyzer = _SlowIntent("story")
+    provider._load_kid_top100 = lambda: []
+
+    _, speculative = provider._build_prompt("Tell me a story", {}, Mock())
+
+    assert speculative is None
+
+
+@pytest.mark.parametrize(
+    "intent",
+    [
+        _SlowIntent("advice", tone="silly"),
+        _SlowIntent("advice", context="my little sister took my toy"),
+    ],
+)
+def test_speculation_discarded_when_tone_or_context_differs(provider, intent):
+    provider.intent_analyzer = intent
+    provider._load_kid_top100 = lambda: []
+
+    _, speculative = provider._build_prompt("How do I share?", {}, Mock())
+
+    assert speculative is None
+
+
+def test_process_text_uses_kept_speculation(provider):
+    provider.intent_analyzer = _SlowIntent("advice", delay=0.05)
+    provider._load_kid_top100 = lambda: []
+    provider.speculative_generation = True
+    provider._make_api_request = Mock(return_value="Be kind to your team.")
+
+    assert provider.process_text("How do I lead?", {}) == "Be kind to your team."
+    provider._make_api_request.assert_called_once()
+
+
+
+def test_hung_speculative_open_respects_llm_deadline(provider):
+    hung = Future()
+    provider._build_prompt = Mock(return_value=("prompt", hung))
+    deadline = Deadline.for_turn({"llm": 0.2})
+
+    start = time.monotonic()
+    chunks = list(provider.stream_text("How do I lead?", {"deadline": deadline}))
+
+    assert time.monotonic() - start < 1.0
+    assert chunks == [PromptsConfig.get_fallback_response("connection_error")]
+    assert hung.cancelled()
+
+
+def test_api_manager_cleanup_stops_provider_executor(provider):
+    manager = APIManager.__new__(APIManager)
+    manager._tts_pipeline = None
+    manager.channel_manager = None
+    manager.speech_client = None
+    manager.tts_client = None
+    manager.ai_provider = provider
+    busy = [provider._executor.submit(time.sleep, 0.2) for _ in range(4)]
+    queued = provider._executor.submit(time.sleep, 0.2)
+
+    manager.cleanup()
+
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        provider._executor.submit(time.sleep, 0)
+    for future in busy:
+        future.result(timeout=1)
@@ -19,6 +19,12 @@ from src.leadership_button.gemini_provider import GeminiFlashProvider
 class TestGeminiIntegration:
     """Integration test suite for Gemini Flash integration."""
 
+    @pytest.fixture(autouse=True)
+    def _log_dir(self, tmp_path, monkeypatch):
+        # Keep MainLoop's command logs out of the repo's logs/ directory
+        self.log_dir = str(tmp_path)
+        monkeypatch.setenv("LB_LOG_DIR", self.log_dir)
+
     def setup_method(self):
         """Set up test fixtures."""
         self.test_api_key = "test-gemini-key-12345"
@@ -148,7 +154,7 @@ class TestGeminiIntegration:
         mock_audio_init.return_value = None
 
         # No GEMINI_API_KEY set
-        with patch.dict(os.environ, {}, clear=True):
+        with patch.dict(os.environ, {"LB_LOG_DIR": self.log_dir}, clear=True):
             main_loop = MainLoop()
 
             # Verify mock provider is used as fallback
@@ -103,6 +103,11 @@ class TestMainLoopKeyboardEmulator(unittest.TestCase):
         with open(self.config_file, "w") as f:
             json.dump(test_config, f)
 
+        # Keep MainLoop's command logs out of the repo's logs/ directory
+        log_env = patch.dict(os.environ, {"LB_LOG_DIR": self.temp_dir})
+        log_env.start()
+        self.addCleanup(log_env.stop)
+
         # Create keyboard emulator
         self.keyboard = KeyboardEmulator()
 
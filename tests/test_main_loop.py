@@ -32,6 +32,13 @@ class TestMainLoop(unittest.TestCase):
         with open(self.config_file, "w") as f:
             json.dump(test_config, f)
 
+        # Keep MainLoop's command logs out of the repo's logs/ directory
+        log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(log_dir.cleanup)
+        log_env = patch.dict(os.environ, {"LB_LOG_DIR": log_dir.name})
+        log_env.start()
+        self.addCleanup(log_env.stop)
+
     def tearDown(self):
         """Clean up test fixtures."""
         if os.path.exists(self.config_file):
@@ -0,0 +1,76 @@
+"""
+Tests for per-stage latency histograms and their export.
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from src.leadership_button.main_loop import ApplicationState, MainLoop
+from src.leadership_button.metrics import (
+    LatencyHistogram,
+    MetricsRegistry,
+    format_report,
+    metrics,
+)
+
+
+def test_histogram_percentiles_within_bucket_width():
+    hist = LatencyHistogram()
+    for ms in range(1, 1001):
+        hist.record(ms / 1000.0)
+
+    snap = hist.snapshot()
+
+    assert snap["count"] == 1000
+    assert abs(snap["p50"] - 0.5) / 0.5 < 0.2
+    assert abs(snap["p99"] - 0.99) / 0.99 < 0.2
+    assert snap["min"] == 0.001 and snap["max"] == 1.0
+    assert len(hist.counts) == len(LatencyHistogram().counts)
+
+
+def test_span_records_and_dump_writes_json(tmp_path):
+    registry = MetricsRegistry()
+
+    with registry.span("llm"):
+        time.sleep(0.01)
+    registry.record("custom", 0.2)
+    registry.record("stt", 0.3)
+
+    snap = registry.snapshot()
+    assert list(snap) == ["stt", "llm", "custom"]
+    assert snap["llm"]["p50"] >= 0.009
+
+    path = registry.dump(str(tmp_path / "latency.json"))
+    data = json.loads(path.read_text())
+    assert data["stages"]["stt"]["count"] == 1
+    assert format_report(snap)[0].startswith("stt")
+
+
+def test_main_loop_records_turn_latency(tmp_path, monkeypatch):
+    monkeypatch.setenv("LB_LOG_DIR", str(tmp_path))
+    metrics.reset()
+    loop = MainLoop.__new__(MainLoop)
+    loop.logger = Mock()
+    loop.state_lock = threading.Lock()
+    loop.current_state = ApplicationState.PROCESSING
+    loop.start_time = 0.0
+    loop.response_times = []
+    loop.spacebar_pressed_event = threading.Event()
+    loop.playback_interrupt_event = threading.Event()
+    loop._turn_started_at = time.monotonic() - 0.5
+    loop._commands_log_dir = tmp_path
+    loop.playback_manager = SimpleNamespace(
+        play_audio_and_wait=lambda *a, **k: time.sleep(0.02),
+        first_audio_at=time.monotonic(),
+    )
+
+    loop._handle_api_response(b"audio")
+
+    stats = loop.get_performance_stats()
+    assert 0.4 < stats["response_times"][0] < 1.0
+    assert stats["latency"]["first_audio"]["count"] == 1
+    assert stats["latency"]["turn"]["count"] == 1
+    assert (tmp_path / "metrics" / "latency.json").exists()
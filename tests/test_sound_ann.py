@@ -0,0 +1,82 @@
+"""
+Tests for the IVF nearest-neighbour index and semantic candidate merging.
+"""
+
+import numpy as np
+
+from src.leadership_button import sound_suggester as ss
+from src.leadership_button.sound_ann import IVFIndex
+from src.leadership_button.sound_suggester import SoundSuggester
+
+
+def _unit(rng, n, dim):
+    m = rng.normal(size=(n, dim)).astype(np.float32)
+    return m / np.linalg.norm(m, axis=1, keepdims=True)
+
+
+def test_ivf_recall_and_roundtrip(tmp_path):
+    rng = np.random.default_rng(1)
+    matrix = _unit(rng, 2000, 16)
+    matrix[5] = 0.0  # a row without an embedding is never returned
+    index = IVFIndex.build(matrix)
+    assert index.n_lists == int(np.sqrt(1999))
+    assert 5 not in index.order
+
+    hits = 0
+    queries = _unit(rng, 20, 16)
+    for q in queries:
+        exact = set(np.argsort(-(matrix @ q))[:10].tolist())
+        ids, scores = index.search(matrix, q, 10, n_probe=16)
+        assert list(scores) == sorted(scores, reverse=True)
+        hits += len(exact & set(ids.tolist()))
+    assert hits / 200 > 0.8
+
+    path = str(tmp_path / "emb.ivf.npz")
+    index.save(path)
+    loaded = IVFIndex.load(path)
+    ids, _ = index.search(matrix, queries[0], 10)
+    assert np.array_equal(loaded.search(matrix, queries[0], 10)[0], ids)
+    assert IVFIndex.load(str(tmp_path / "missing.npz")) is None
+
+
+class AxisModel:
+    """Maps each known word to its own axis."""
+
+    WORDS = ["lullaby", "thunder", "bell", "bedtime"]
+
+    def encode(self, texts, **kwargs):
+        out = np.zeros((len(texts), 4), dtype=np.float32)
+        for i, t in enumerate(texts):
+            for j, w in enumerate(self.WORDS):
+                out[i, j] = t.lower().count(w)
+            if "bedtime" in t:
+                out[i, 0] += 1.0
+        return out
+
+
+def test_semantic_candidates_without_token_overlap(monkeypatch, tmp_path):
+    monkeypatch.setattr(ss, "ST_AVAILABLE", True)
+    monkeypatch.setattr(SoundSuggester, "_load_model", lambda self, name: AxisModel())
+    suggester = SoundSuggester(
+        csv_path="/dev/null", sidecar_path=str(tmp_path / "none.parquet")
+    )
+    suggester.rows = [
+        {"filename": "lullaby.mp3", "kit_title": "Lullaby", "duration": 1.0},
+        {"filename": "thunder.mp3", "kit_title": "Thunder", "duration": 1.0},
+        {"filename": "bell.wav", "kit_title": "Bell", "duration": 1.0},
+    ]
+    assert suggester.load_model()
+
+    query_vec = suggester._query_vector("bedtime")
+    semantic = suggester._semantic_candidates(query_vec)
+    assert semantic[0]["filename"] == "lullaby.mp3"
+    # Ineligible rows (wrong extension) are filtered like the prefilter does
+    assert all(r["filename"] != "bell.wav" for r in semantic)
+
+    candidates = suggester._prefilter(suggester.rows, ["bedtime"])
+    assert candidates == []
+    assert suggester._merge_candidates(candidates, semantic) == len(semantic)
+    assert suggester._merge_candidates(candidates, semantic) == 0
+
+    picks = suggester.suggest({"request": "story", "context": "bedtime"}, limit=3)
+    assert picks[0]["filename"] == "lullaby.mp3"
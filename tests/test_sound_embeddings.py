@@ -0,0 +1,166 @@
+"""
+Tests for the binary embedding sidecar and SoundSuggester's aligned matrix.
+"""
+
+import csv
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from src.leadership_button import sound_suggester as ss
+from src.leadership_button.sound_embeddings import EmbeddingSidecar, load_sidecar
+from src.leadership_button.sound_suggester import SoundSuggester
+
+ROWS = [
+    {"filename": "rain.mp3", "kit_title": "Rain", "kit_tags": "rain", "duration": 1.0},
+    {"filename": "wind.mp3", "kit_title": "Wind", "kit_tags": "wind", "duration": 2.0},
+    {"filename": "bell.mp3", "kit_title": "Bell", "kit_tags": "bell", "duration": 1.5},
+]
+
+
+class FakeModel:
+    """Embeds text as letter counts; records every encode call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array(
+            [[t.count(c) for c in "rainwdbel"] for t in texts], dtype=np.float32
+        )
+
+
+def _suggester(monkeypatch, model, **kwargs):
+    monkeypatch.setattr(ss, "ST_AVAILABLE", True)
+    monkeypatch.setattr(SoundSuggester, "_load_model", lambda self, name: model)
+    suggester = SoundSuggester(**kwargs)
+    assert suggester.load_model()
+    return suggester
+
+
+def test_missing_rows_are_batch_encoded_once(monkeypatch, tmp_path):
+    model = FakeModel()
+    suggester = _suggester(
+        monkeypatch,
+        model,
+        csv_path="/dev/null",
+        sidecar_path=str(tmp_path / "none.parquet"),
+    )
+    suggester.rows = [dict(r) for r in ROWS]
+    suggester._rerank(suggester.rows, "rain", ["rain"])
+    suggester._rerank(suggester.rows, "bell", ["bell"])
+
+    # One batch for the library, then one call per query
+    assert [len(c) for c in model.calls] == [3, 1, 1]
+    matrix = suggester._embeddings
+    assert matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+
+    ranked = suggester._rerank(suggester.rows, "bell", ["bell"])
+    q = model.encode(["bell"])[0]
+    for _, row, meta in ranked:
+        v = model.encode([suggester._row_text(row)])[0]
+        expected = float(v @ q / (np.linalg.norm(v) * np.linalg.norm(q)))
+        assert abs(meta["emb_sim"] - expected) < 1e-5
+    assert ranked[0][1]["filename"] == "bell.mp3"
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_binary_sidecar_is_written_and_memory_mapped(monkeypatch, tmp_path):
+    csv_path = tmp_path / "soundlibrary.csv"
+    _write_csv(csv_path, ROWS)
+    sidecar = str(tmp_path / "embeddings.npy")
+
+    first = FakeModel()
+    _suggester(monkeypatch, first, csv_path=str(csv_path), sidecar_path=sidecar)
+    assert [len(c) for c in first.calls] == [3]
+    saved = EmbeddingSidecar.open(sidecar)
+    assert saved.filenames == [r["filename"] for r in ROWS]
+    assert saved.model == ss.DEFAULT_EMBEDDING_MODEL and saved.dim == 9
+    assert saved.library_hash
+
+    second = FakeModel()
+    again = _suggester(
+        monkeypatch, second, csv_path=str(csv_path), sidecar_path=sidecar
+    )
+    assert second.calls == []
+    assert isinstance(again._embeddings, np.memmap)
+    assert again._embeddings.shape == (3, 9)
+
+
+def test_parquet_sidecar_is_migrated(tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    parquet = tmp_path / "embeddings.parquet"
+    pd.DataFrame(
+        {
+            "filename": ["wind.mp3", "rain.mp3"],
+            "embedding": [json.dumps([0.0, 2.0]), json.dumps([3.0, 4.0])],
+            "model": "m",
+            "dim": 2,
+        }
+    ).to_parquet(parquet, index=False)
+
+    sidecar = load_sidecar(str(parquet))
+    assert (tmp_path / "embeddings.npy").exists()
+    assert (tmp_path / "embeddings.json").exists()
+    assert sidecar.model == "m"
+    assert np.allclose(sidecar.vectors, [[0.0, 1.0], [0.6, 0.8]])
+
+    reopened = load_sidecar(str(tmp_path / "embeddings.npy"))
+    assert isinstance(reopened.vectors, np.memmap)
+    # Realigned by filename for a different library order
+    aligned = reopened.aligned(["rain.mp3", "bell.mp3", "wind.mp3"])
+    assert np.allclose(aligned, [[0.6, 0.8], [0.0, 0.0], [0.0, 1.0]])
+    assert reopened.aligned(["wind.mp3", "rain.mp3"]) is reopened.vectors
+
+
+def test_model_loads_in_background_and_reports_status(monkeypatch, tmp_path):
+    release = threading.Event()
+    model = FakeModel()
+
+    def _slow_load(self, name):
+        release.wait(5)
+        return model
+
+    monkeypatch.setattr(ss, "ST_AVAILABLE", True)
+    monkeypatch.setattr(SoundSuggester, "_load_model", _slow_load)
+    suggester = SoundSuggester(
+        csv_path="/dev/null", sidecar_path=str(tmp_path / "none.npy")
+    )
+    suggester.rows = [dict(r) for r in ROWS]
+    assert suggester.model_status()["state"] == "not_loaded"
+
+    assert suggester.start_model_load()
+    assert not suggester.start_model_load()
+    assert suggester.model_status()["state"] == "loading"
+    # Lexical-only ranking while the model loads
+    ranked = suggester._rerank(suggester.rows, "bell", ["bell"])
+    assert all("emb_sim" not in meta for _, _, meta in ranked)
+    assert model.calls == []
+
+    release.set()
+    assert suggester.load_model()
+    status = suggester.model_status()
+    assert status["state"] == "ready" and status["load_seconds"] >= 0
+    assert status["rows_embedded"] == 3
+    ranked = suggester._rerank(suggester.rows, "bell", ["bell"])
+    assert ranked[0][1]["filename"] == "bell.mp3" and "emb_sim" in ranked[0][2]
+
+
+def test_model_status_without_sentence_transformers(monkeypatch):
+    monkeypatch.setattr(ss, "ST_AVAILABLE", False)
+    suggester = SoundSuggester(csv_path="/dev/null")
+
+    assert suggester.model_status()["state"] == "unavailable"
+    assert not suggester.start_model_load()
+    assert not suggester.load_model()
@@ -0,0 +1,102 @@
+"""
+Tests for the prebuilt SSML audio src index.
+"""
+
+import builtins
+import csv
+import random
+
+import pytest
+
+from src.leadership_button.sound_index import (
+    SoundURLIndex,
+    get_sound_url_index,
+    normalize_key,
+)
+
+ROWS = [
+    {
+        "filename": "feeling_paper.ogg",
+        "file_path": "/x/public/sounds/foley/feeling_paper.ogg",
+        "google_cloud_url": "",
+        "kit_title": "Paper Rustle",
+        "kit_tags": "paper, crinkle",
+    },
+    {
+        "filename": "mixkit-light-rain-loop-1253.mp3",
+        "file_path": "C:\\lib\\public\\sounds\\mixkit\\mixkit-light-rain-loop-1253.mp3",
+        "google_cloud_url": "https://storage.googleapis.com/cwsounds/rain.mp3",
+        "kit_title": "Light Rain",
+        "kit_tags": "rain,weather",
+    },
+    {
+        "filename": "ding.wav",
+        "file_path": "",
+        "google_cloud_url": "",
+        "kit_title": "",
+        "kit_tags": "",
+    },
+]
+
+
+def _linear_partial(index, key, stem):
+    """The old O(n) scan, used as the reference for partial matches."""
+    for k in index.entries:
+        if key and (key in k or k in key or stem in k or k in stem):
+            return k
+    return None
+
+
+def test_exact_stem_partial_and_filename_lookups():
+    index = SoundURLIndex(ROWS)
+
+    paper = "https://storage.googleapis.com/cwsounds/foley/feeling_paper.ogg"
+    assert index.resolve("feeling_paper") == (paper, "feeling_paper")
+    assert index.resolve(" Paper Rustle ") == (paper, "paper_rustle")
+    assert index.resolve("light_rain.wav")[1] == "light_rain"
+    assert index.resolve("soft_rain_on_roof") == (
+        "https://storage.googleapis.com/cwsounds/rain.mp3",
+        "rain",
+    )
+    assert index.resolve("crinkled")[1] == "crinkle"
+    assert index.resolve("ding")[0].endswith("/cwsounds/ding.wav")
+    assert index.resolve("thunderclap") == (None, None)
+
+
+def test_partial_matches_agree_with_linear_scan():
+    rng = random.Random(7)
+    words = ["rain", "paper", "door", "wind", "bell", "dog", "bark", "ab", "x"]
+    rows = [
+        {
+            "filename": "_".join(rng.sample(words, 2)) + f"_{i}.ogg",
+            "kit_tags": ",".join(rng.sample(words, 2)),
+        }
+        for i in range(200)
+    ]
+    index = SoundURLIndex(rows)
+
+    for _ in range(300):
+        token = "_".join(rng.sample(words + ["zzz", "rainy"], rng.randint(1, 3)))
+        key = normalize_key(token)
+        if key in index.entries:
+            continue
+        expected = _linear_partial(index, key, key)
+        assert index.resolve(token)[1] == expected
+
+
+def test_shared_index_does_no_disk_io_after_build(tmp_path, monkeypatch):
+    path = tmp_path / "soundlibrary.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(ROWS[0]))
+        writer.writeheader()
+        writer.writerows(ROWS)
+
+    index = get_sound_url_index(str(path))
+    assert get_sound_url_index(str(path)) is index
+
+    def _no_open(*args, **kwargs):
+        pytest.fail("resolve() touched the disk")
+
+    monkeypatch.setattr(builtins, "open", _no_open)
+    assert index.resolve("no_such_sound") == (None, None)
+    assert index.resolve("paper")[1] == "paper"
@@ -0,0 +1,127 @@
+"""
+Tests for the compiled sound library snapshot.
+"""
+
+import csv
+import os
+
+from src.leadership_button import sound_library
+from src.leadership_button.sound_index import SoundURLIndex
+from src.leadership_button.sound_library import (
+    SoundLibrary,
+    default_snapshot_path,
+    load_sound_library,
+)
+from src.leadership_button.sound_suggester import SoundSuggester
+
+ROWS = [
+    {
+        "filename": "mixkit-gentle-rain-1.mp3",
+        "file_path": "/g/public/sounds/mixkit/mixkit-gentle-rain-1.mp3",
+        "duration": "30.5",
+        "sample_rate": "44100",
+        "google_cloud_url": "",
+        "source_directory": "Mixkit",
+        "kit_title": "Gentle Rain",
+        "kit_category": "Ambient",
+        "kit_tags": "rain,soft",
+    },
+    {
+        "filename": "wing flap.ogg",
+        "file_path": "/g/public/sounds/FilmCow/wing flap.ogg",
+        "duration": "",
+        "sample_rate": "48000",
+        "google_cloud_url": "https://example.com/wing.ogg",
+        "source_directory": "filmcow",
+        "kit_title": "Wing Flap ☁",
+        "kit_category": "",
+        "kit_tags": "",
+    },
+]
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_snapshot_roundtrip_with_typed_and_derived_columns(tmp_path):
+    csv_path = tmp_path / "soundlibrary.csv"
+    _write_csv(csv_path, ROWS)
+
+    library = load_sound_library(str(csv_path))
+    snapshot = default_snapshot_path(str(csv_path))
+    assert snapshot.exists()
+
+    reopened = SoundLibrary.open(snapshot)
+    rows = reopened.rows()
+    assert rows[0]["duration"] == 30.5 and rows[1]["duration"] == ""
+    assert rows[0]["sample_rate"] == 44100
+    assert rows[1]["kit_title"] == "Wing Flap ☁"
+    assert list(reopened.column("filename")) == [r["filename"] for r in ROWS]
+    assert reopened.split_column("_keys")[0] == [
+        "mixkit_gentle_rain_1",
+        "gentle_rain",
+        "rain",
+        "soft",
+    ]
+    assert reopened.column("_url")[1].endswith("/cwsounds/FilmCow/wing%20flap.ogg")
+    assert reopened.column("_index_url")[1] == "https://example.com/wing.ogg"
+    assert "rain" in reopened.split_column("_terms")[0]
+    suggester = SoundSuggester(csv_path="/dev/null")
+    assert [set(t) for t in reopened.split_column("_sim_terms")] == [
+        set(suggester._sim_features(r)[0]) for r in ROWS
+    ]
+    assert reopened.header["source"]["sha256"] == library.header["source"]["sha256"]
+
+
+def test_stale_snapshot_is_recompiled(tmp_path):
+    csv_path = tmp_path / "soundlibrary.csv"
+    _write_csv(csv_path, ROWS[:1])
+    assert len(load_sound_library(str(csv_path))) == 1
+
+    _write_csv(csv_path, ROWS)
+    st = os.stat(csv_path)
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert len(load_sound_library(str(csv_path))) == 2
+    assert len(SoundLibrary.open(default_snapshot_path(str(csv_path)))) == 2
+
+
+def test_snapshot_from_older_derivation_code_is_recompiled(tmp_path, monkeypatch):
+    csv_path = tmp_path / "soundlibrary.csv"
+    _write_csv(csv_path, ROWS)
+    library = load_sound_library(str(csv_path))
+    assert library.header["derivation"] == sound_library.derivation_hash()
+    assert library.is_current(str(csv_path))
+
+    # e.g. a tokenizer changed since the snapshot was built
+    monkeypatch.setattr(sound_library, "_derivation_hash", "0" * 64)
+    stale = SoundLibrary.open(default_snapshot_path(str(csv_path)))
+    assert not stale.is_current(str(csv_path))
+    rebuilt = load_sound_library(str(csv_path))
+    assert rebuilt.header["derivation"] == "0" * 64
+    # Without the CSV there is nothing to rebuild from; keep serving it
+    assert stale.is_current(str(tmp_path / "missing.csv"))
+
+
+def test_consumers_read_the_snapshot(tmp_path):
+    csv_path = tmp_path / "soundlibrary.csv"
+    _write_csv(csv_path, ROWS)
+    library = load_sound_library(str(csv_path))
+
+    index = SoundURLIndex.from_library(library)
+    assert index.resolve("gentle rain")[1] == "gentle_rain"
+    assert index.resolve("wing_flap")[0] == "https://example.com/wing.ogg"
+
+    suggester = SoundSuggester(csv_path=str(csv_path))
+    assert [r["filename"] for r in suggester.rows] == [r["filename"] for r in ROWS]
+
+
+def test_missing_csv_gives_empty_library(tmp_path):
+    library = load_sound_library(str(tmp_path / "missing.csv"))
+
+    assert len(library) == 0
+    assert library.rows() == []
@@ -0,0 +1,72 @@
+"""
+Tests for incremental MMR selection in SoundSuggester.
+"""
+
+import random
+
+from src.leadership_button import sound_suggester as ss
+from src.leadership_button.sound_suggester import SoundSuggester
+
+WORDS = ["rain", "wind", "dragon", "bell", "piano", "soft", "storm"]
+
+
+def _items(n, seed=5):
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        row = {
+            "filename": f"mixkit-{'-'.join(rng.sample(WORDS, 2))}-{i}.mp3",
+            "kit_tags": ",".join(rng.sample(WORDS, rng.randint(0, 3))),
+            "kit_category": rng.choice(["Ambient", "ambient", "creature", ""]),
+        }
+        items.append((round(rng.random(), 2), row, {}))
+    return items
+
+
+def _reference_pick(suggester, items, k):
+    # The original O(k^2 * n) loop
+    items = list(items)
+    selected = []
+    while items and len(selected) < k:
+        best_idx, best_mmr = -1, -1e9
+        for idx, (score, r, _) in enumerate(items):
+            sim_max = max([suggester._item_sim(r, rr) for rr in selected] or [0.0])
+            mmr = 0.8 * score - 0.2 * sim_max
+            if mmr > best_mmr:
+                best_mmr, best_idx = mmr, idx
+        selected.append(items.pop(best_idx)[1])
+    return selected
+
+
+def test_mmr_matches_reference_selection(monkeypatch):
+    suggester = SoundSuggester(csv_path="/dev/null")
+    items = _items(120)
+    expected = _reference_pick(suggester, items, 40)
+
+    assert suggester._mmr_pick(list(items), 40) == expected
+    monkeypatch.setattr(ss, "NUMPY_AVAILABLE", False)
+    assert suggester._mmr_pick(list(items), 40) == expected
+
+
+def test_mmr_handles_duplicates_and_small_inputs():
+    suggester = SoundSuggester(csv_path="/dev/null")
+    items = _items(3)
+    doubled = items + [(0.99, items[0][1], {})]
+
+    picks = suggester._mmr_pick(doubled, 10)
+    assert len(picks) == 3
+    assert len({id(r) for r in picks}) == 3
+    assert suggester._mmr_pick([], 5) == []
+
+
+def test_library_rows_use_precomputed_terms(monkeypatch):
+    suggester = SoundSuggester(csv_path="/dev/null")
+    items = _items(120, seed=11)
+    suggester.rows = [r for _, r, _ in items]
+    expected = _reference_pick(suggester, items, 40)
+
+    def no_tokenizing(r):
+        raise AssertionError("library rows should not be re-tokenized")
+
+    monkeypatch.setattr(suggester, "_sim_features", no_tokenizing)
+    assert suggester._mmr_pick(list(items), 40) == expected
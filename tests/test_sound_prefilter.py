@@ -0,0 +1,58 @@
+"""
+Tests for the vectorized lexical prefilter in SoundSuggester.
+"""
+
+import random
+
+from src.leadership_button.sound_suggester import SoundSuggester
+
+WORDS = ["rain", "dragon", "castle", "wing", "soft", "storm", "bell", "gun", "piano"]
+
+
+def _rows(n, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        title = " ".join(rng.sample(WORDS, 2))
+        music = rng.random() < 0.4
+        rows.append(
+            {
+                "filename": f"{'mixkit-' if music else ''}{title.replace(' ', '-')}"
+                f"-{i}{rng.choice(['.mp3', '.ogg', '.wav'])}",
+                "source_directory": "mixkit" if music else "filmcow",
+                "kit_title": title.title(),
+                "kit_tags": ",".join(rng.sample(WORDS, 2)),
+                "kit_category": rng.choice(["ambient", "creature", ""]),
+                "duration": rng.choice([0.1, 1.5, 9.0, 30.0, 120.0, ""]),
+            }
+        )
+    return rows
+
+
+def test_vectorized_prefilter_matches_row_loop():
+    suggester = SoundSuggester(csv_path="/dev/null")
+    suggester.rows = _rows(400)
+    assert suggester._features is not None
+
+    for terms in (["rain", "castle"], ["dragon"], ["nothing"], []):
+        fast = suggester._prefilter(suggester.rows, terms)
+        slow = suggester._prefilter_rows(suggester.rows, terms)
+        assert [r["filename"] for r in fast] == [r["filename"] for r in slow]
+
+    picked = suggester._prefilter(suggester.rows, ["gun", "rain"])
+    assert picked and all("gun" not in r["filename"] for r in picked)
+    assert all(not r["filename"].endswith(".wav") for r in picked)
+
+
+def test_replacing_rows_rebuilds_features():
+    suggester = SoundSuggester(csv_path="/dev/null")
+    suggester.rows = _rows(50)
+    first = suggester._features
+
+    suggester.rows = _rows(10, seed=3)
+    assert suggester._features is not first
+    assert suggester._features.n_rows == 10
+
+    # A candidate list other than the full library uses the row loop
+    subset = suggester.rows[:3]
+    assert suggester._prefilter(subset, []) == suggester._prefilter_rows(subset, [])
@@ -0,0 +1,101 @@
+"""
+Tests for streaming speech recognition while the button is held.
+"""
+
+import logging
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from src.leadership_button.main_loop import ApplicationState, MainLoop
+from src.leadership_button.speech_stream import (
+    GoogleStreamingRecognizer,
+    StubStreamingRecognizer,
+)
+
+
+class _FakeStreamingClient:
+    """Consumes requests as they arrive and answers once the stream ends."""
+
+    def __init__(self):
+        self.received = []
+        self.first_chunk = threading.Event()
+
+    def streaming_recognize(self, config, requests, timeout=None):
+        for request in requests:
+            self.received.append(request.audio_content)
+            self.first_chunk.set()
+        alt = SimpleNamespace(transcript="how do I lead", confidence=0.9)
+        yield SimpleNamespace(
+            results=[SimpleNamespace(is_final=True, alternatives=[alt])]
+        )
+
+
+def test_stub_recognizer_collects_chunks():
+    stub = StubStreamingRecognizer(lambda audio: f"{len(audio)} bytes")
+    stub.feed(b"ab")
+    stub.feed(b"cd")
+
+    result = stub.finish()
+
+    assert result.text == "4 bytes"
+    assert stub.finished
+
+
+def test_google_recognizer_streams_chunks_before_finish():
+    client = _FakeStreamingClient()
+    recognizer = GoogleStreamingRecognizer(client, recognition_config=None)
+
+    recognizer.feed(b"\x00\x01" * 10)
+    assert client.first_chunk.wait(1.0)
+    recognizer.feed(b"\x02\x03" * 10)
+    result = recognizer.finish(timeout=1.0)
+
+    assert result.text == "how do I lead"
+    assert result.confidence == 0.9
+    assert len(client.received) == 2
+
+
+def _bare_main_loop(tmp_path, stub):
+    loop = MainLoop.__new__(MainLoop)
+    loop.logger = logging.getLogger("test")
+    loop.state_lock = threading.Lock()
+    loop.current_state = ApplicationState.IDLE
+    loop._commands_log_dir = tmp_path
+    loop._speech_stream = None
+    loop.spacebar_pressed_event = threading.Event()
+    loop.playback_interrupt_event = threading.Event()
+    loop.playback_manager = Mock()
+    loop.audio_handler = Mock()
+    loop.audio_handler.stop_recording.return_value = SimpleNamespace(
+        data=b"\x00" * 64, format="int16", sample_rate=16000, channels=1
+    )
+    loop.api_client = Mock()
+    loop.api_client.start_speech_stream.return_value = stub
+    loop.api_client.process_conversation_turn.return_value = None
+    return loop
+
+
+def test_main_loop_uses_streaming_transcript(tmp_path):
+    stub = StubStreamingRecognizer("be brave")
+    loop = _bare_main_loop(tmp_path, stub)
+
+    loop._handle_spacebar_press()
+    feed = loop.audio_handler.set_chunk_callback.call_args_list[0].args[0]
+    feed(b"\x01\x02")
+    loop._handle_spacebar_release()
+
+    assert stub.chunks == [b"\x01\x02"]
+    loop.api_client.process_conversation_turn.assert_called_once_with(
+        b"\x00" * 64, transcript="be brave"
+    )
+    loop.audio_handler.set_chunk_callback.assert_called_with(None)
+
+
+def test_main_loop_falls_back_to_batch_without_transcript(tmp_path):
+    loop = _bare_main_loop(tmp_path, StubStreamingRecognizer(""))
+
+    loop._handle_spacebar_press()
+    loop._handle_spacebar_release()
+
+    loop.api_client.process_conversation_turn.assert_called_once_with(b"\x00" * 64)
@@ -0,0 +1,125 @@
+"""
+Tests for the single-pass SSML transformation engine.
+"""
+
+import xml.etree.ElementTree as ET
+from unittest.mock import Mock
+
+import pytest
+
+from src.leadership_button.api_client import APIManager
+from src.leadership_button.ssml_engine import (
+    RULES,
+    SSMLEngine,
+    SSMLRule,
+    register_rule,
+)
+
+LLM_SSML = """<speak>
+  <p><s>Hello   there,</s> <s>friend &amp; co.</p></s>
+  <audio src='@rain'>Rain falls softly</audio>
+  <break time="5000ms"/><break time="1s"/>
+</speak>"""
+
+
+def _engine(resolve=lambda token: (None, None)):
+    return SSMLEngine(
+        [
+            "collapse_whitespace",
+            "audio_inner_text",
+            ("audio_src", {"resolve": resolve}),
+            ("cap_breaks", {"max_seconds": 2.0}),
+            "strip_sentences",
+        ]
+    )
+
+
+def test_all_rules_applied_in_one_pass():
+    result = _engine(lambda t: ("https://example.com/rain.ogg", "rain")).transform(
+        LLM_SSML
+    )
+
+    assert result.valid, result.errors
+    assert result.ssml == (
+        "<speak> <p>Hello there, friend &amp; co.</p> "
+        '<audio src="https://example.com/rain.ogg"></audio> Rain falls softly '
+        '<break time="2.0s"/><break time="1s"/> </speak>'
+    )
+    assert ET.fromstring(result.ssml).tag == "speak"
+
+
+@pytest.mark.parametrize(
+    "ssml",
+    [
+        "<speak>Tom & Jerry</speak>",
+        "<speak><p>unclosed</speak>",
+        "<speak>1 < 2</speak>",
+        "<speak>fish&nbsp;and chips &copy; 2024</speak>",
+        "<speak/><speak/>",
+        "<p>wrong root</p>",
+        "just text",
+    ],
+)
+def test_validation_matches_xml_parser(ssml):
+    result = SSMLEngine().transform(ssml)
+
+    assert not result.valid
+    with pytest.raises(ValueError):
+        result.raise_for_errors()
+
+
+def test_xml_and_character_references_are_valid():
+    result = SSMLEngine().transform(
+        "<speak>&lt;&amp;&gt; &quot;hi&quot; &apos; &#160; &#xA9;</speak>"
+    )
+    assert result.valid, result.errors
+
+
+def test_attribute_with_both_quotes_serializes_as_xml():
+    @register_rule("test_quotes")
+    class Quotes(SSMLRule):
+        def visit(self, token):
+            if token.is_tag("audio") and token.attrs.get("src") == "@rain":
+                token.attrs["src"] = 'it\'s "rain"'
+            return [token]
+
+    try:
+        result = SSMLEngine(["test_quotes"]).transform(
+            "<speak><audio src='@rain'/><audio src='say \"hi\" it&apos;s'/></speak>"
+        )
+        assert result.valid, result.errors
+        audio = ET.fromstring(result.ssml).findall("audio")
+        assert [a.get("src") for a in audio] == ['it\'s "rain"', 'say "hi" it\'s']
+    finally:
+        RULES.pop("test_quotes", None)
+
+
+def test_registered_plugin_runs_in_chain():
+    @register_rule("test_upper")
+    class Upper(SSMLRule):
+        def visit(self, token):
+            token.text = token.text.upper()
+            return [token]
+
+    try:
+        result = SSMLEngine(["strip_sentences", "test_upper"]).transform(
+            "<speak><s>quiet</s></speak>"
+        )
+        assert result.ssml == "<speak>QUIET</speak>"
+        with pytest.raises(KeyError):
+            SSMLEngine(["no_such_rule"])
+    finally:
+        RULES.pop("test_upper", None)
+
+
+def test_text_to_speech_ssml_rewrites_once_and_skips_revalidation():
+    manager = APIManager.__new__(APIManager)
+    manager.tts_client = Mock()
+    manager._resolve_sound_src = Mock(return_value=("https://x/rain.ogg", "rain"))
+
+    manager.text_to_speech_ssml('<speak><s>Hi.</s><audio src="rain"/></speak>')
+
+    manager._resolve_sound_src.assert_called_once_with("rain")
+    manager.tts_client.synthesize_ssml.assert_called_once_with(
+        '<speak>Hi.<audio src="https://x/rain.ogg"/></speak>', validated=True
+    )
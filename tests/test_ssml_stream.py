@@ -0,0 +1,123 @@
+"""
+Tests for incremental SSML assembly of streamed LLM output.
+"""
+
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+
+from src.leadership_button.api_client import AIProvider, APIManager
+from src.leadership_button.ssml_stream import SSMLStreamAssembler, clean_llm_response
+
+
+def _assemble(chunks, min_chars=1):
+    assembler = SSMLStreamAssembler(min_chars=min_chars)
+    out = []
+    for chunk in chunks:
+        out += assembler.feed(chunk)
+    out += assembler.finish()
+    return assembler, out
+
+
+RAW_SSML = (
+    'Sure! Here you go:\n```xml\n<speak><prosody rate="95%">'
+    "<p>Tom & Jerry’s “big” day began. They ran &amp; jumped!</p>"
+    '<audio src="rain"/>'
+    "<p>Then it rained—a lot.</p></prosody></speak>\n```\nHope that helps!"
+)
+
+
+def test_char_by_char_matches_batch_cleaning():
+    assembler, segments = _assemble(list(RAW_SSML))
+
+    assert assembler.mode == "ssml"
+    assert len(segments) >= 3
+    for seg in segments:
+        ET.fromstring(seg)
+
+    batch, is_ssml = clean_llm_response(RAW_SSML)
+    assert is_ssml
+    text = "".join(segments)
+    assert 'Tom &amp; Jerry\'s "big" day began.' in text
+    assert "ran &amp; jumped" in text
+    assert "rained-a lot." in text
+    assert "Hope that helps" not in text
+    assert "```" not in text
+    assert ET.fromstring(batch).tag == "speak"
+
+
+def test_segments_emitted_before_stream_finishes():
+    assembler = SSMLStreamAssembler(min_chars=1)
+    early = []
+    for chunk in ["<speak><p>First sentence here. ", "Second one", " follows."]:
+        early += assembler.feed(chunk)
+
+    assert early == ["<speak><p>First sentence here.</p></speak>"]
+    rest = assembler.finish()
+    assert rest == ["<speak><p>Second one follows.</p></speak>"]
+
+
+def test_split_entity_and_typo_across_chunks():
+    _, segments = _assemble(
+        [
+            '<speak><prosody rate="90%">Salt &',
+            "amp; pepper. Fish &",
+            " chips.</",
+            '"prosody></speak>',
+        ]
+    )
+
+    text = "".join(segments)
+    assert "Salt &amp; pepper." in text
+    assert "Fish &amp; chips." in text
+    for seg in segments:
+        ET.fromstring(seg)
+
+
+def test_plain_text_mode():
+    words = "This is a plain answer with no markup at all. " * 5
+    assembler, segments = _assemble([words[i : i + 7] for i in range(0, len(words), 7)])
+
+    assert assembler.mode == "text"
+    assert " ".join(segments) == clean_llm_response(words)[0]
+
+
+def test_short_response_falls_back_to_batch_rules():
+    assembler, segments = _assemble(["Hi ", "there!"])
+
+    assert assembler.mode == "text"
+    assert segments == ["Hi there!"]
+
+
+class _ChunkedProvider(AIProvider):
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def stream_text(self, text, context):
+        yield from self.chunks
+
+
+def test_api_manager_streams_generation_into_tts():
+    manager = APIManager.__new__(APIManager)
+    manager.config = SimpleNamespace(
+        performance={
+            "streaming_tts": True,
+            "streaming_generation": True,
+            "tts_segment_min_chars": 1,
+        }
+    )
+    manager.tts_client = object()
+    manager._tts_pipeline = None
+    manager.ai_provider = _ChunkedProvider(
+        ["<speak><p>One fish. ", "Two fish.</p>", "</speak>"]
+    )
+    manager._synthesize_segment = lambda segment: segment
+
+    try:
+        assert manager._streaming_generation_enabled()
+        stream = manager._generate_streaming("hello")
+        assert list(stream) == [
+            "<speak><p>One fish.</p></speak>",
+            "<speak><p>Two fish.</p></speak>",
+        ]
+    finally:
+        manager._tts_pipeline.shutdown()
@@ -0,0 +1,73 @@
+"""
+Tests for the content-addressed TTS cache and its TTSClient integration.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from src.leadership_button.api_client import APIState, TTSClient, VoiceConfig
+from src.leadership_button.tts_cache import TTSCache, make_cache_key
+
+
+def _key(text, rate=1.0):
+    return make_cache_key(
+        "text", text, "en-US-Neural2-H", "en-US", rate, 0.0, 8.0, 24000
+    )
+
+
+def test_key_ignores_whitespace_but_not_voice_params():
+    assert _key("Hello  there\n") == _key("Hello there")
+    assert _key("Hello there") != _key("Hello there", rate=1.25)
+
+
+def test_entries_survive_restart(tmp_path):
+    TTSCache(str(tmp_path)).put(_key("hi"), b"RIFF-hi")
+
+    cache = TTSCache(str(tmp_path))
+
+    assert cache.get(_key("hi")) == b"RIFF-hi"
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_disk_limit_evicts_least_recently_used(tmp_path):
+    cache = TTSCache(str(tmp_path), max_memory_bytes=10, max_disk_bytes=25)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"y" * 10)
+    assert cache.get("a") == b"x" * 10
+
+    cache.put("c", b"z" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"x" * 10
+    assert not (tmp_path / "b.wav").exists()
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["disk_bytes"] == 20
+    assert stats["memory_bytes"] <= 10
+
+
+def _tts_client(tmp_path):
+    client = TTSClient.__new__(TTSClient)
+    client.config = SimpleNamespace(
+        audio_settings={"output_sample_rate": 24000, "channels": 1}
+    )
+    client.client = Mock()
+    client.state = APIState.OFFLINE
+    client._inflight = 0
+    client._inflight_lock = threading.Lock()
+    client.cache = TTSCache(str(tmp_path))
+    return client
+
+
+def test_cache_hit_skips_network(tmp_path):
+    client = _tts_client(tmp_path)
+    voice = VoiceConfig(name="en-US-Neural2-H", language_code="en-US")
+    voice.speaking_rate, voice.pitch, voice.volume_gain_db = 1.0, 0.0, 8.0
+    client.cache.put(client._cache_key("text", "One moment.", voice), b"RIFF-cached")
+
+    audio = client.synthesize_text("One  moment.", voice)
+
+    assert audio.data == b"RIFF-cached"
+    assert audio.sample_rate == 24000
+    client.client.synthesize_speech.assert_not_called()
@@ -0,0 +1,107 @@
+"""
+Tests for the sentence-level TTS pipeline (segmentation and ordered streaming).
+"""
+
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+from src.leadership_button.tts_pipeline import (
+    SSMLSegmenter,
+    TTSPipeline,
+    split_ssml_segments,
+    split_text_segments,
+)
+
+
+def test_split_ssml_segments_produces_valid_documents():
+    ssml = (
+        '<speak><prosody rate="95%">'
+        "<p>Once upon a time a dragon lived in a castle. It was very friendly.</p>"
+        '<audio src="https://example.com/rain.mp3"/>'
+        "<p>One day it started to rain, and the dragon sang a song.</p>"
+        "</prosody></speak>"
+    )
+    segments = split_ssml_segments(ssml, min_chars=10)
+
+    assert len(segments) >= 3
+    for seg in segments:
+        root = ET.fromstring(seg)
+        assert root.tag == "speak"
+        assert root[0].tag == "prosody"
+    assert "rain.mp3" in "".join(segments)
+
+
+def test_split_ssml_keeps_audio_element_whole():
+    ssml = (
+        '<speak>Hello there friend. <audio src="a.mp3">A sound. Another.</audio>'
+        " Goodbye now friend.</speak>"
+    )
+    segments = split_ssml_segments(ssml, min_chars=1)
+
+    for seg in segments:
+        ET.fromstring(seg)
+    audio_segments = [s for s in segments if "<audio" in s]
+    assert len(audio_segments) == 1
+    assert "</audio>" in audio_segments[0]
+
+
+def test_segmenter_handles_partial_input():
+    segmenter = SSMLSegmenter(min_chars=1)
+    out = []
+    for chunk in ["<spe", "ak><p>First sent", "ence. Second", " one.</p", "></speak>"]:
+        out += segmenter.feed(chunk)
+    out += segmenter.flush()
+
+    assert out == [
+        "<speak><p>First sentence.</p></speak>",
+        "<speak><p>Second one.</p></speak>",
+    ]
+
+
+def test_split_text_segments_merges_short_sentences():
+    text = "Hi. I am Lyra. Today we will learn about leading a team together!"
+    segments = split_text_segments(text, min_chars=12)
+
+    assert segments[0] == "Hi. I am Lyra."
+    assert " ".join(segments) == text
+
+
+def test_stream_yields_segments_in_order_despite_completion_order():
+    delays = {"one": 0.15, "two": 0.0, "three": 0.05}
+
+    def synthesize(segment):
+        time.sleep(delays[segment])
+        return segment.upper()
+
+    pipeline = TTSPipeline(synthesize, max_workers=3)
+    try:
+        stream = pipeline.stream(["one", "two", "three"])
+        assert list(stream) == ["ONE", "TWO", "THREE"]
+    finally:
+        pipeline.shutdown()
+
+
+def test_stream_skips_failed_segments_and_supports_cancel():
+    release = threading.Event()
+
+    def synthesize(segment):
+        if segment == "bad":
+            raise RuntimeError("boom")
+        if segment == "slow":
+            release.wait(1.0)
+        return segment
+
+    pipeline = TTSPipeline(synthesize, max_workers=1)
+    try:
+        stream = pipeline.stream(["good", "bad", "also good"])
+        assert list(stream) == ["good", "also good"]
+
+        stream = pipeline.stream()
+        stream.submit("slow")
+        stream.submit("never")
+        stream.cancel()
+        release.set()
+        assert list(stream) == []
+    finally:
+        pipeline.shutdown()
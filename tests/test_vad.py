@@ -0,0 +1,196 @@
+"""
+Tests for voice activity detection: silence trimming and end-of-utterance.
+"""
+
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.leadership_button import audio_handler as ah
+from src.leadership_button.audio_devices import AudioDeviceManager
+from src.leadership_button.audio_handler import AudioConfig, AudioHandler
+from src.leadership_button.main_loop import ApplicationState, MainLoop
+from src.leadership_button.vad import VoiceActivityDetector
+
+RATE = 16000
+FAKE_PYAUDIO = SimpleNamespace(paContinue=0, paComplete=1, paAbort=2, paInt16=8)
+
+
+def _pcm(ms, amplitude):
+    """ms of a 440 Hz tone (amplitude 0 gives digital silence)."""
+    t = np.arange(RATE * ms // 1000) / RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.int16).tobytes()
+
+
+def _chunks(data, size=2048):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class FakeStream:
+    def __init__(self, callback):
+        self.callback = callback
+
+    def stop_stream(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    def __init__(self):
+        self.streams = []
+
+    def open(self, **kwargs):
+        stream = FakeStream(kwargs.get("stream_callback"))
+        self.streams.append(stream)
+        return stream
+
+
+@pytest.fixture
+def handler(monkeypatch, tmp_path):
+    monkeypatch.setenv("LB_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(ah, "pyaudio", FAKE_PYAUDIO, raising=False)
+    monkeypatch.setattr(ah, "PYAUDIO_AVAILABLE", True)
+    h = AudioHandler(AudioConfig())
+    h.config.stream_mode = "callback"
+    h.devices = AudioDeviceManager(FakePyAudio)
+    h.audio = h.devices.acquire()
+    return h
+
+
+def test_trims_leading_and_trailing_silence():
+    vad = VoiceActivityDetector(RATE, padding_ms=90)
+    speech = _pcm(600, 8000)
+    audio = _pcm(900, 20) + speech + _pcm(1200, 20)
+    for chunk in _chunks(audio):
+        assert not vad.feed(chunk)
+
+    trimmed = vad.trim(memoryview(audio))
+    assert isinstance(trimmed, memoryview)
+    # Speech plus roughly the padding on each side, frame aligned
+    assert len(speech) <= len(trimmed) <= len(speech) + 2 * (90 + 30) * 32
+    assert speech[960:-960] in bytes(trimmed)
+
+
+def test_silence_only_is_left_alone_and_clicks_do_not_count():
+    vad = VoiceActivityDetector(RATE)
+    audio = _pcm(500, 0) + _pcm(30, 8000) + _pcm(500, 0)
+    for chunk in _chunks(audio):
+        vad.feed(chunk)
+    assert not vad.speech_detected
+    assert vad.trim(audio) is audio
+
+
+def test_noise_floor_raises_the_threshold():
+    vad = VoiceActivityDetector(RATE)
+    for chunk in _chunks(_pcm(600, 400) + _pcm(300, 700)):
+        vad.feed(chunk)
+    # The tone clears the fixed threshold but is within 3x the hum's level
+    assert 250 < vad.noise_floor < 500
+    assert not vad.speech_detected
+    for chunk in _chunks(_pcm(300, 4000)):
+        vad.feed(chunk)
+    assert vad.speech_detected
+
+
+def test_end_of_utterance_after_silence_window():
+    vad = VoiceActivityDetector(RATE, end_silence_ms=300)
+    for chunk in _chunks(_pcm(500, 0) + _pcm(400, 8000) + _pcm(200, 0)):
+        assert not vad.feed(chunk)
+    assert vad.feed(_pcm(150, 0))
+    assert vad.trailing_silence_ms >= 300
+
+
+def test_disabled_and_unavailable_webrtc(monkeypatch):
+    assert VoiceActivityDetector.from_settings(RATE, 1, {"enabled": False}) is None
+    from src.leadership_button import vad as vad_module
+
+    monkeypatch.setattr(vad_module, "WEBRTCVAD_AVAILABLE", False)
+    detector = VoiceActivityDetector.from_settings(RATE, 1, {"engine": "webrtc"})
+    assert detector.engine == "energy"
+
+    config = AudioConfig()
+    config.vad = {**config.vad, "engine": "neural"}
+    with pytest.raises(ValueError):
+        config.validate()
+
+
+def test_handler_trims_upload_and_ends_utterance(handler):
+    handler.config.vad = {**handler.config.vad, "end_silence_ms": 300}
+    ended = []
+    handler.set_utterance_end_callback(lambda: ended.append(True))
+    assert handler.start_recording()
+    feed = handler.audio.streams[0].callback
+
+    fed = 0
+    for chunk in _chunks(_pcm(1000, 0) + _pcm(500, 8000) + _pcm(1000, 0)):
+        status = feed(chunk, len(chunk) // 2, None, 0)[1]
+        if status == FAKE_PYAUDIO.paComplete:
+            break
+        fed += len(chunk)
+        # The VAD runs on the capture worker; let it catch up
+        deadline = time.monotonic() + 2.0
+        while handler._processed_bytes < fed and time.monotonic() < deadline:
+            time.sleep(0.001)
+    assert ended == [True]
+    # Ended about 300ms into the trailing second of silence
+    assert fed < (1500 + 500) * 32
+
+    audio = handler.stop_recording()
+    # 1s of leading silence and most of the trailing second are gone
+    assert audio.duration < 1.2
+    assert isinstance(audio.data, memoryview)
+
+
+def test_reply_plays_when_utterance_ends_with_button_held(tmp_path, monkeypatch):
+    monkeypatch.setenv("LB_LOG_DIR", str(tmp_path))
+    loop = MainLoop.__new__(MainLoop)
+    loop.logger = Mock()
+    loop.state_lock = threading.Lock()
+    loop.current_state = ApplicationState.IDLE
+    loop._commands_log_dir = tmp_path
+    loop._keyboard_backend = "evdev"
+    loop._speech_stream = None
+    loop._recording_started_at = None
+    loop._turn_started_at = None
+    loop.response_times = deque()
+    loop.spacebar_pressed_event = threading.Event()
+    loop.playback_interrupt_event = threading.Event()
+    loop._recording_stop_lock = threading.Lock()
+    loop.audio_handler = Mock()
+    loop.audio_handler.stop_recording.return_value = SimpleNamespace(
+        data=b"\x00" * 64, format="int16", sample_rate=16000, channels=1
+    )
+    loop.api_client = Mock()
+    loop.api_client.start_speech_stream.return_value = None
+    loop.api_client.process_conversation_turn.return_value = b"reply"
+    interrupted = []
+    loop.playback_manager = SimpleNamespace(
+        stop_playback=lambda: None,
+        play_audio_and_wait=lambda *a, stop_event: interrupted.append(
+            stop_event.is_set()
+        ),
+        first_audio_at=None,
+    )
+
+    loop.on_press("EVDEV_SPACE_ENTER")
+    assert loop.current_state == ApplicationState.RECORDING
+    loop._on_utterance_end()
+    for thread in threading.enumerate():
+        if thread.name == "lb-utterance-end":
+            thread.join(timeout=5)
+
+    # The button is still held, but the reply was played in full
+    assert loop.spacebar_pressed_event.is_set()
+    assert interrupted == [False]
+    assert loop.current_state == ApplicationState.IDLE
+
+    loop.on_release("EVDEV_SPACE_ENTER")
+    assert not loop.spacebar_pressed_event.is_set()
+    loop.audio_handler.stop_recording.assert_called_once()